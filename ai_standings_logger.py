@@ -2,7 +2,8 @@
 
 This script periodically records standings information from iRacing to a
 CSV file.  The output path and polling interval can be configured via
-command line arguments.
+command line arguments.  :class:`StandingsLogger` can also be fed from the
+shared acquisition loop in :mod:`telemetry_hub`.
 """
 
 from datetime import datetime
@@ -24,15 +25,18 @@ if getattr(sys, "frozen", False):
 
 import argparse
 import csv
+import io
 import time
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional
 import shutil
 from codebase_cleaner import check_latest_version
 
 import eec_db
+import telemetry_hub
 
 import irsdk
+import numpy as np
 
 HEADER = [
     "Time",
@@ -54,6 +58,28 @@ header = HEADER
 
 DEFAULT_CSV_PATH = "standings_log.csv"
 DEFAULT_INTERVAL = 5
+# iRacing updates telemetry at 60 Hz; sampling faster only repeats data
+MIN_INTERVAL = 1 / 60
+# seconds between "Logged N cars" progress lines
+REPORT_INTERVAL = 5.0
+
+
+def interval_arg(value: str) -> float:
+    """``argparse`` type for a polling interval of at least :data:`MIN_INTERVAL`."""
+    try:
+        interval = float(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid interval: {value!r}")
+    if not interval >= MIN_INTERVAL - 1e-4:
+        raise argparse.ArgumentTypeError(
+            f"interval must be at least 1/60 s ({MIN_INTERVAL:.4f}), got {value}"
+        )
+    return interval
+
+
+def time_spec(interval: float) -> str:
+    """Return the ``isoformat`` precision for rows logged every ``interval`` s."""
+    return "seconds" if interval >= 1 else "milliseconds"
 
 
 def rollover_log(path: str) -> None:
@@ -70,101 +96,262 @@ def rollover_log(path: str) -> None:
         csv.writer(f).writerow(HEADER)
 
 
-def log_standings(csv_path: str, interval: int, db_path: Optional[str] = None) -> None:
-    """Main logging loop."""
+class CsvAppender:
+    """Keep a CSV file open and append rows with a configurable flush policy.
+
+    Rows are formatted into an in-memory buffer and written to the file when
+    :meth:`maybe_flush` finds that ``flush_interval`` seconds have passed
+    since the last write or at least ``max_bytes`` are pending.  The default
+    ``flush_interval`` of ``0`` writes once per tick so readers such as the
+    standings sorter see every tick immediately.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        *,
+        flush_interval: float = 0.0,
+        max_bytes: int = 1 << 20,
+    ) -> None:
+        self.path = path
+        self.flush_interval = flush_interval
+        self.max_bytes = max_bytes
+        self._buf = io.StringIO()
+        self._writer = csv.writer(self._buf)
+        self._fh = None
+        self._last_flush = time.monotonic()
+
+    def open(self, truncate: bool = False) -> None:
+        """Open the file, writing :data:`HEADER` if it is new or ``truncate`` is set."""
+        self._fh = open(self.path, "w" if truncate else "a", newline="", encoding="utf-8")
+        if self._fh.tell() == 0:
+            self._fh.write(self._format(HEADER))
+            self._fh.flush()
+
+    @staticmethod
+    def _format(row) -> str:
+        buf = io.StringIO()
+        csv.writer(buf).writerow(row)
+        return buf.getvalue()
+
+    def writerows(self, rows) -> None:
+        self._writer.writerows(rows)
+
+    def maybe_flush(self) -> None:
+        if (
+            self._buf.tell() >= self.max_bytes
+            or time.monotonic() - self._last_flush >= self.flush_interval
+        ):
+            self.flush()
+
+    def flush(self) -> None:
+        """Write the pending rows to the file."""
+        self._last_flush = time.monotonic()
+        if not self._buf.tell() or self._fh is None:
+            return
+        self._fh.write(self._buf.getvalue())
+        self._fh.flush()
+        self._buf.seek(0)
+        self._buf.truncate()
+
+    def close(self) -> None:
+        """Flush pending rows and close the file; :meth:`open` may reopen it."""
+        self.flush()
+        if self._fh is not None:
+            self._fh.close()
+            self._fh = None
+
+
+def _column(arr: np.ndarray, cars: np.ndarray, default: Any = "") -> list:
+    """Return ``arr[car]`` for each car index, ``default`` where it is missing.
+
+    ``cars`` holds ``-1`` for drivers without a ``CarIdx``.
+    """
+    valid = (cars >= 0) & (cars < len(arr))
+    if not valid.any():
+        return [default] * len(cars)
+    vals = arr[np.where(valid, cars, 0)].tolist()
+    if not valid.all():
+        for i in np.flatnonzero(~valid):
+            vals[i] = default
+    return vals
+
+
+class StandingsLogger:
+    """Telemetry consumer writing one standings row per car and snapshot.
+
+    With ``changes_only`` a car's row is only written when its driver,
+    position, lap, pit state or lap times differ from its previous row.
+    """
+
+    def __init__(
+        self,
+        csv_path: str,
+        db_path: Optional[str] = None,
+        binary_path: Optional[str] = None,
+        flush_interval: float = 0.0,
+        changes_only: bool = False,
+        timespec: str = "seconds",
+    ) -> None:
+        self.csv_path = csv_path
+        self.changes_only = changes_only
+        self.timespec = timespec
+        self.last_state: dict[Any, tuple] = {}
+        # progress output: last report time, car count and rows since then
+        self.reported_at: Optional[datetime] = None
+        self.reported_cars = -1
+        self.unreported_rows = 0
+        self.db = eec_db.BufferedWriter(eec_db.init_db(db_path)) if db_path else None
+        self.store = None
+        if binary_path:
+            import standings_store
+
+            # start fresh together with the CSV opened below
+            self.store = standings_store.StandingsWriter(binary_path, truncate=True)
+        # per CarIdx slot: pit road state of the previous tick and pit entries
+        self.last_pit_state = np.zeros(0, dtype=bool)
+        self.pit_count = np.zeros(0, dtype=np.int64)
+        self.prev_session = None
+
+        self.out = CsvAppender(csv_path, flush_interval=flush_interval)
+        self.out.open(truncate=True)
+
+    def feed(self, snap: Any) -> None:
+        """Append the standings contained in ``snap`` to the log."""
+        ts = snap.wall_time.isoformat(timespec=self.timespec)
+        session_num = snap["SessionNum"]
+        if self.prev_session is None:
+            self.prev_session = session_num
+        elif session_num != self.prev_session:
+            # the file has to be closed before it can be moved on Windows
+            self.out.close()
+            rollover_log(self.csv_path)
+            self.out.open()
+            if self.store:
+                self.store.rollover()
+            self.last_pit_state = np.zeros(0, dtype=bool)
+            self.pit_count = np.zeros(0, dtype=np.int64)
+            self.last_state.clear()
+            self.prev_session = session_num
+
+        # count pit entries for all car slots at once
+        on_pit = snap.array("CarIdxOnPitRoad", bool)
+        n = len(on_pit)
+        if len(self.pit_count) != n:
+            m = min(n, len(self.pit_count))
+            count, state = np.zeros(n, dtype=np.int64), np.zeros(n, dtype=bool)
+            count[:m], state[:m] = self.pit_count[:m], self.last_pit_state[:m]
+            self.pit_count, self.last_pit_state = count, state
+        self.pit_count += on_pit & ~self.last_pit_state
+        self.last_pit_state = on_pit
+
+        drvs = snap["DriverInfo"]["Drivers"]
+        idxs = [d.get("CarIdx") for d in drvs]
+        cars = np.array([-1 if i is None else int(i) for i in idxs], dtype=np.int64)
+        pos, cpos, laps, best, last, pit = (
+            _column(snap.array(key), cars)
+            for key in (
+                "CarIdxPosition",
+                "CarIdxClassPosition",
+                "CarIdxLap",
+                "CarIdxBestLapTime",
+                "CarIdxLastLapTime",
+                "CarIdxOnPitRoad",
+            )
+        )
+        teams = [d.get("TeamName", "") for d in drvs]
+        users = [d.get("UserName", "") for d in drvs]
+        classes = [d.get("CarClassID", "") for d in drvs]
+
+        pits = _column(self.pit_count, cars, 0)
+
+        cols = (idxs, teams, users, classes, pos, cpos, laps, best, last, pit, pits)
+        rows = list(zip(*cols))
+        if self.changes_only:
+            last_state = self.last_state
+            changed = []
+            for row in rows:
+                # driver, position, class position, lap, best, last, pit
+                state = (row[2], *row[4:10])
+                if last_state.get(row[0]) != state:
+                    last_state[row[0]] = state
+                    changed.append(row)
+            rows = changed
+
+        if rows:
+            self.out.writerows([ts, *row] for row in rows)
+        self.out.maybe_flush()
+        if self.db:
+            self.db.add_many(
+                "standings",
+                [(ts, *row[:9], int(bool(row[9])), row[10]) for row in rows],
+            )
+            self.db.maybe_flush()
+        if self.store and rows:
+            self.store.append(snap.wall_time, rows)
+        self.report(snap.wall_time, ts, len(rows), len(drvs))
+
+    def report(self, now: datetime, ts: str, rows: int, cars: int) -> None:
+        """Print progress every :data:`REPORT_INTERVAL` seconds or when the field changes."""
+        self.unreported_rows += rows
+        last = self.reported_at
+        if (
+            last is not None
+            and cars == self.reported_cars
+            and 0 <= (now - last).total_seconds() < REPORT_INTERVAL
+        ):
+            return
+        if self.changes_only:
+            print(f"[{ts}] Logged {self.unreported_rows} changed rows, {cars} cars.")
+        else:
+            print(f"[{ts}] Logged {cars} cars.")
+        self.reported_at = now
+        self.reported_cars = cars
+        self.unreported_rows = 0
+
+    def close(self) -> None:
+        self.out.close()
+        if self.db:
+            self.db.close()
+            self.db = None
+        if self.store:
+            self.store.close()
+            self.store = None
+
+
+def log_standings(
+    csv_path: str,
+    interval: float,
+    db_path: Optional[str] = None,
+    binary_path: Optional[str] = None,
+    flush_interval: float = 0.0,
+    changes_only: bool = False,
+) -> None:
+    """Main logging loop when running without :mod:`telemetry_hub`."""
     ir = irsdk.IRSDK()
     ir.startup()
 
-    conn = eec_db.init_db(db_path) if db_path else None
-
     print("Waiting for iRacing session…")
     while not (ir.is_initialized and ir.is_connected):
         print("Not connected… waiting.")
         time.sleep(2)
     print("Connected to iRacing!")
 
-    with open(csv_path, "w", newline="", encoding="utf-8") as f:
-        csv.writer(f).writerow(HEADER)
-
-    pit_count: dict[int, int] = {}
-    last_pit_state: dict[int, bool] = {}
-    prev_session = ir["SessionNum"]
-
+    logger = StandingsLogger(
+        csv_path,
+        db_path,
+        binary_path,
+        flush_interval,
+        changes_only=changes_only,
+        timespec=time_spec(interval),
+    )
+    next_tick = time.monotonic()
     try:
         while True:
-            ts = datetime.now().isoformat(timespec="seconds")
-            session_num = ir["SessionNum"]
-            if session_num != prev_session:
-                rollover_log(csv_path)
-                pit_count.clear()
-                last_pit_state.clear()
-                prev_session = session_num
-
-            laps = ir["CarIdxLap"]
-            pos = ir["CarIdxPosition"]
-            cpos = ir["CarIdxClassPosition"]
-            best = ir["CarIdxBestLapTime"]
-            last = ir["CarIdxLastLapTime"]
-            pit = ir["CarIdxOnPitRoad"]
-            drvs = ir["DriverInfo"]["Drivers"]
-
-            with open(csv_path, "a", newline="", encoding="utf-8") as f:
-                wr = csv.writer(f)
-                for d in drvs:
-                    idx = d.get("CarIdx")
-                    team_name = d.get("TeamName", "")
-                    user_name = d.get("UserName", "")
-                    cls_id = d.get("CarClassID", "")
-
-                    def safe(arr):
-                        return (
-                            arr[int(idx)]
-                            if arr is not None and idx is not None and int(idx) < len(arr)
-                            else ""
-                        )
-
-                    in_pit = safe(pit)
-                    prev = last_pit_state.get(idx, False)
-                    pit_count[idx] = pit_count.get(idx, 0) + (1 if (not prev and in_pit) else 0)
-                    last_pit_state[idx] = in_pit
-
-                    wr.writerow(
-                        [
-                            ts,
-                            idx,
-                            team_name,
-                            user_name,
-                            cls_id,
-                            safe(pos),
-                            safe(cpos),
-                            safe(laps),
-                            safe(best),
-                            safe(last),
-                            in_pit,
-                            pit_count[idx],
-                        ]
-                    )
-                    if conn:
-                        eec_db.insert(
-                            conn,
-                            "standings",
-                            [
-                                ts,
-                                idx,
-                                team_name,
-                                user_name,
-                                cls_id,
-                                safe(pos),
-                                safe(cpos),
-                                safe(laps),
-                                safe(best),
-                                safe(last),
-                                int(bool(in_pit)),
-                                pit_count[idx],
-                            ],
-                        )
-            print(f"[{ts}] Logged {len(drvs)} cars.")
-            time.sleep(interval)
+            logger.feed(telemetry_hub.capture(ir))
+            # schedule from the previous tick so capture time does not add drift
+            next_tick = max(next_tick + interval, time.monotonic() - interval)
+            time.sleep(max(0.0, next_tick - time.monotonic()))
     except KeyboardInterrupt:
         print("Stopped by user.")
     except Exception as e:  # pragma: no cover - unexpected runtime errors
@@ -174,8 +361,7 @@ def log_standings(csv_path: str, interval: int, db_path: Optional[str] = None) -
             ir.shutdown()
         except Exception:
             pass
-        if conn:
-            conn.close()
+        logger.close()
 
 
 def parse_args() -> argparse.Namespace:
@@ -187,14 +373,30 @@ def parse_args() -> argparse.Namespace:
     )
     parser.add_argument(
         "--interval",
-        type=int,
+        type=interval_arg,
         default=DEFAULT_INTERVAL,
-        help="Polling interval in seconds (default: %(default)s)",
+        help="Polling interval in seconds, down to 1/60 (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--changes-only",
+        action="store_true",
+        help="only log a car when its position, lap, pit state or lap times change",
     )
     parser.add_argument(
         "--db",
         help="SQLite database path",
     )
+    parser.add_argument(
+        "--binary",
+        metavar="PATH",
+        help="also write a compact binary standings store (see standings_store)",
+    )
+    parser.add_argument(
+        "--flush-interval",
+        type=float,
+        default=0.0,
+        help="seconds between CSV writes, 0 = every tick (default: %(default)s)",
+    )
     parser.add_argument(
         "--version",
         action="version",
@@ -206,7 +408,14 @@ def parse_args() -> argparse.Namespace:
 
 def main() -> None:
     args = parse_args()
-    log_standings(args.output, args.interval, args.db)
+    log_standings(
+        args.output,
+        args.interval,
+        args.db,
+        args.binary,
+        args.flush_interval,
+        changes_only=args.changes_only,
+    )
 
 
 if __name__ == "__main__":
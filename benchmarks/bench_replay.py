@@ -0,0 +1,149 @@
+"""Benchmark the logging pipeline by replaying recorded telemetry.
+
+Replays a recording made with ``telemetry_hub.py --record`` (or a synthetic
+race of ``--hours`` hours when no recording is given) through the standings,
+pit-stop and lap-delta loggers as fast as possible, then runs the standings
+sorter and the GUI's data path (CSV cache and stint tracker model) over the
+resulting logs.  Tk widgets are not created.  All output goes to a temporary
+directory.
+
+The loggers import ``irsdk``; ``pip install pyirsdk`` works on Linux even
+though no sim is running.
+
+Run with ``python benchmarks/bench_replay.py [--recording race.jsonl.gz]``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import os
+import sys
+import tempfile
+import time
+import types
+from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+import standings_sorter
+import telemetry_replay
+
+
+def synthesize(path: Path, hours: float, cars: int, tick: float) -> int:
+    """Write a synthetic race recording to ``path`` and return the frame count."""
+    start = datetime(2025, 6, 7, 12, 0, 0)
+    lap_times = [95.0 + (car % 7) + car * 0.01 for car in range(cars)]
+    drivers = [
+        {
+            "CarIdx": car,
+            "TeamName": f"Team {car}",
+            "UserName": f"Driver {car}",
+            "CarClassID": 2708 if car % 2 else 4074,
+            "CarClassShortName": "GT3" if car % 2 else "GT4",
+        }
+        for car in range(cars)
+    ]
+    rec = telemetry_replay.TelemetryRecorder(path)
+    frames = int(hours * 3600 / tick)
+    best = [-1.0] * cars
+    for i in range(frames):
+        t = i * tick
+        dist = [t / lt for lt in lap_times]
+        laps = [int(d) for d in dist]
+        # a 60 s stop every 40 laps
+        on_pit = [d % 40 > 40 - 60 / lt for d, lt in zip(dist, lap_times)]
+        order = sorted(range(cars), key=lambda c: -dist[c])
+        pos = [0] * cars
+        for p, car in enumerate(order, 1):
+            pos[car] = p
+        for car in range(cars):
+            if laps[car] > 0:
+                best[car] = lap_times[car]
+        rec.feed(
+            types.SimpleNamespace(
+                wall_time=start + timedelta(seconds=t),
+                values={
+                    "SessionTime": t,
+                    "SessionNum": 0,
+                    "CarIdxLap": laps,
+                    "CarIdxLapDistPct": [d % 1 for d in dist],
+                    "CarIdxPosition": pos,
+                    "CarIdxClassPosition": [(p + 1) // 2 for p in pos],
+                    "CarIdxBestLapTime": best[:],
+                    "CarIdxLastLapTime": [lt if n else -1.0 for lt, n in zip(lap_times, laps)],
+                    "CarIdxOnPitRoad": on_pit,
+                },
+                drivers=drivers,
+            )
+        )
+    rec.close()
+    return frames
+
+
+def timed(label: str, func) -> float:
+    t0 = time.perf_counter()
+    func()
+    dt = time.perf_counter() - t0
+    print(f"{label:<22} {dt * 1000:10.1f} ms", flush=True)
+    return dt
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--recording", help="recording to replay (default: synthetic race)")
+    parser.add_argument("--hours", type=float, default=1.0, help="length of the synthetic race")
+    parser.add_argument("--cars", type=int, default=60, help="cars in the synthetic race")
+    parser.add_argument("--tick", type=float, default=0.5, help="synthetic recording interval")
+    args = parser.parse_args(argv)
+
+    import telemetry_hub
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        recording = Path(args.recording) if args.recording else tmp / "race.jsonl.gz"
+        if not args.recording:
+            t0 = time.perf_counter()
+            frames = synthesize(recording, args.hours, args.cars, args.tick)
+            size_mb = recording.stat().st_size / 1e6
+            print(f"synthesized {frames} frames ({size_mb:.1f} MB) in {time.perf_counter() - t0:.1f}s")
+
+        hub_args = telemetry_hub.parse_args([
+            "--replay", str(recording),
+            "--replay-speed", "0",
+            "--db", str(tmp / "eec.db"),
+            "--standings-output", str(tmp / "standings_log.csv"),
+            "--pit-output", str(tmp / "pitstop_log.csv"),
+            "--driver-total", str(tmp / "driver_times.csv"),
+            "--pit-overlay", str(tmp / "overlay.html"),
+            "--lap-delta-output", str(tmp / "lap_delta_log.csv"),
+            "--intervals-output", str(tmp / "intervals.csv"),
+            "--swap-output", str(tmp / "driver_swaps.csv"),
+        ])
+        hub = telemetry_hub.build_hub(hub_args)
+
+        def replay() -> None:
+            with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+                hub.run()
+
+        timed("replay loggers", replay)
+
+        tail = standings_sorter.StandingsTail(str(tmp / "standings_log.csv"))
+        timed("sorter tail load", tail.update)
+        timed("sorter cycle", lambda: tail.sort_and_write(str(tmp / "sorted_standings.csv")))
+
+        import race_gui
+
+        # the GUI finds its logs relative to the working directory
+        cwd = os.getcwd()
+        os.chdir(tmp)
+        try:
+            model = race_gui.StintModel()
+            timed("gui stint first load", lambda: (model.update(), model.rows()))
+            timed("gui stint refresh", lambda: (model.update(), model.rows()))
+        finally:
+            os.chdir(cwd)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+"""Benchmark standings_sorter against a large synthetic standings log.
+
+Generates a ``standings_log.csv`` with ``--rows`` rows (60 cars per tick by
+default) in a temporary directory and reports the time of one sorter cycle:
+
+* ``legacy``  – the old per-car ``apply`` average (O(cars × rows))
+* ``full``    – :func:`standings_sorter.sort_and_write` with the grouped mean
+* ``tail``    – :class:`standings_sorter.StandingsTail` initial load and a
+  cycle after one more tick has been appended
+
+Run with ``python benchmarks/bench_standings_sorter.py [--rows N]``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+import standings_sorter
+
+import pandas as pd
+
+# same columns as ai_standings_logger.HEADER (not imported to avoid irsdk)
+HEADER = [
+    "Time", "CarIdx", "TeamName", "UserName", "CarClassID", "Position",
+    "ClassPosition", "Lap", "BestLapTime", "LastLapTime", "OnPitRoad", "PitCount",
+]
+
+
+def write_log(path: Path, rows: int, cars: int, start_tick: int = 0) -> int:
+    """Append ``rows`` synthetic rows to ``path`` and return the next tick."""
+    start = datetime(2025, 6, 7, 12, 0, 0)
+    new = not path.exists()
+    tick = start_tick
+    with open(path, "a", newline="", encoding="utf-8") as f:
+        wr = csv.writer(f)
+        if new:
+            wr.writerow(HEADER)
+        written = 0
+        while written < rows:
+            ts = (start + timedelta(seconds=5 * tick)).isoformat(timespec="seconds")
+            lap = tick // 18
+            for car in range(cars):
+                last = 95.0 + (car % 7) + (tick % 5) * 0.137
+                wr.writerow([
+                    ts, car, f"Team {car}", f"Driver {car}",
+                    "2708" if car % 2 else "4074",
+                    car + 1, car // 2 + 1, lap, 94.5, round(last, 3),
+                    tick % 180 == car, tick // 540,
+                ])
+            written += cars
+            tick += 1
+    return tick
+
+
+def legacy_cycle(inp: str, out: str) -> None:
+    df = standings_sorter._prepare(pd.read_csv(inp))
+    idx = df.groupby("CarIdx")["Time"].idxmax()
+    latest = df.loc[idx].copy()
+
+    def avg(car):
+        v = df[(df.CarIdx == car) & (df.Lap > 0) & (df.LastLapTime > 0)]["LastLapTime"]
+        return round(v.mean(), 3) if not v.empty else ""
+
+    latest["Avg Lap"] = latest["CarIdx"].apply(avg)
+    standings_sorter._write_sorted(latest, out)
+
+
+def timed(label: str, func) -> float:
+    t0 = time.perf_counter()
+    func()
+    dt = time.perf_counter() - t0
+    print(f"{label:<22} {dt * 1000:10.1f} ms", flush=True)
+    return dt
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1_000_000, help="rows to generate")
+    parser.add_argument("--cars", type=int, default=60, help="cars per tick")
+    parser.add_argument("--skip-legacy", action="store_true", help="skip the slow legacy run")
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        inp = Path(tmp) / "standings_log.csv"
+        out = str(Path(tmp) / "sorted_standings.csv")
+        t0 = time.perf_counter()
+        tick = write_log(inp, args.rows, args.cars)
+        size_mb = inp.stat().st_size / 1e6
+        print(f"generated {args.rows} rows ({size_mb:.1f} MB) in {time.perf_counter() - t0:.1f}s")
+
+        standings_sorter.INPUT = str(inp)
+        standings_sorter.OUTPUT = out
+        if not args.skip_legacy:
+            timed("legacy per-car apply", lambda: legacy_cycle(str(inp), out))
+        timed("full grouped mean", standings_sorter.sort_and_write)
+
+        tail = standings_sorter.StandingsTail(str(inp))
+        timed("tail initial load", tail.update)
+        write_log(inp, args.cars, args.cars, tick)
+        timed("tail cycle (+1 tick)", lambda: (tail.update(), tail.sort_and_write(out)))
+
+
+if __name__ == "__main__":
+    main()
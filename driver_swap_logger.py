@@ -0,0 +1,69 @@
+"""Detect driver swaps from ``DriverInfo`` as telemetry arrives.
+
+:class:`DriverSwapLogger` is a :class:`telemetry_hub.TelemetryHub` consumer
+that remembers the driver of every car and records a swap as soon as a
+snapshot reports a different ``UserName`` for the same ``CarIdx``.  Swaps
+are appended to ``driver_swaps.csv`` and, when a database is given, to the
+``driver_swaps`` table of :mod:`eec_db`.
+"""
+
+from __future__ import annotations
+
+import csv
+from pathlib import Path
+from typing import Optional
+
+import eec_db
+
+CSV_PATH = "driver_swaps.csv"
+HEADER = ["Timestamp", "CarIdx", "Team", "DriverOut", "DriverIn", "Lap"]
+DEFAULT_INTERVAL = 1.0
+
+
+class DriverSwapLogger:
+    """Write a row to the CSV and database for every driver change."""
+
+    def __init__(self, csv_path: str = CSV_PATH, db_path: Optional[str] = None) -> None:
+        self.csv_path = Path(csv_path)
+        if not self.csv_path.exists() or self.csv_path.stat().st_size == 0:
+            with self.csv_path.open("w", newline="", encoding="utf-8") as f:
+                csv.writer(f).writerow(HEADER)
+        self.db = eec_db.BufferedWriter(eec_db.init_db(db_path)) if db_path else None
+        self.current: dict[int, str] = {}
+
+    def feed(self, snap) -> None:
+        swaps = []
+        laps = None
+        for d in snap.drivers:
+            car = d.get("CarIdx")
+            driver = d.get("UserName") or ""
+            if car is None or not driver or d.get("CarIsPaceCar"):
+                continue
+            prev = self.current.get(car)
+            self.current[car] = driver
+            if prev is None or prev == driver:
+                continue
+            if laps is None:
+                laps = snap.array("CarIdxLap")
+            lap = int(laps[car]) if 0 <= car < len(laps) else ""
+            swaps.append([
+                snap.wall_time.isoformat(timespec="seconds"),
+                car,
+                d.get("TeamName", ""),
+                prev,
+                driver,
+                lap,
+            ])
+        if not swaps:
+            return
+        with self.csv_path.open("a", newline="", encoding="utf-8") as f:
+            csv.writer(f).writerows(swaps)
+        if self.db:
+            self.db.add_many("driver_swaps", [[None if v == "" else v for v in row] for row in swaps])
+            self.db.flush()
+        for ts, car, team, prev, driver, lap in swaps:
+            print(f"[{ts}] Driver swap – {team} car {car}: {prev} → {driver} (lap {lap})", flush=True)
+
+    def close(self) -> None:
+        if self.db:
+            self.db.close()
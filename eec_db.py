@@ -1,13 +1,27 @@
+from __future__ import annotations
+
+import atexit
+import logging
 import sqlite3
+import time
 from pathlib import Path
 from typing import Iterable, Any
 
-__all__ = ["init_db", "insert", "connect"]
+__all__ = ["init_db", "insert", "connect", "upsert_driver_totals", "BufferedWriter"]
+
+log = logging.getLogger(__name__)
 
 
 def connect(path: str | Path) -> sqlite3.Connection:
-    """Return a connection to the SQLite database."""
-    return sqlite3.connect(str(path))
+    """Return a connection to the SQLite database.
+
+    The database uses a write-ahead log with ``synchronous=NORMAL`` so each
+    commit does not wait for a full fsync of the database file.
+    """
+    conn = sqlite3.connect(str(path))
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    return conn
 
 
 def init_db(path: str | Path) -> sqlite3.Connection:
@@ -74,6 +88,18 @@ def init_db(path: str | Path) -> sqlite3.Connection:
         )
         """
     )
+    # older databases may hold duplicates from before the unique index
+    cur.execute(
+        """
+        DELETE FROM driver_totals WHERE rowid NOT IN (
+            SELECT MAX(rowid) FROM driver_totals GROUP BY team, driver
+        )
+        """
+    )
+    cur.execute(
+        "CREATE UNIQUE INDEX IF NOT EXISTS driver_totals_team_driver "
+        "ON driver_totals (team, driver)"
+    )
     conn.commit()
     return conn
 
@@ -84,3 +110,117 @@ def insert(conn: sqlite3.Connection, table: str, row: Iterable[Any]) -> None:
     conn.execute(f"INSERT INTO {table} VALUES ({placeholders})", tuple(row))
     conn.commit()
 
+
+def upsert_driver_totals(conn: sqlite3.Connection, rows: Iterable[Iterable[Any]]) -> None:
+    """Insert or update ``(team, driver, total_time, total_laps, best_lap)`` rows."""
+    with conn:
+        conn.executemany(
+            """
+            INSERT INTO driver_totals VALUES (?,?,?,?,?)
+            ON CONFLICT (team, driver) DO UPDATE SET
+                total_time = excluded.total_time,
+                total_laps = excluded.total_laps,
+                best_lap = excluded.best_lap
+            """,
+            [tuple(r) for r in rows],
+        )
+
+
+class BufferedWriter:
+    """Collect rows in memory and write them with one transaction per flush.
+
+    Rows are written with ``executemany`` when :meth:`flush` is called or when
+    :meth:`maybe_flush` finds that ``flush_interval`` seconds have passed or
+    ``max_rows`` rows are pending.  With the default ``flush_interval`` of
+    ``0`` every :meth:`maybe_flush` call commits, i.e. once per logger tick.
+    Pending rows are also flushed at interpreter exit.
+
+    A failed write is logged rather than raised, so a locked or broken
+    database does not stop the logger's other outputs.  The rows are kept
+    for up to ``max_retries`` further flushes and then dropped.
+    """
+
+    def __init__(
+        self,
+        conn: sqlite3.Connection,
+        *,
+        flush_interval: float = 0.0,
+        max_rows: int = 5000,
+        max_retries: int = 3,
+    ) -> None:
+        self.conn = conn
+        self.flush_interval = flush_interval
+        self.max_rows = max_rows
+        self.max_retries = max_retries
+        self._failures = 0
+        self._pending: dict[str, list[tuple]] = {}
+        self._count = 0
+        self._last_flush = time.monotonic()
+        atexit.register(self.flush)
+
+    def add(self, table: str, row: Iterable[Any]) -> None:
+        """Queue ``row`` for insertion into ``table``."""
+        self._pending.setdefault(table, []).append(tuple(row))
+        self._count += 1
+
+    def add_many(self, table: str, rows: Iterable[Iterable[Any]]) -> None:
+        """Queue several rows for insertion into ``table``."""
+        rows = [tuple(r) for r in rows]
+        if not rows:
+            return
+        self._pending.setdefault(table, []).extend(rows)
+        self._count += len(rows)
+
+    def maybe_flush(self) -> int:
+        """Flush when the interval has elapsed or too many rows are pending."""
+        if (
+            self._count >= self.max_rows
+            or time.monotonic() - self._last_flush >= self.flush_interval
+        ):
+            return self.flush()
+        return 0
+
+    def flush(self) -> int:
+        """Write all pending rows in a single transaction and return the count.
+
+        Returns ``0`` when the transaction fails; see the class docstring.
+        """
+        self._last_flush = time.monotonic()
+        if not self._count:
+            return 0
+        pending, count = self._pending, self._count
+        self._pending, self._count = {}, 0
+        try:
+            with self.conn:
+                for table, rows in pending.items():
+                    if not rows:
+                        continue
+                    placeholders = ",".join(["?"] * len(rows[0]))
+                    self.conn.executemany(
+                        f"INSERT INTO {table} VALUES ({placeholders})", rows
+                    )
+        except sqlite3.Error as exc:
+            self._failures += 1
+            if self._failures > self.max_retries:
+                log.error("Dropping %d rows after %d failed writes: %s", count, self._failures, exc)
+                self._failures = 0
+            else:
+                log.warning("Database write failed, keeping %d rows: %s", count, exc)
+                self._pending, self._count = pending, count
+            return 0
+        self._failures = 0
+        return count
+
+    def close(self) -> None:
+        """Flush pending rows and close the connection."""
+        atexit.unregister(self.flush)
+        try:
+            self.flush()
+        finally:
+            self.conn.close()
+
+    def __enter__(self) -> "BufferedWriter":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
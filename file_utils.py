@@ -0,0 +1,26 @@
+"""File helpers shared by the loggers."""
+
+from __future__ import annotations
+
+import os
+import time
+
+
+def atomic_write(path, text: str) -> None:
+    """Write ``text`` to ``path`` via a temporary file and :func:`os.replace`.
+
+    Readers such as OBS either see the old or the new file, never a
+    half-written one.
+    """
+    tmp = f"{path}.tmp"
+    with open(tmp, "w", encoding="utf-8", newline="") as f:
+        f.write(text)
+    for attempt in range(3):
+        try:
+            os.replace(tmp, path)
+            return
+        except PermissionError:
+            # Windows refuses the rename while another process reads the file
+            if attempt == 2:
+                raise
+            time.sleep(0.05)
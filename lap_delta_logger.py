@@ -27,18 +27,29 @@ if getattr(sys, "frozen", False):
         pass
 
 import csv
+import io
 import time
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional
 
 from codebase_cleaner import check_latest_version
 
 import irsdk
+import numpy as np
+
+import telemetry_hub
+from file_utils import atomic_write
 
 
 CSV_PATH = "lap_delta_log.csv"
+INTERVALS_PATH = "intervals.csv"
+DEFAULT_INTERVAL = 1
 
 HEADER = ["Time", "CarIdx", "Lap", "DeltaToLeader"]
+INTERVALS_HEADER = [
+    "Position", "CarIdx", "TeamName", "CarClassID", "ClassPosition", "Lap",
+    "GapToLeader", "Interval", "ClassGap", "ClassInterval",
+]
 
 
 def iso_now() -> str:
@@ -62,58 +73,299 @@ def rollover_log(path: str) -> None:
         csv.writer(f).writerow(HEADER)
 
 
-def log_deltas(csv_path: str) -> None:
-    """Main logging loop."""
+# number of leader laps kept for delta look-ups; cars further behind the
+# leader than this get an empty delta
+LEADER_RING_SIZE = 256
+
+
+def crossing_times(
+    prev_time: Optional[float],
+    sess_time: Any,
+    prev_pct: np.ndarray,
+    pct: np.ndarray,
+    laps_done: np.ndarray,
+) -> list:
+    """Return the line-crossing time of each car in one tick.
+
+    ``prev_pct`` and ``pct`` are the ``CarIdxLapDistPct`` values of the
+    crossing cars in the previous and current snapshot.  A car that moved
+    from 0.99 to 0.02 crossed the line a third of the way through the tick,
+    so its time is interpolated between ``prev_time`` and ``sess_time``.
+    Cars without usable distances (off track, more than one lap per tick,
+    first snapshot) get ``sess_time``.
+    """
+    n = len(laps_done)
+    if prev_time is None or len(prev_pct) != n or len(pct) != n:
+        return [sess_time] * n
+    to_line = 1.0 - prev_pct
+    covered = to_line + pct
+    ok = (laps_done == 1) & (prev_pct >= 0) & (pct >= 0) & (covered > 0)
+    if not ok.any():
+        return [sess_time] * n
+    frac = np.divide(to_line, covered, out=np.ones(n), where=ok)
+    times = prev_time + (sess_time - prev_time) * frac
+    return [t if good else sess_time for t, good in zip(times.tolist(), ok.tolist())]
+
+
+class IntervalTable:
+    """Line-crossing times of every car for the last ``ring_size`` laps.
+
+    Row ``lap % ring_size`` of :attr:`times` holds the crossing time of each
+    ``CarIdx`` for that lap, so the gap between any two cars is one array
+    look-up.  :meth:`set_order` stores the running order, after which the
+    car ahead overall or in class is found in O(1) as well.
+    """
+
+    def __init__(self, ring_size: int = LEADER_RING_SIZE, cars: int = 64) -> None:
+        self.ring_size = ring_size
+        self.times = np.full((ring_size, cars), np.nan)
+        self.ring_lap = np.full(ring_size, -1, dtype=np.int64)
+        self.last_lap = np.full(cars, -1, dtype=np.int64)
+        self.pos = np.zeros(cars, dtype=np.int64)
+        self.class_pos = np.zeros(cars, dtype=np.int64)
+        self.class_id = np.full(cars, -1, dtype=np.int64)
+        self.by_pos: dict = {}                        # position → car
+        self.by_class_pos: dict = {}                  # (class, position) → car
+
+    def _grow(self, cars: int) -> None:
+        extra = cars - self.times.shape[1]
+        self.times = np.pad(self.times, ((0, 0), (0, extra)), constant_values=np.nan)
+        self.last_lap = np.pad(self.last_lap, (0, extra), constant_values=-1)
+        self.pos = np.pad(self.pos, (0, extra))
+        self.class_pos = np.pad(self.class_pos, (0, extra))
+        self.class_id = np.pad(self.class_id, (0, extra), constant_values=-1)
+
+    def record(self, cars: np.ndarray, laps: np.ndarray, times) -> None:
+        """Store that each of ``cars`` completed ``laps`` at ``times``."""
+        if len(cars) and cars.max() >= self.times.shape[1]:
+            self._grow(int(cars.max()) + 1)
+        slots = laps % self.ring_size
+        keep = np.ones(len(cars), dtype=bool)
+        for i, (slot, lap) in enumerate(zip(slots.tolist(), laps.tolist())):
+            if self.ring_lap[slot] < lap:
+                self.ring_lap[slot] = lap
+                self.times[slot] = np.nan
+            elif self.ring_lap[slot] > lap:
+                keep[i] = False           # more than ring_size laps behind
+        self.times[slots[keep], cars[keep]] = np.asarray(times, dtype=float)[keep]
+        self.last_lap[cars] = laps
+
+    def time(self, car: int, lap: int) -> Optional[float]:
+        """Return when ``car`` completed ``lap`` or ``None`` if unknown."""
+        slot = lap % self.ring_size
+        if lap < 0 or car >= self.times.shape[1] or self.ring_lap[slot] != lap:
+            return None
+        t = self.times[slot, car]
+        return None if np.isnan(t) else float(t)
+
+    def gap(self, car: int, other: int) -> Optional[float]:
+        """Return how many seconds ``car`` is behind ``other`` at the line.
+
+        The gap is measured at the last lap both have completed; it is
+        negative when ``car`` is ahead.
+        """
+        if car >= len(self.last_lap) or other >= len(self.last_lap):
+            return None
+        lap = int(min(self.last_lap[car], self.last_lap[other]))
+        t_car, t_other = self.time(car, lap), self.time(other, lap)
+        if t_car is None or t_other is None:
+            return None
+        return t_car - t_other
+
+    def set_order(self, pos: np.ndarray, class_pos: np.ndarray, class_id: np.ndarray) -> None:
+        """Store the running order from ``CarIdxPosition``/``CarIdxClassPosition``."""
+        n = max(len(pos), len(class_pos), len(class_id))
+        if n > self.times.shape[1]:
+            self._grow(n)
+        self.pos[:] = 0
+        self.class_pos[:] = 0
+        self.pos[: len(pos)] = pos
+        self.class_pos[: len(class_pos)] = class_pos
+        self.class_id[: len(class_id)] = class_id
+        placed = np.flatnonzero(self.pos > 0)
+        self.by_pos = dict(zip(self.pos[placed].tolist(), placed.tolist()))
+        placed = np.flatnonzero(self.class_pos > 0)
+        self.by_class_pos = dict(
+            zip(zip(self.class_id[placed].tolist(), self.class_pos[placed].tolist()), placed.tolist())
+        )
+
+    def leader(self) -> Optional[int]:
+        return self.by_pos.get(1)
+
+    def ahead(self, car: int) -> Optional[int]:
+        """Return the car one position ahead of ``car``."""
+        return self.by_pos.get(int(self.pos[car]) - 1) if self.pos[car] > 1 else None
+
+    def class_leader(self, car: int) -> Optional[int]:
+        return self.by_class_pos.get((int(self.class_id[car]), 1))
+
+    def class_ahead(self, car: int) -> Optional[int]:
+        """Return the car one class position ahead of ``car``."""
+        if self.class_pos[car] <= 1:
+            return None
+        return self.by_class_pos.get((int(self.class_id[car]), int(self.class_pos[car]) - 1))
+
+    def rows(self, drivers: list) -> list:
+        """Return :data:`INTERVALS_HEADER` rows in running order."""
+        teams = {d.get("CarIdx"): d.get("TeamName", "") for d in drivers}
+
+        def fmt(car, other):
+            if other is None:
+                return ""
+            g = self.gap(car, other)
+            return "" if g is None else round(g, 3)
+
+        out = []
+        for p in sorted(self.by_pos):
+            car = self.by_pos[p]
+            out.append([
+                p,
+                car,
+                teams.get(car, ""),
+                int(self.class_id[car]),
+                int(self.class_pos[car]),
+                int(self.last_lap[car]) if self.last_lap[car] >= 0 else "",
+                fmt(car, self.leader()) if p > 1 else 0.0,
+                fmt(car, self.ahead(car)) if p > 1 else "",
+                fmt(car, self.class_leader(car)) if self.class_pos[car] > 1 else 0.0,
+                fmt(car, self.class_ahead(car)) if self.class_pos[car] > 1 else "",
+            ])
+        return out
+
+
+class LapDeltaLogger:
+    """Telemetry consumer writing a row whenever a car completes a lap.
+
+    The delta is the gap to the leader at the start/finish line; crossing
+    times are interpolated with ``CarIdxLapDistPct`` when it is available.
+    """
+
+    def __init__(
+        self,
+        csv_path: str,
+        ring_size: int = LEADER_RING_SIZE,
+        intervals_path: Optional[str] = None,
+    ) -> None:
+        self.csv_path = csv_path
+        self.ring_size = ring_size
+        self.intervals_path = intervals_path
+        self.reset()
+
+        with open(csv_path, "w", newline="", encoding="utf-8") as f:
+            csv.writer(f).writerow(HEADER)
+
+    def reset(self) -> None:
+        """Forget the per-car state, e.g. when a new session starts."""
+        self.last_lap = np.zeros(0, dtype=np.int64)     # per CarIdx slot
+        self.prev_pct = np.zeros(0)
+        self.prev_time = None
+        # leader crossing times, slot ``lap % ring_size`` holds ``(lap, time)``
+        self.leader_ring: list = [None] * self.ring_size
+        self.table = IntervalTable(self.ring_size)
+        self.prev_order = np.zeros(0, dtype=np.int64)
+        self.prev_session = None
+
+    def leader_time(self, lap: int):
+        """Return when the leader completed ``lap`` or ``None`` if unknown."""
+        entry = self.leader_ring[lap % self.ring_size]
+        return entry[1] if entry is not None and entry[0] == lap else None
+
+    def feed(self, snap: Any) -> None:
+        """Record lap completions contained in ``snap``."""
+        ts = snap.wall_time.isoformat(timespec="seconds")
+        session_num = snap["SessionNum"]
+        if self.prev_session is None:
+            self.prev_session = session_num
+        elif session_num != self.prev_session:
+            rollover_log(self.csv_path)
+            self.reset()
+            self.prev_session = session_num
+
+        laps = snap.array("CarIdxLap", np.int64)
+        pos = snap.array("CarIdxPosition")
+        pct = snap.array("CarIdxLapDistPct", float)
+        sess_time = snap["SessionTime"]
+
+        leaders = np.flatnonzero(pos == 1)
+        leader_idx = int(leaders[0]) if len(leaders) else None
+
+        if len(self.last_lap) != len(laps):
+            last_lap = np.zeros(len(laps), dtype=np.int64)
+            m = min(len(laps), len(self.last_lap))
+            last_lap[:m] = self.last_lap[:m]
+            self.last_lap = last_lap
+        changed = np.flatnonzero((laps > 0) & (laps != self.last_lap))
+        if len(changed):
+            if len(pct) == len(self.prev_pct) == len(laps):
+                prev_pct, cur_pct = self.prev_pct[changed], pct[changed]
+            else:
+                prev_pct = cur_pct = np.zeros(0)
+            cross = crossing_times(
+                self.prev_time,
+                sess_time,
+                prev_pct,
+                cur_pct,
+                laps[changed] - self.last_lap[changed],
+            )
+            self.last_lap[changed] = laps[changed]
+            self.table.record(changed, laps[changed], cross)
+            self._write(ts, changed.tolist(), laps[changed].tolist(), cross, leader_idx)
+        self.prev_pct = pct
+        self.prev_time = sess_time
+
+        if self.intervals_path and (len(changed) or not np.array_equal(pos, self.prev_order)):
+            self._write_intervals(snap, pos)
+        self.prev_order = pos
+
+    def _write_intervals(self, snap: Any, pos: np.ndarray) -> None:
+        drivers = snap["DriverInfo"]["Drivers"]
+        class_id = np.full(len(pos), -1, dtype=np.int64)
+        for d in drivers:
+            idx = d.get("CarIdx")
+            if idx is not None and 0 <= int(idx) < len(pos):
+                try:
+                    class_id[int(idx)] = int(d.get("CarClassID", -1))
+                except (TypeError, ValueError):
+                    pass
+        self.table.set_order(pos, snap.array("CarIdxClassPosition", np.int64), class_id)
+
+        buf = io.StringIO()
+        wr = csv.writer(buf)
+        wr.writerow(INTERVALS_HEADER)
+        wr.writerows(self.table.rows(drivers))
+        atomic_write(self.intervals_path, buf.getvalue())
+
+    def _write(self, ts: str, cars: list, laps: list, cross: list, leader_idx) -> None:
+        ring = self.leader_ring
+        # record the leader first so cars crossing in the same tick find it
+        for idx, lap, t in zip(cars, laps, cross):
+            if idx == leader_idx:
+                ring[lap % self.ring_size] = (lap, t)
+
+        with open(self.csv_path, "a", newline="", encoding="utf-8") as f:
+            wr = csv.writer(f)
+            for idx, lap, t in zip(cars, laps, cross):
+                if idx == leader_idx:
+                    delta = 0.0
+                else:
+                    leader_time = self.leader_time(lap)
+                    delta = t - leader_time if leader_time is not None else ""
+                    if isinstance(delta, float):
+                        delta = round(delta, 3)
+                wr.writerow([ts, idx, lap, delta])
+
+
+def log_deltas(csv_path: str, intervals_path: Optional[str] = INTERVALS_PATH) -> None:
+    """Main logging loop when running without :mod:`telemetry_hub`."""
 
     ir = irsdk.IRSDK()
     ir.startup()
 
-    last_lap: dict[int, int] = {}
-    leader_lap_time: dict[int, float] = {}
-    prev_session = ir["SessionNum"]
-
-    with open(csv_path, "w", newline="", encoding="utf-8") as f:
-        csv.writer(f).writerow(HEADER)
-
+    logger = LapDeltaLogger(csv_path, intervals_path=intervals_path)
     try:
         while True:
-            ts = iso_now()
-            session_num = ir["SessionNum"]
-            if session_num != prev_session:
-                rollover_log(csv_path)
-                last_lap.clear()
-                leader_lap_time.clear()
-                prev_session = session_num
-
-            laps = ir["CarIdxLap"]
-            pos = ir["CarIdxPosition"]
-            sess_time = ir["SessionTime"]
-
-            try:
-                leader_idx = pos.index(1)
-            except ValueError:
-                leader_idx = None
-
-            with open(csv_path, "a", newline="", encoding="utf-8") as f:
-                wr = csv.writer(f)
-                for idx, lap in enumerate(laps):
-                    if lap <= 0:
-                        continue
-                    prev = last_lap.get(idx)
-                    if prev is not None and lap == prev:
-                        continue
-                    last_lap[idx] = lap
-
-                    if idx == leader_idx:
-                        leader_lap_time[lap] = sess_time
-                        delta = 0.0
-                    else:
-                        leader_time = leader_lap_time.get(lap)
-                        delta = sess_time - leader_time if leader_time is not None else ""
-
-                    wr.writerow([ts, idx, lap, delta])
-
-            time.sleep(1)
+            logger.feed(telemetry_hub.capture(ir))
+            time.sleep(DEFAULT_INTERVAL)
     except KeyboardInterrupt:
         print("Logger stopped by user.")
     finally:
@@ -126,6 +378,11 @@ def log_deltas(csv_path: str) -> None:
 def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Lap delta logger")
     parser.add_argument("--output", default=CSV_PATH, help="CSV output file")
+    parser.add_argument(
+        "--intervals",
+        default=INTERVALS_PATH,
+        help="gap/interval table rewritten on every change (default: %(default)s)",
+    )
     parser.add_argument(
         "--version",
         action="version",
@@ -137,8 +394,7 @@ def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
 
 def main(argv: list[str] | None = None) -> None:
     args = parse_args(argv)
-    csv_path = args.output
-    log_deltas(csv_path)
+    log_deltas(args.output, args.intervals)
 
 
 if __name__ == "__main__":
@@ -17,19 +17,24 @@ if getattr(sys, "frozen", False):
 
 import argparse
 import irsdk, csv, time
+import io
 import shutil
+import threading
+from html import escape
 from pathlib import Path
+from typing import Optional
 from codebase_cleaner import check_latest_version
 
+import numpy as np
+
 import eec_db
-try:
-    import pandas as pd
-except Exception:
-    pd = None
+import telemetry_hub
+from file_utils import atomic_write
 
 CSV_FILE     = "pitstop_log.csv"
 OVERLAY_FILE = "live_standings_overlay.html"
 DRIVER_TOTAL_FILE = "driver_times.csv"
+DEFAULT_INTERVAL = 0.5
 
 DRIVER_HEADERS = [
     "TeamName",
@@ -51,21 +56,21 @@ HEADERS = [
 ]
 
 
-def rollover_logs() -> dict:
+def rollover_logs(csv_file: str = CSV_FILE, driver_total_file: str = DRIVER_TOTAL_FILE) -> dict:
     """Archive the current CSV files and return a fresh driver_total dict."""
     dest_dir = Path("RaceLogs")
     dest_dir.mkdir(exist_ok=True)
     ts = datetime.now().strftime("%Y%m%d_%H%M%S")
     try:
-        shutil.move(CSV_FILE, dest_dir / f"{Path(CSV_FILE).stem}_{ts}.csv")
+        shutil.move(csv_file, dest_dir / f"{Path(csv_file).stem}_{ts}.csv")
     except FileNotFoundError:
         pass
     try:
-        shutil.move(DRIVER_TOTAL_FILE, dest_dir / f"{Path(DRIVER_TOTAL_FILE).stem}_{ts}.csv")
+        shutil.move(driver_total_file, dest_dir / f"{Path(driver_total_file).stem}_{ts}.csv")
     except FileNotFoundError:
         pass
-    open(CSV_FILE, "w", newline="").write(",".join(HEADERS) + "\n")
-    open(DRIVER_TOTAL_FILE, "w", newline="").write(",".join(DRIVER_HEADERS) + "\n")
+    open(csv_file, "w", newline="").write(",".join(HEADERS) + "\n")
+    open(driver_total_file, "w", newline="").write(",".join(DRIVER_HEADERS) + "\n")
     return {}
 
 def iso_now():
@@ -80,15 +85,7 @@ def hms(sec):
     m, s = divmod(rem, 60)
     return f"{h}:{m:02d}:{s:02d}"
 
-def write_overlay(csv_path, html_path=OVERLAY_FILE):
-    if pd is None:
-        return
-    df = pd.read_csv(csv_path)
-    latest = (df.sort_values("Stint End Timestamp", ascending=False)
-                .drop_duplicates("CarIdx")
-                .sort_values("Stint End SessionTime", ascending=False))
-
-    html = """
+OVERLAY_HEAD = """
     <html><body style='background:rgba(20,20,20,.8);color:#f2f2f2;font-family:sans-serif;padding:14px;'>
     <h3 style='margin-top:0;font-size:26px;'>Live Standings</h3>
     <table border=0 style='font-size:18px;border-collapse:collapse;'>
@@ -100,15 +97,120 @@ def write_overlay(csv_path, html_path=OVERLAY_FILE):
         <th align='center'style='padding:0 0 0 18px;'>Stint (min:sec)</th>
       </tr>"""
 
-    for _, r in latest.iterrows():
-        sess_to_hms = lambda s: f"{int(s//3600)}:{int((s%3600)//60):02d}:{int(s%60):02d}"
-        html += (f"<tr><td align='left'  style='padding:0 18px 0 0;'>{r.TeamName}</td>"
-                 f"<td align='left'  style='padding:0 18px 0 0;'>{r.DriverName}</td>"
-                 f"<td align='center'style='padding:0 18px;'>{r['Stint End Lap']}</td>"
-                 f"<td align='center'style='padding:0 18px;'>{sess_to_hms(r['Stint End SessionTime'])}</td>"
-                 f"<td align='center'style='padding:0 0 0 18px;'>{r['Stint Duration (min:sec)']}</td></tr>")
-    html += "</table></body></html>"
-    open(html_path, "w", encoding="utf-8").write(html)
+
+def sess_to_hms(s):
+    s = float(s)
+    return f"{int(s//3600)}:{int((s%3600)//60):02d}:{int(s%60):02d}"
+
+
+def render_overlay(latest) -> str:
+    """Return the overlay HTML for the latest stint row (``HEADERS`` order) per car."""
+    rows = sorted(latest, key=lambda r: float(r[7]), reverse=True)
+    parts = [OVERLAY_HEAD]
+    for r in rows:
+        parts.append(
+            f"<tr><td align='left'  style='padding:0 18px 0 0;'>{escape(str(r[2]))}</td>"
+            f"<td align='left'  style='padding:0 18px 0 0;'>{escape(str(r[3]))}</td>"
+            f"<td align='center'style='padding:0 18px;'>{r[9]}</td>"
+            f"<td align='center'style='padding:0 18px;'>{sess_to_hms(r[7])}</td>"
+            f"<td align='center'style='padding:0 0 0 18px;'>{r[11]}</td></tr>"
+        )
+    parts.append("</table></body></html>")
+    return "".join(parts)
+
+
+def read_latest_stints(csv_path) -> dict:
+    """Return the latest stint row per car from an existing pit-stop log."""
+    latest = {}
+    try:
+        with open(csv_path, newline="", encoding="utf-8", errors="replace") as f:
+            rdr = csv.reader(f)
+            header = next(rdr, None)
+            for row in rdr:
+                if header and len(row) == len(header) == len(HEADERS):
+                    try:
+                        latest[int(row[0])] = row
+                    except ValueError:
+                        continue
+    except FileNotFoundError:
+        pass
+    return latest
+
+
+def write_overlay(csv_path, html_path=OVERLAY_FILE):
+    """Rebuild the overlay from a pit-stop log file."""
+    atomic_write(html_path, render_overlay(read_latest_stints(csv_path).values()))
+
+
+class TotalsCsvWriter:
+    """Keep the driver totals CSV up to date from a background thread.
+
+    :meth:`update` re-serializes only the rows it is given and hands the
+    joined text to the writer thread, which replaces the file atomically.
+    Updates that arrive while a write is in progress are coalesced.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.lines = {}                          # (team, driver) → CSV line
+        self._header = self._format(DRIVER_HEADERS)
+        self._text = None
+        self._busy = False
+        self._closed = False
+        self._cond = threading.Condition()
+        self._thread = threading.Thread(target=self._run, name="driver-totals", daemon=True)
+        self._thread.start()
+
+    @staticmethod
+    def _format(row) -> str:
+        buf = io.StringIO()
+        csv.writer(buf).writerow(row)
+        return buf.getvalue()
+
+    def update(self, rows: dict) -> None:
+        """Replace the lines for ``rows`` (key → CSV row) and schedule a write."""
+        for key, row in rows.items():
+            self.lines[key] = self._format(row)
+        text = self._header + "".join(self.lines.values())
+        with self._cond:
+            self._text = text
+            self._cond.notify_all()
+
+    def wait(self) -> None:
+        """Block until every scheduled write has reached the disk."""
+        with self._cond:
+            while self._text is not None or self._busy:
+                self._cond.wait()
+
+    def reset(self) -> None:
+        """Forget all rows once pending writes are done (session rollover)."""
+        self.wait()
+        self.lines.clear()
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while self._text is None and not self._closed:
+                    self._cond.wait()
+                if self._text is None:
+                    return
+                text, self._text = self._text, None
+                self._busy = True
+            try:
+                atomic_write(self.path, text)
+            except Exception as e:
+                print(f"[ERR] {self.path}: {e}", flush=True)
+            finally:
+                with self._cond:
+                    self._busy = False
+                    self._cond.notify_all()
+
+    def close(self) -> None:
+        """Write any pending update and stop the writer thread."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        self._thread.join()
 
 
 def parse_args() -> argparse.Namespace:
@@ -127,213 +229,327 @@ def parse_args() -> argparse.Namespace:
     return args
 
 
-args = parse_args()
-import threading
-threading.Thread(target=check_latest_version, args=(__version__,), daemon=True).start()
-CSV_FILE = args.output
-DRIVER_TOTAL_FILE = args.driver_total
-DB_PATH = args.db
-conn = eec_db.init_db(DB_PATH) if DB_PATH else None
-
-# ── initialise CSVs ───────────────────────────────────────────
-try:
-    open(CSV_FILE, "x", newline="").write(",".join(HEADERS) + "\n")
-except FileExistsError:
-    pass
-
-try:
-    with open(DRIVER_TOTAL_FILE, "r", newline="", encoding="utf-8") as f:
-        rdr = csv.DictReader(f)
+def load_driver_totals(path: str) -> dict:
+    """Return per-driver totals from ``path``, creating the file if missing."""
+    try:
+        with open(path, "r", newline="", encoding="utf-8") as f:
+            rdr = csv.DictReader(f)
+            driver_total = {}
+            for r in rdr:
+                key = (r["TeamName"], r["DriverName"])
+                driver_total[key] = {
+                    "time": float(r.get("Total Time (sec)", 0)),
+                    "laps": int(r.get("Total Laps", 0) or 0),
+                    "best": float(r.get("Best Lap (sec)", r.get("Best Lap Time (sec)", float("inf"))) or float("inf")),
+                }
+    except FileNotFoundError:
+        open(path, "w", newline="").write(",".join(DRIVER_HEADERS) + "\n")
         driver_total = {}
-        for r in rdr:
-            key = (r["TeamName"], r["DriverName"])
-            driver_total[key] = {
-                "time": float(r.get("Total Time (sec)", 0)),
-                "laps": int(r.get("Total Laps", 0) or 0),
-                "best": float(r.get("Best Lap (sec)", r.get("Best Lap Time (sec)", float("inf"))) or float("inf")),
+    return driver_total
+
+
+def _no_totals():
+    return {"time": 0.0, "laps": 0, "best": float("inf")}
+
+
+class StintTracker:
+    """Detect stints and pit stops from telemetry snapshots.
+
+    The tracker only looks at the snapshots it is fed (times come from
+    ``snapshot.wall_time``), so it can be driven by :class:`telemetry_hub.TelemetryHub`,
+    by recorded telemetry or by tests.  Results are passed to *sinks*, objects
+    implementing any of these optional methods:
+
+    ``stint_end(row)``
+        a finished stint as a row in :data:`HEADERS` order
+    ``totals(totals)``
+        per-driver totals ``{(team, driver): {"time", "laps", "best"}}``
+        that changed since the last call
+    ``rollover()``
+        a new session started
+    ``flush()``
+        called at the end of every :meth:`feed`
+    ``close()``
+        the tracker is shutting down
+    """
+
+    TOTALS_INTERVAL = 60                      # seconds between running totals
+
+    def __init__(self, sinks=(), driver_total: Optional[dict] = None) -> None:
+        self.sinks = list(sinks)
+        self.driver_total = dict(driver_total or {})
+        self.stint = {}                           # carIdx → dict
+        self.prev_session = None
+        self.last_snap = None
+        self.last_total_update = None
+        self._written_totals = {}                 # (team, driver) → last emitted stats
+        # per CarIdx slot: car seen by the tracker, pit road state of the
+        # previous snapshot and best lap of the current stint
+        self._tracked = np.zeros(0, dtype=bool)
+        self._prev_pit = np.zeros(0, dtype=bool)
+        self._stint_best = np.zeros(0)
+
+    def add_sink(self, sink) -> None:
+        self.sinks.append(sink)
+
+    def _emit(self, event: str, *args) -> None:
+        for sink in self.sinks:
+            handler = getattr(sink, event, None)
+            if handler is not None:
+                handler(*args)
+
+    def _resize(self, n: int) -> None:
+        m = min(n, len(self._tracked))
+        tracked, prev_pit = np.zeros(n, dtype=bool), np.zeros(n, dtype=bool)
+        stint_best = np.full(n, np.inf)
+        tracked[:m], prev_pit[:m], stint_best[:m] = (
+            self._tracked[:m], self._prev_pit[:m], self._stint_best[:m]
+        )
+        self._tracked, self._prev_pit, self._stint_best = tracked, prev_pit, stint_best
+
+    def write_totals(self, totals: dict) -> None:
+        """Pass the driver totals that changed since the last call to the sinks."""
+        dirty = {}
+        for key, s in totals.items():
+            stats = (s["time"], s["laps"], s["best"])
+            if self._written_totals.get(key) != stats:
+                self._written_totals[key] = stats
+                dirty[key] = s
+        if dirty:
+            self._emit("totals", dirty)
+
+    def _running_totals(self, now, laps) -> dict:
+        """Return the driver totals including the stints still running at ``now``."""
+        totals = {k: dict(v) for k, v in self.driver_total.items()}
+        for idx, s in self.stint.items():
+            if "start_time" in s:
+                key = (s["team"], s["driver"])
+                stats = totals.get(key, _no_totals())
+                stats["time"] += (now - s["start_time"]).total_seconds()
+                stats["laps"] += int(laps[idx]) - int(s["start_lap"])
+                stats["best"] = min(stats["best"], float(self._stint_best[idx]))
+                totals[key] = stats
+        return totals
+
+    def feed(self, snap) -> None:
+        """Detect pit entries and exits contained in ``snap``.
+
+        Entries and exits are found by comparing the ``CarIdxOnPitRoad``
+        array with the previous snapshot, so only cars whose state changed
+        are visited.
+        """
+        stint = self.stint
+        driver_total = self.driver_total
+        now = snap.wall_time
+
+        session_num = snap["SessionNum"]
+        if self.prev_session is None:
+            self.prev_session = session_num
+        elif session_num != self.prev_session:
+            self._emit("rollover")
+            self.driver_total = driver_total = {}
+            self._written_totals.clear()
+            stint.clear()
+            self._tracked[:] = False
+            self.prev_session = session_num
+        self.last_snap = snap
+        if self.last_total_update is None:
+            self.last_total_update = now
+        sess  = snap["SessionTime"]
+        onpit = snap.array("CarIdxOnPitRoad", bool)
+        laps  = snap.array("CarIdxLap")
+        best_laps = snap.array("CarIdxBestLapTime", float)
+        # iRacing reports -1 (or 0) until a car has set a lap time
+        best_laps = np.where(best_laps > 0, best_laps, np.inf)
+        drvs  = snap["DriverInfo"]["Drivers"]
+
+        if len(self._tracked) != len(onpit):
+            self._resize(len(onpit))
+        tracked = self._tracked
+        if len(best_laps) == len(onpit):
+            np.minimum(self._stint_best, best_laps, out=self._stint_best)
+        # pit entry of a tracked car ends its stint; leaving the pits or
+        # being seen on track for the first time starts one
+        ends = np.flatnonzero(onpit & ~self._prev_pit & tracked)
+        starts = np.flatnonzero(~onpit & (self._prev_pit | ~tracked))
+        self._prev_pit = onpit.copy()
+
+        def car_info(idx):
+            team = drvs[idx]["TeamName"] if idx < len(drvs) else f"Car {idx}"
+            drv  = drvs[idx]["UserName"] if idx < len(drvs) else f"Car {idx}"
+            lap  = laps[idx].item() if idx < len(laps) else "?"
+            return team, drv, lap
+
+        for idx in ends.tolist():
+            team, drv, lap = car_info(idx)
+            cls  = drvs[idx]["CarClassShortName"] if idx < len(drvs) else "Unknown"
+            end   = now
+            dur_s = (end - stint[idx]["start_time"]).total_seconds()
+            row = [
+                idx, cls,               # NEW
+                team, drv,
+                stint[idx]["start_time"].isoformat(timespec="seconds"),
+                end.isoformat(timespec="seconds"),
+                stint[idx]["start_sess"], sess,
+                stint[idx]["start_lap"], lap,
+                dur_s, minsec(dur_s),
+                int(lap) - int(stint[idx]["start_lap"])
+            ]
+            self._emit("stint_end", row)
+            print(f"[{iso_now()}] STINT END – "
+                f"{team} / {drv}: {row[-1]} laps, {row[-2]}.")
+
+            # update per-driver totals
+            key = (team, drv)
+            stats = driver_total.get(key, _no_totals())
+            stats["time"] += dur_s
+            stats["laps"] += int(lap) - int(stint[idx]["start_lap"])
+            stats["best"] = min(stats["best"], float(self._stint_best[idx]))
+            driver_total[key] = stats
+            self.write_totals(driver_total)
+
+            stint[idx] = {"on_pit": True}     # wait for exit
+
+        for idx in starts.tolist():
+            team, drv, lap = car_info(idx)
+            stint[idx] = {
+                "start_time": now,
+                "start_sess": sess,
+                "start_lap": lap,
+                "team": team,
+                "driver": drv,
             }
-except FileNotFoundError:
-    open(DRIVER_TOTAL_FILE, "w", newline="").write(",".join(DRIVER_HEADERS) + "\n")
-    driver_total = {}
+            tracked[idx] = True
+            self._stint_best[idx] = best_laps[idx] if idx < len(best_laps) else np.inf
 
-ir = irsdk.IRSDK(); ir.startup()
-stint = {}                           # carIdx → dict
-last_total_update = time.time()
-prev_session = ir["SessionNum"]
+        # ── periodic update of driver times ──────────────────
+        if (now - self.last_total_update).total_seconds() >= self.TOTALS_INTERVAL:
+            self.write_totals(self._running_totals(now, laps))
+            self.last_total_update = now
+
+        self._emit("flush")
+
+    def close(self) -> None:
+        """Add running stints to the driver totals, write them and close the sinks."""
+        snap = self.last_snap
+        if snap is not None:
+            self.driver_total = self._running_totals(snap.wall_time, snap.array("CarIdxLap"))
+            self.stint.clear()
+        self.write_totals(self.driver_total)
+        self._emit("close")
+
+
+class CsvSink:
+    """Append finished stints to the pit-stop log and keep the driver totals CSV."""
+
+    def __init__(self, csv_file: str = CSV_FILE, driver_total_file: str = DRIVER_TOTAL_FILE) -> None:
+        self.csv_file = csv_file
+        self.driver_total_file = driver_total_file
+        try:
+            open(csv_file, "x", newline="").write(",".join(HEADERS) + "\n")
+        except FileExistsError:
+            pass
+        self.totals_csv = TotalsCsvWriter(driver_total_file)
+
+    def stint_end(self, row) -> None:
+        with open(self.csv_file, "a", newline="") as f:
+            csv.writer(f).writerow(row)
+
+    def totals(self, totals: dict) -> None:
+        rows = {}
+        for (t, d), s in totals.items():
+            avg = s["time"] / s["laps"] if s["laps"] else 0
+            rows[(t, d)] = [t, d, s["time"], hms(s["time"]), s["laps"], f"{avg:.3f}",
+                            f"{s['best']:.3f}" if s["best"] != float("inf") else ""]
+        self.totals_csv.update(rows)
+
+    def rollover(self) -> None:
+        self.totals_csv.reset()
+        rollover_logs(self.csv_file, self.driver_total_file)
+
+    def close(self) -> None:
+        self.totals_csv.close()
+
+
+class SqliteSink:
+    """Store finished stints and driver totals in the SQLite database."""
+
+    def __init__(self, db_path: str) -> None:
+        self.db = eec_db.BufferedWriter(eec_db.init_db(db_path))
+
+    def stint_end(self, row) -> None:
+        self.db.add("pitstops", row)
+
+    def totals(self, totals: dict) -> None:
+        eec_db.upsert_driver_totals(
+            self.db.conn,
+            [(t, d, s["time"], s["laps"], s["best"]) for (t, d), s in totals.items()],
+        )
+
+    def rollover(self) -> None:
+        with self.db.conn:
+            self.db.conn.execute("DELETE FROM driver_totals")
+
+    def flush(self) -> None:
+        self.db.maybe_flush()
+
+    def close(self) -> None:
+        self.db.close()
+
+
+class OverlaySink:
+    """Render the OBS overlay from the latest finished stint of every car."""
+
+    def __init__(self, html_path: str = OVERLAY_FILE, csv_file: Optional[str] = None) -> None:
+        self.html_path = html_path
+        self.latest = read_latest_stints(csv_file) if csv_file else {}
+
+    def stint_end(self, row) -> None:
+        self.latest[row[0]] = row
+        atomic_write(self.html_path, render_overlay(self.latest.values()))
+
+    def rollover(self) -> None:
+        self.latest.clear()
+
+
+class PitStopLogger(StintTracker):
+    """:class:`StintTracker` writing the usual CSV, overlay and SQLite outputs."""
+
+    def __init__(self, csv_file: str = CSV_FILE, driver_total_file: str = DRIVER_TOTAL_FILE,
+                 db_path: Optional[str] = None, overlay_file: str = OVERLAY_FILE) -> None:
+        driver_total = load_driver_totals(driver_total_file)
+        self.csv = CsvSink(csv_file, driver_total_file)
+        self.overlay = OverlaySink(overlay_file, csv_file)
+        self.sql = SqliteSink(db_path) if db_path else None
+        sinks = [self.csv, self.overlay]
+        if self.sql:
+            sinks.append(self.sql)
+        super().__init__(sinks, driver_total)
+
+
+def main() -> None:
+    args = parse_args()
+    tracker = PitStopLogger(args.output, args.driver_total, args.db)
+
+    ir = irsdk.IRSDK(); ir.startup()
+    print("Enhanced pit-stop logger running… Ctrl-C to stop.")
+    while True:
+        try:
+            if ir.is_initialized and ir.is_connected:
+                tracker.feed(telemetry_hub.capture(ir))
+            time.sleep(DEFAULT_INTERVAL)
+        except KeyboardInterrupt:
+            tracker.close()
+            print("\nLogger stopped.")
+            break
+        except Exception as e:
+            print("Error:", e)
+            time.sleep(1)
+            tracker.close()
+            break
 
-print("Enhanced pit-stop logger running… Ctrl-C to stop.")
-while True:
-    try:
-        if ir.is_initialized and ir.is_connected:
-            ir.freeze_var_buffer_latest()
-            session_num = ir["SessionNum"]
-            if session_num != prev_session:
-                driver_total = rollover_logs()
-                stint.clear()
-                prev_session = session_num
-            sess  = ir["SessionTime"]
-            onpit = ir["CarIdxOnPitRoad"]
-            laps  = ir["CarIdxLap"]
-            drvs  = ir["DriverInfo"]["Drivers"]
-
-            for idx, pit in enumerate(onpit):
-                team = drvs[idx]["TeamName"] if idx < len(drvs) else f"Car {idx}"
-                drv  = drvs[idx]["UserName"] if idx < len(drvs) else f"Car {idx}"
-                lap  = laps[idx] if idx < len(laps) else "?"
-                cls  = drvs[idx]["CarClassShortName"] if idx < len(drvs) else "Unknown"
-
-                # start stint
-                if idx not in stint and not pit:
-                    stint[idx] = {
-                        "start_time": datetime.now(),
-                        "start_sess": sess,
-                        "start_lap": lap,
-                        "team": team,
-                        "driver": drv,
-                        "on_pit": False,
-                        "best_lap": ir["CarIdxBestLapTime"][idx],
-                    }
-
-                if idx in stint:
-                    was = stint[idx]["on_pit"]
-                    stint[idx]["on_pit"] = pit
-                    stint[idx]["best_lap"] = min(stint[idx].get("best_lap", float("inf")), ir["CarIdxBestLapTime"][idx])
-
-                    # pit entry  → end stint
-                    if pit and not was:
-                        end   = datetime.now()
-                        dur_s = (end - stint[idx]["start_time"]).total_seconds()
-                        row = [
-                            idx, cls,               # NEW
-                            team, drv,
-                            stint[idx]["start_time"].isoformat(timespec="seconds"),
-                            end.isoformat(timespec="seconds"),
-                            stint[idx]["start_sess"], sess,
-                            stint[idx]["start_lap"], lap,
-                            dur_s, minsec(dur_s),
-                            int(lap) - int(stint[idx]["start_lap"])
-                        ]
-                        with open(CSV_FILE, "a", newline="") as f:
-                            csv.writer(f).writerow(row)
-                        if conn:
-                            eec_db.insert(conn, "pitstops", row)
-                        print(f"[{iso_now()}] STINT END – "
-                            f"{team} / {drv}: {row[-1]} laps, {row[-2]}.")
-
-                        # update per-driver totals
-                        key = (team, drv)
-                        stats = driver_total.get(key, {"time": 0.0, "laps": 0, "best": float("inf")})
-                        stats["time"] += dur_s
-                        stats["laps"] += int(lap) - int(stint[idx]["start_lap"])
-                        stats["best"] = min(stats["best"], stint[idx].get("best_lap", float("inf")))
-                        driver_total[key] = stats
-                        with open(DRIVER_TOTAL_FILE, "w", newline="", encoding="utf-8") as dt:
-                            wr = csv.writer(dt)
-                            wr.writerow(DRIVER_HEADERS)
-                            for (t, d), s in driver_total.items():
-                                avg = s["time"] / s["laps"] if s["laps"] else 0
-                                wr.writerow([t, d, s["time"], hms(s["time"]), s["laps"], f"{avg:.3f}",
-                                             f"{s['best']:.3f}" if s["best"] != float("inf") else ""])
-                        if conn:
-                            conn.execute("DELETE FROM driver_totals")
-                            for (t, d), s in driver_total.items():
-                                conn.execute(
-                                    "INSERT INTO driver_totals VALUES (?,?,?,?,?)",
-                                    (t, d, s["time"], s["laps"], s["best"]),
-                                )
-                            conn.commit()
-
-                        if pd is not None:
-                            write_overlay(CSV_FILE)
-                        stint[idx] = {"on_pit": True}     # wait for exit
-
-                    # pit exit → new stint
-                    elif not pit and was:
-                        stint[idx] = {
-                            "start_time": datetime.now(),
-                            "start_sess": sess,
-                            "start_lap": lap,
-                            "team": team,
-                            "driver": drv,
-                            "on_pit": False,
-                            "best_lap": ir["CarIdxBestLapTime"][idx],
-                        }
-
-            # ── periodic update of driver times ──────────────────
-            now = datetime.now()
-            if time.time() - last_total_update >= 60:
-                cur_totals = {k: dict(v) for k, v in driver_total.items()}
-                for idx, s in stint.items():
-                    if s.get("on_pit") is False and "start_time" in s:
-                        team = drvs[idx]["TeamName"] if idx < len(drvs) else f"Car {idx}"
-                        drv  = drvs[idx]["UserName"] if idx < len(drvs) else f"Car {idx}"
-                        dur = (now - s["start_time"]).total_seconds()
-                        laps_run = int(laps[idx]) - int(s["start_lap"])
-                        best = min(s.get("best_lap", float("inf")), ir["CarIdxBestLapTime"][idx])
-                        key = (team, drv)
-                        stats = cur_totals.get(key, {"time": 0.0, "laps": 0, "best": float("inf")})
-                        stats["time"] += dur
-                        stats["laps"] += laps_run
-                        stats["best"] = min(stats["best"], best)
-                        cur_totals[key] = stats
-                with open(DRIVER_TOTAL_FILE, "w", newline="", encoding="utf-8") as dt:
-                    wr = csv.writer(dt)
-                    wr.writerow(DRIVER_HEADERS)
-                    for (t, d), s in cur_totals.items():
-                        avg = s["time"] / s["laps"] if s["laps"] else 0
-                        wr.writerow([t, d, s["time"], hms(s["time"]), s["laps"], f"{avg:.3f}",
-                                     f"{s['best']:.3f}" if s["best"] != float("inf") else ""])
-                if conn:
-                    conn.execute("DELETE FROM driver_totals")
-                    for (t, d), s in cur_totals.items():
-                        conn.execute(
-                            "INSERT INTO driver_totals VALUES (?,?,?,?,?)",
-                            (t, d, s["time"], s["laps"], s["best"]),
-                        )
-                    conn.commit()
-                last_total_update = time.time()
-        time.sleep(0.5)
-    except KeyboardInterrupt:
-        now = datetime.now()
-        for idx, info in list(stint.items()):
-            if "start_time" in info:
-                team = info.get("team", f"Car {idx}")
-                drv = info.get("driver", f"Car {idx}")
-                dur_s = (now - info["start_time"]).total_seconds()
-                laps_run = int(ir["CarIdxLap"][idx]) - int(info.get("start_lap", 0))
-                best = min(info.get("best_lap", float("inf")), ir["CarIdxBestLapTime"][idx])
-                key = (team, drv)
-                stats = driver_total.get(key, {"time": 0.0, "laps": 0, "best": float("inf")})
-                stats["time"] += dur_s
-                stats["laps"] += laps_run
-                stats["best"] = min(stats["best"], best)
-                driver_total[key] = stats
-        with open(DRIVER_TOTAL_FILE, "w", newline="", encoding="utf-8") as dt:
-            wr = csv.writer(dt)
-            wr.writerow(DRIVER_HEADERS)
-            for (t, d), s in driver_total.items():
-                avg = s["time"] / s["laps"] if s["laps"] else 0
-                wr.writerow([t, d, s["time"], hms(s["time"]), s["laps"], f"{avg:.3f}",
-                             f"{s['best']:.3f}" if s["best"] != float("inf") else ""])
-        if conn:
-            conn.execute("DELETE FROM driver_totals")
-            for (t, d), s in driver_total.items():
-                conn.execute(
-                    "INSERT INTO driver_totals VALUES (?,?,?,?,?)",
-                    (t, d, s["time"], s["laps"], s["best"]),
-                )
-            conn.commit()
-        print("\nLogger stopped.")
-        break
-    except Exception as e:
-        print("Error:", e)
-        time.sleep(1)
-        if conn:
-            conn.close()
-        break
-if conn:
-    conn.close()
 
 if __name__ == "__main__":
     import threading
     threading.Thread(target=check_latest_version, args=(__version__,), daemon=True).start()
+    main()
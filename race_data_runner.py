@@ -12,6 +12,11 @@ import time
 import os
 import threading
 import csv
+import gzip
+import io
+import json
+import shutil
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 from codebase_cleaner import check_latest_version
@@ -124,11 +129,10 @@ except Exception:  # colorama not installed
     def _init(*args, **kwargs):
         pass
 
-from collections import defaultdict
+from collections import deque
 
 PITLOG: Path = Path("pitstop_log.csv")   # same name the logger writes
-STANDINGS_LOG: Path = Path("standings_log.csv")   # the file ai_standings_logger writes
-DRIVER_SWAP_CSV: Path = Path("driver_swaps.csv")
+DRIVER_SWAP_CSV: Path = Path("driver_swaps.csv")   # written by driver_swap_logger
 
 
 # Ordered palette for class colours (fastest → slowest)
@@ -143,19 +147,16 @@ CLASS_COLOUR: dict[str, str] = {}          # filled on the fly
 
 
 _SWAPS_COLOUR = Style.BRIGHT + Fore.YELLOW
-_current_driver: dict[int, str] = defaultdict(str)
 
 
 def build_scripts(db_path: Path) -> list[tuple[str, list[str]]]:
     """Return the command list for child processes."""
     return [
+        # one shared irsdk connection feeding the standings, pit-stop and
+        # lap-delta loggers in-process
         (
-            "AI Logger",
-            [sys.executable, str(BASE_DIR / "ai_standings_logger.py"), "--db", str(db_path)],
-        ),
-        (
-            "Pit Logger",
-            [sys.executable, str(BASE_DIR / "pitstop_logger_enhanced.py"), "--db", str(db_path)],
+            "Telemetry",
+            [sys.executable, str(BASE_DIR / "telemetry_hub.py"), "--db", str(db_path)],
         ),
         ("Standings Sorter", [sys.executable, str(BASE_DIR / "standings_sorter.py")]),
         # add more here as needed
@@ -177,127 +178,491 @@ def iso_stamp() -> str:
     return datetime.now().isoformat(timespec="seconds")
 
 
-def launch(name: str, cmd: list[str]) -> subprocess.Popen:
-    logfile = LOG_DIR / f"{name.replace(' ', '_').lower()}.txt"
-    return subprocess.Popen(
+class ChildLog:
+    """Rotating log file and in-memory tail for the output of one child.
+
+    Output is appended to ``path``; once the file grows past ``max_bytes``
+    or is older than ``max_age`` seconds it is compressed to
+    ``<stem>.<timestamp><suffix>.gz`` (with ``_001``, ``_002``... added to
+    the timestamp when it is already taken) and a new file is started.
+    Only the newest ``backups`` compressed segments are kept.  The last
+    ``tail_lines`` lines stay in :attr:`tail` so the GUI can show them
+    without reading the file.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        *,
+        max_bytes: int = 5_000_000,
+        max_age: float = 6 * 3600,
+        backups: int = 10,
+        tail_lines: int = 200,
+    ) -> None:
+        self.path = Path(path)
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+        self.backups = backups
+        self.tail: deque[str] = deque(maxlen=tail_lines)
+        self.lines = 0
+        self._fh = None
+        self._opened = 0.0
+        self._lock = threading.Lock()
+
+    def _open(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._fh = self.path.open("a", encoding="utf-8", errors="replace")
+        self._opened = self._started()
+
+    def _segments(self) -> list[Path]:
+        return sorted(self.path.parent.glob(f"{self.path.stem}.*{self.path.suffix}.gz"))
+
+    def _started(self) -> float:
+        """Return when the current file was started.
+
+        A file left over from an earlier run keeps its age.  Where the
+        creation time is not available it was started no earlier than the
+        newest rotation, or at the latest at its last write.
+        """
+        st = self.path.stat()
+        if not st.st_size:
+            return time.time()
+        born = getattr(st, "st_birthtime", None)
+        if born is None and os.name == "nt":
+            born = st.st_ctime
+        if born is None:
+            rotated = [seg.stat().st_mtime for seg in self._segments()]
+            born = min(st.st_mtime, max(rotated)) if rotated else st.st_mtime
+        return born
+
+    def _due(self) -> bool:
+        size = self._fh.tell()
+        if not size:
+            return False
+        return size >= self.max_bytes or time.time() - self._opened >= self.max_age
+
+    def rotate(self) -> None:
+        """Compress the current file and start a new one."""
+        if self._fh is not None:
+            self._fh.close()
+            self._fh = None
+        if self.path.exists() and self.path.stat().st_size:
+            stamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+            target = self.path.with_name(f"{self.path.stem}.{stamp}{self.path.suffix}.gz")
+            n = 0
+            while target.exists():
+                # rotated twice within a second; the counter keeps name order
+                n += 1
+                target = self.path.with_name(
+                    f"{self.path.stem}.{stamp}_{n:03d}{self.path.suffix}.gz"
+                )
+            with self.path.open("rb") as src, gzip.open(target, "wb") as dst:
+                shutil.copyfileobj(src, dst)
+            self.path.unlink()
+            old = self._segments()
+            for seg in old[: max(0, len(old) - self.backups)]:
+                seg.unlink()
+        self._open()
+
+    def write(self, line: str) -> None:
+        with self._lock:
+            if self._fh is None:
+                self._open()
+            elif self._due():
+                self.rotate()
+            self._fh.write(line)
+            self._fh.flush()
+            self.tail.append(line.rstrip("\r\n"))
+            self.lines += 1
+
+    def recent(self, n: int | None = None) -> list[str]:
+        """Return the last ``n`` lines (all kept lines by default)."""
+        with self._lock:
+            lines = list(self.tail)
+        return lines if n is None else lines[-n:]
+
+    def capture(self, stream) -> threading.Thread:
+        """Copy ``stream`` into the log from a background thread until EOF."""
+
+        def pump() -> None:
+            try:
+                for line in stream:
+                    self.write(line)
+            except (OSError, ValueError):
+                pass
+            finally:
+                stream.close()
+
+        thread = threading.Thread(target=pump, daemon=True)
+        thread.start()
+        return thread
+
+    def close(self) -> None:
+        with self._lock:
+            if self._fh is not None:
+                self._fh.close()
+                self._fh = None
+
+
+def child_log(name: str, log_dir: Path | None = None) -> ChildLog:
+    return ChildLog((log_dir or LOG_DIR) / f"{name.replace(' ', '_').lower()}.txt")
+
+
+def launch(name: str, cmd: list[str], log: ChildLog | None = None) -> subprocess.Popen:
+    """Start ``cmd`` with its output captured into ``log``.
+
+    The pipe is drained by a background thread so a chatty child never
+    blocks on a full pipe and a restart appends to the existing log.
+    """
+    log = log or child_log(name)
+    proc = subprocess.Popen(
         cmd,
-        stdout=open(logfile, "w"),
+        # the loggers print without flushing; unbuffered output reaches
+        # the log and the GUI's tail as it is written
+        env={**os.environ, "PYTHONUNBUFFERED": "1"},
+        stdout=subprocess.PIPE,
         stderr=subprocess.STDOUT,
         text=True,
+        encoding="utf-8",
+        errors="replace",
     )
+    log.capture(proc.stdout)
+    return proc
 
 
-def start_processes(scripts: list[tuple[str, list[str]]]) -> dict[str, subprocess.Popen]:
-    """Launch all child processes and return a mapping of names to processes."""
-    procs = {name: launch(name, cmd) for name, cmd in scripts}
-    print(f"[{iso_stamp()}] 🚀  Started {len(procs)} child processes.", flush=True)
-    return procs
+STATUS_FILE: Path = Path("runner_status.json")
+STATUS_TAIL = 20                    # output lines per child in the status file
 
-def stamp(): return datetime.now().strftime("%H:%M:%S")
 
-def tail_pitlog(file: Path):
-    """Watch pitstop_log.csv and print new pit entries as they appear."""
-    pos = 0
-    header_read = False
-    while True:
-        if not (file.exists() and file.stat().st_size):
-            time.sleep(1)
-            continue
-        for _ in watch(str(file)):
-            if not file.exists():
-                pos = 0
-                header_read = False
-                continue
-            try:
-                size = file.stat().st_size
-            except FileNotFoundError:
-                pos = 0
-                header_read = False
-                continue
-            if size < pos:
-                pos = 0
-                header_read = False
-            with file.open("r", newline="", encoding="utf-8", errors="replace") as f:
-                if not header_read:
-                    csv.reader(f).__next__()  # skip header
-                    header_read = True
-                f.seek(pos)
-                for line in f:
-                    row = next(csv.reader([line]))
-                    if len(row) == 13:  # NEW schema
-                        (car, cls, team, driver, *_, dur_sec, dur_hms, dur_laps) = row
-                    elif len(row) == 12:  # OLD schema
-                        (car, team, driver, *_, dur_sec, dur_hms, dur_laps) = row
-                        cls = "Unknown"
-                    else:
-                        continue
-
-                    colour = colour_for(cls)
+@dataclass
+class Child:
+    """Supervision state of one child process."""
+
+    name: str
+    cmd: list[str]
+    log: ChildLog
+    proc: Any = None
+    state: str = "stopped"          # running, backoff, failed or stopped
+    started: float = 0.0
+    restarts: int = 0
+    failures: int = 0               # consecutive early exits
+    next_start: float = 0.0
+    last_exit: int | None = None
+
+
+class Supervisor:
+    """Start child processes and restart them with exponential backoff.
+
+    A child that exits within ``stable_after`` seconds of being started
+    counts as a failure; each failure doubles the delay before the next
+    start, from ``base_delay`` up to ``max_delay``.  After ``max_failures``
+    failures in a row the child is marked ``failed`` and left alone, so a
+    script that crashes on import does not keep respawning.  A child that
+    ran for ``stable_after`` seconds starts over with a clean slate.
+
+    The state of every child and the last :data:`STATUS_TAIL` lines of its
+    output are written to ``status_path`` as JSON for the GUI whenever they
+    change.  On :meth:`stop` children get ``stop_timeout`` seconds to exit
+    after SIGINT before they are killed.
+    """
+
+    def __init__(
+        self,
+        scripts: list[tuple[str, list[str]]],
+        *,
+        launcher=None,
+        base_delay: float = 1.0,
+        max_delay: float = 60.0,
+        stable_after: float = 30.0,
+        max_failures: int = 5,
+        status_path: Path | None = STATUS_FILE,
+        log_dir: Path | None = None,
+        clock=time.monotonic,
+        stop_timeout: float = 10.0,
+    ) -> None:
+        self.children = {
+            name: Child(name, cmd, child_log(name, log_dir)) for name, cmd in scripts
+        }
+        self._seen_lines = {name: 0 for name in self.children}
+        self.launcher = launcher or launch
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.stable_after = stable_after
+        self.max_failures = max_failures
+        self.status_path = status_path
+        self.clock = clock
+        self.stop_timeout = stop_timeout
+
+    def start(self) -> None:
+        now = self.clock()
+        for child in self.children.values():
+            self._spawn(child, now)
+        print(f"[{iso_stamp()}] 🚀  Started {len(self.children)} child processes.", flush=True)
+        self.write_status()
+
+    def _spawn(self, child: Child, now: float) -> None:
+        try:
+            child.proc = self.launcher(child.name, child.cmd, child.log)
+        except OSError as exc:
+            print(f"[{stamp()}] ❌  Could not start {child.name}: {exc}", flush=True)
+            child.proc = None
+            child.last_exit = None
+            self._failed(child, now)
+            return
+        child.state = "running"
+        child.started = now
+
+    def _failed(self, child: Child, now: float) -> None:
+        child.failures += 1
+        if child.failures >= self.max_failures:
+            child.state = "failed"
+            print(
+                f"[{stamp()}] ⛔  {child.name} crashed {child.failures} times in a row; "
+                "not restarting",
+                flush=True,
+            )
+            return
+        delay = min(self.max_delay, self.base_delay * 2 ** (child.failures - 1))
+        child.state = "backoff"
+        child.next_start = now + delay
+        print(
+            f"[{stamp()}] ⏳  {child.name} exited (code {child.last_exit}); "
+            f"restarting in {delay:.0f}s",
+            flush=True,
+        )
+
+    def poll(self) -> None:
+        """Check every child once and restart those that are due."""
+        now = self.clock()
+        changed = False
+        for child in self.children.values():
+            if child.state == "running":
+                ret = child.proc.poll()
+                if ret is None:
+                    if child.failures and now - child.started >= self.stable_after:
+                        child.failures = 0
+                        changed = True
+                    continue
+                child.last_exit = ret
+                changed = True
+                if now - child.started >= self.stable_after:
+                    child.failures = 0
+                    child.state = "backoff"
+                    child.next_start = now
                     print(
-                        f"{colour}[{stamp()}] 🛠  PIT – {team.strip()} / {driver.strip()} "
-                        f"({dur_laps} laps in {dur_hms}) [{cls}]{Style.RESET_ALL}",
+                        f"[{stamp()}] 🔁  Restarting {child.name} (exit {ret})",
                         flush=True,
                     )
-                pos = f.tell()
+                else:
+                    self._failed(child, now)
+            if child.state == "backoff" and now >= child.next_start:
+                child.restarts += 1
+                self._spawn(child, now)
+                changed = True
+            if child.log.lines != self._seen_lines[child.name]:
+                self._seen_lines[child.name] = child.log.lines
+                changed = True
+        if changed:
+            self.write_status()
+
+    def status(self) -> dict[str, dict[str, Any]]:
+        now = self.clock()
+        out = {}
+        for child in self.children.values():
+            proc = child.proc if child.state == "running" else None
+            out[child.name] = {
+                "state": child.state,
+                "pid": getattr(proc, "pid", None),
+                "restarts": child.restarts,
+                "failures": child.failures,
+                "last_exit": child.last_exit,
+                "next_restart_in": (
+                    round(max(0.0, child.next_start - now), 1)
+                    if child.state == "backoff"
+                    else None
+                ),
+                "tail": child.log.recent(STATUS_TAIL),
+            }
+        return out
+
+    def write_status(self) -> None:
+        if self.status_path is None:
+            return
+        data = {"updated": iso_stamp(), "children": self.status()}
+        tmp = self.status_path.with_name(self.status_path.name + ".tmp")
+        try:
+            tmp.write_text(json.dumps(data, indent=1), encoding="utf-8")
+            os.replace(tmp, self.status_path)
+        except OSError:
+            # the GUI may hold the file open on Windows; try again next change
+            pass
+
+    def stop(self) -> None:
+        running = [c.proc for c in self.children.values() if c.state == "running"]
+        for p in running:
+            p.send_signal(signal.SIGINT)
+        deadline = time.monotonic() + self.stop_timeout
+        for p in running:
+            try:
+                p.wait(timeout=max(0.0, deadline - time.monotonic()))
+            except subprocess.TimeoutExpired:
+                p.kill()
+                p.wait()
+        for child in self.children.values():
+            child.state = "stopped"
+            child.log.close()
+        self.write_status()
 
 
-# ─────────────────────────────────────────────────────────────
-def tail_driver_swaps(file: Path):
-    """Watch standings_log.csv and emit a message whenever a driver swap occurs."""
-    header = "Timestamp,CarIdx,Team,DriverOut,DriverIn,Lap\n"
-    pos = 0
-    header_read = False
-    while True:
-        if not DRIVER_SWAP_CSV.exists() or DRIVER_SWAP_CSV.stat().st_size == 0:
-            DRIVER_SWAP_CSV.write_text(header, encoding="utf-8")
+def stamp(): return datetime.now().strftime("%H:%M:%S")
+
+# Windows refuses to rename a file another process holds open, which would
+# break the loggers' rollover; there the handle is reopened on every read.
+KEEP_OPEN = os.name != "nt"
+
+
+class _Tail:
+    """Read position and open handle of one followed file."""
+
+    def __init__(self, path: Path, handler, header: bool) -> None:
+        self.path = Path(path)
+        self.handler = handler
+        self.header = header
+        self.fh = None
+        self.reset()
+
+    def reset(self) -> None:
+        if self.fh is not None:
+            self.fh.close()
+            self.fh = None
+        self.offset = 0
+        self.file_id: tuple[int, int] | None = None
+        self.header_done = not self.header
+
+    def read(self) -> list[list[str]]:
+        """Return the complete rows appended since the previous call."""
+        try:
+            st = os.stat(self.path)
+        except FileNotFoundError:
+            self.reset()
+            return []
+        file_id = (st.st_dev, st.st_ino)
+        if file_id != self.file_id or st.st_size < self.offset:
+            # rolled over or truncated: start again from the top
+            self.reset()
+            self.file_id = file_id
+        if st.st_size == self.offset:
+            return []
+        try:
+            if self.fh is None:
+                self.fh = open(self.path, "rb")
+            self.fh.seek(self.offset)
+            data = self.fh.read(st.st_size - self.offset)
+        except OSError:
+            self.reset()
+            return []
+        finally:
+            if not KEEP_OPEN and self.fh is not None:
+                self.fh.close()
+                self.fh = None
+        # only consume complete lines; a partial row is read next time
+        end = data.rfind(b"\n")
+        if end < 0:
+            return []
+        self.offset += end + 1
+        text = data[: end + 1].decode("utf-8", errors="replace")
+        rows = [row for row in csv.reader(io.StringIO(text, newline="")) if row]
+        if not self.header_done and rows:
+            rows = rows[1:]
+            self.header_done = True
+        return rows
+
+
+class TailEngine:
+    """Follow several CSV logs from one thread and dispatch new rows.
+
+    Each registered file keeps its handle and offset between reads, new
+    bytes are parsed with a single :func:`csv.reader` and the complete rows
+    are passed to the handler as one list.  A file that shrinks or is
+    replaced (log rollover) is read again from the start.  :meth:`run`
+    waits for changes with one ``watchfiles`` watch over the directories of
+    all files and also polls every ``poll_interval`` seconds in case an
+    event is missed.
+    """
 
-        if not (file.exists() and file.stat().st_size):
-            time.sleep(1)
+    def __init__(self, poll_interval: float = 2.0) -> None:
+        self.poll_interval = poll_interval
+        self.tails: dict[Path, _Tail] = {}
+        self.stop_event = threading.Event()
+
+    def add(self, path: Path, handler, *, header: bool = True) -> None:
+        """Call ``handler(rows)`` with the rows appended to ``path``."""
+        self.tails[Path(path).resolve()] = _Tail(path, handler, header)
+
+    def poll(self) -> int:
+        """Read every file once and return the number of rows dispatched."""
+        count = 0
+        for tail in self.tails.values():
+            rows = tail.read()
+            if rows:
+                count += len(rows)
+                try:
+                    tail.handler(rows)
+                except Exception as exc:
+                    print(f"[{stamp()}] ⚠️  {tail.path}: {exc}", flush=True)
+        return count
+
+    def run(self) -> None:
+        wanted = {str(p) for p in self.tails}
+        dirs = sorted({str(p.parent) for p in self.tails})
+        self.poll()
+        for _ in watch(
+            *dirs,
+            watch_filter=lambda _change, path: path in wanted,
+            recursive=False,
+            rust_timeout=int(self.poll_interval * 1000),
+            yield_on_timeout=True,
+            stop_event=self.stop_event,
+        ):
+            self.poll()
+
+    def stop(self) -> None:
+        self.stop_event.set()
+
+
+def print_pit_rows(rows: list[list[str]]) -> None:
+    """Print a line for every new pit stop in ``pitstop_log.csv``."""
+    for row in rows:
+        if len(row) == 13:  # NEW schema
+            (car, cls, team, driver, *_, dur_sec, dur_hms, dur_laps) = row
+        elif len(row) == 12:  # OLD schema
+            (car, team, driver, *_, dur_sec, dur_hms, dur_laps) = row
+            cls = "Unknown"
+        else:
             continue
-        for _ in watch(str(file)):
-            if not file.exists():
-                pos = 0
-                header_read = False
-                continue
-            try:
-                size = file.stat().st_size
-            except FileNotFoundError:
-                pos = 0
-                header_read = False
-                continue
-            if size < pos:
-                pos = 0
-                header_read = False
-            with file.open("r", newline="", encoding="utf-8", errors="replace") as f:
-                if not header_read:
-                    next(csv.reader(f), None)  # skip header
-                    header_read = True
-                f.seek(pos)
-                for line in f:
-                    row = next(csv.reader([line]))
-                    if len(row) < 8:
-                        continue
-                    ts, car, team, driver = row[:4]
-                    lap = row[7]
-                    try:
-                        car = int(car)
-                    except ValueError:
-                        continue
-
-                    prev = _current_driver.get(car)
-                    if prev and driver and driver != prev:
-                        colour = colour_for("swap")
-                        print(
-                            f"{colour}[{stamp()}] 🔄  DRIVER SWAP – "
-                            f"{team.strip()}  Car {car:>3}: "
-                            f"{prev} → {driver} (Lap {lap}){Style.RESET_ALL}",
-                            flush=True,
-                        )
-                        with DRIVER_SWAP_CSV.open("a", newline="", encoding="utf-8") as w:
-                            csv.writer(w).writerow([ts, car, team, prev, driver, lap])
-
-                    _current_driver[car] = driver
-                pos = f.tell()
+
+        colour = colour_for(cls)
+        print(
+            f"{colour}[{stamp()}] 🛠  PIT – {team.strip()} / {driver.strip()} "
+            f"({dur_laps} laps in {dur_hms}) [{cls}]{Style.RESET_ALL}",
+            flush=True,
+        )
+
+
+def print_driver_swaps(rows: list[list[str]]) -> None:
+    """Print a line for every swap the telemetry hub adds to ``driver_swaps.csv``."""
+    for row in rows:
+        if len(row) < 6:
+            continue
+        ts, car, team, prev, driver, lap = row[:6]
+        colour = colour_for("swap")
+        print(
+            f"{colour}[{stamp()}] 🔄  DRIVER SWAP – "
+            f"{team.strip()}  Car {car:>3}: "
+            f"{prev} → {driver} (Lap {lap}){Style.RESET_ALL}",
+            flush=True,
+        )
+
 
 # ─────────────────────────────────────────────────────────────
 
@@ -319,29 +684,23 @@ def main() -> int:
     DB_PATH = Path(ARGS.db)
     watch = ensure_watchfiles(ARGS.auto_install)
 
-    scripts = build_scripts(DB_PATH)
-    procs = start_processes(scripts)
+    supervisor = Supervisor(build_scripts(DB_PATH))
+    supervisor.start()
 
     threading.Thread(target=watchdog, daemon=True).start()
-    threading.Thread(target=tail_pitlog, args=(PITLOG,), daemon=True).start()
-    threading.Thread(target=tail_driver_swaps, args=(STANDINGS_LOG,), daemon=True).start()
+    tails = TailEngine()
+    tails.add(PITLOG, print_pit_rows)
+    tails.add(DRIVER_SWAP_CSV, print_driver_swaps)
+    threading.Thread(target=tails.run, daemon=True).start()
 
     try:
         while True:
-            dead = [n for n, p in procs.items() if p.poll() is not None]
-            for n in dead:
-                print(
-                    f"[{stamp()}] 🔁  Restarting {n} (exit {procs[n].returncode})",
-                    flush=True,
-                )
-                procs[n] = launch(n, dict(scripts)[n])
+            supervisor.poll()
             time.sleep(2)
     except KeyboardInterrupt:
         print(f"\n[{stamp()}] 🛑  Shutting down…", flush=True)
-        for p in procs.values():
-            p.send_signal(signal.SIGINT)
-        for p in procs.values():
-            p.wait()
+        tails.stop()
+        supervisor.stop()
     return 0
 
 
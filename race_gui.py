@@ -26,6 +26,7 @@ import os
 import shutil
 from pathlib import Path
 from queue import Queue, Empty
+from concurrent.futures import ThreadPoolExecutor
 from collections import deque
 
 VERSION_DONE = threading.Event()
@@ -35,7 +36,9 @@ def _run_version_check() -> None:
     global VERSION_OK
     VERSION_OK = check_latest_version(__version__)
     VERSION_DONE.set()
+import bisect
 import csv
+import io
 import re
 import json
 from datetime import datetime, timedelta
@@ -124,6 +127,11 @@ ANSI_COLOUR_MAP = {
     "97": "white",
 }
 
+# Log box rendering: lines kept in the widget, and how long one refresh may
+# spend draining the queue before yielding to the Tk event loop.
+LOG_BOX_MAX_LINES = 5000
+LOG_FRAME_BUDGET = 0.015
+
 EVENT_TYPES = {
     "overtake": {"label": "Overtakes", "colour": "blue"},
     "pitstop": {"label": "Pit Stops", "colour": "green"},
@@ -139,14 +147,14 @@ def filter_rows(rows):
     filtered = []
     car_re = re.compile(r"car\s*\d+$", re.IGNORECASE)
     for r in rows:
-        driver = r.get("Driver", r.get("DriverName", ""))
+        driver = r.get("Driver", r.get("DriverName", r.get("UserName", "")))
         team = r.get("Team", r.get("TeamName", ""))
         try:
-            pos = int(r.get("Pos", 0))
+            pos = int(r.get("Pos", r.get("Position", 0)))
         except Exception:
             pos = 0
         try:
-            laps = float(r.get("Laps", 0))
+            laps = float(r.get("Laps", r.get("Lap", 0)))
         except Exception:
             laps = 0.0
         if driver in {"Pace Car", "Lily Bowling"}:
@@ -180,15 +188,553 @@ def find_log_file(name: str) -> Path:
     return path
 
 
+RUNNER_STATUS_FILE = "runner_status.json"
+
+
+def read_runner_status() -> dict:
+    """Return the child states published by ``race_data_runner.py``."""
+    path = find_log_file(RUNNER_STATUS_FILE)
+    try:
+        with path.open(encoding="utf-8") as f:
+            return json.load(f).get("children", {})
+    except (OSError, ValueError, AttributeError):
+        return {}
+
+
+def format_runner_status(children: dict) -> str:
+    """Return a one-line summary of the runner's child processes."""
+    parts = []
+    for name, info in children.items():
+        state = info.get("state", "?")
+        if state == "backoff" and info.get("next_restart_in") is not None:
+            state = f"restarting in {info['next_restart_in']:.0f}s"
+        restarts = info.get("restarts", 0)
+        if restarts:
+            state += f", {restarts} restart{'s' if restarts != 1 else ''}"
+        parts.append(f"{name}: {state}")
+    return " | ".join(parts)
+
+
+# Logs the loggers only ever append to.  Other files, such as
+# sorted_standings.csv or driver_times.csv, are rewritten in place and
+# parsed again whenever they change.
+APPEND_ONLY_LOGS = {
+    "pitstop_log.csv",
+    "standings_log.csv",
+    "driver_swaps.csv",
+    "lap_delta_log.csv",
+}
+
+
+class _CsvEntry:
+    """Parsed state of one cached CSV file."""
+
+    # bytes before the read offset compared on every read to notice a file
+    # that was rewritten in place rather than appended to
+    CHECK_BYTES = 64
+
+    def __init__(self) -> None:
+        self.file_id: tuple[int, int] | None = None
+        self.size = -1
+        self.mtime = 0
+        self.offset = 0
+        self.check = b""
+        self.partial = b""
+        self.fields: list[str] | None = None
+        self.rows: list[dict[str, str]] = []
+
+    def consume(self, data: bytes) -> None:
+        """Parse complete lines appended at :attr:`offset`."""
+        self.offset += len(data)
+        self.check = (self.check + data)[-self.CHECK_BYTES:]
+        text = io.StringIO(data.decode("utf-8", errors="replace"), newline="")
+        if self.fields is None:
+            self.fields = next(csv.reader(text), None) or None
+            if self.fields is None:
+                return
+        self.rows.extend(csv.DictReader(text, fieldnames=self.fields))
+
+
+class CsvCache:
+    """Shared, incrementally updated parse results of the GUI's CSV logs.
+
+    Each file is keyed by its absolute path.  A call to :meth:`read` only
+    stats the file when nothing changed.  For the logs in
+    :data:`APPEND_ONLY_LOGS` it otherwise parses the bytes appended since
+    the previous call, and starts over when the file was replaced,
+    truncated or visibly rewritten.  Any other file is parsed again from
+    the start whenever its size or modification time changes.
+
+    The returned row dicts are shared between all callers and must not be
+    modified; the list holding them is a fresh copy.
+    """
+
+    def __init__(self) -> None:
+        self._entries: dict[str, _CsvEntry] = {}
+        self._lock = threading.Lock()
+
+    def _valid(self, entry: _CsvEntry, f, st: os.stat_result) -> bool:
+        if entry.file_id != (st.st_dev, st.st_ino) or st.st_size < entry.offset:
+            return False
+        if entry.check:
+            f.seek(entry.offset - len(entry.check))
+            return f.read(len(entry.check)) == entry.check
+        return True
+
+    def read(
+        self, path: Path, *, partial: bool = True, append_only: bool | None = None
+    ) -> tuple[list[str], list[dict[str, str]]]:
+        """Return field names and rows of ``path``.
+
+        With ``partial=False`` an unterminated last line is left out, so
+        the rows of an append-only log only grow by appending between
+        calls.  ``append_only`` defaults to whether the file name is in
+        :data:`APPEND_ONLY_LOGS`.
+        """
+        key = os.path.abspath(path)
+        if append_only is None:
+            append_only = Path(path).name in APPEND_ONLY_LOGS
+        with self._lock:
+            entry = self._entries.get(key)
+            st = os.stat(path)
+            if entry is None or (st.st_size, st.st_mtime_ns) != (entry.size, entry.mtime):
+                with open(path, "rb") as f:
+                    st = os.fstat(f.fileno())
+                    if entry is None or not append_only or not self._valid(entry, f, st):
+                        entry = self._entries[key] = _CsvEntry()
+                        entry.file_id = (st.st_dev, st.st_ino)
+                    f.seek(entry.offset)
+                    data = f.read(st.st_size - entry.offset)
+                entry.size, entry.mtime = st.st_size, st.st_mtime_ns
+                end = data.rfind(b"\n") + 1
+                if end:
+                    entry.consume(data[:end])
+                entry.partial = data[end:]
+            fields, rows, tail = entry.fields, list(entry.rows), entry.partial
+        # a last line without newline may still be written; parse it for
+        # this call only
+        if partial and tail.strip():
+            text = io.StringIO(tail.decode("utf-8", errors="replace"), newline="")
+            if fields is None:
+                fields = next(csv.reader(text), None)
+            else:
+                rows.extend(csv.DictReader(text, fieldnames=fields))
+        if not fields:
+            return [], []
+        return list(fields), rows
+
+    def invalidate(self, path: Path | None = None) -> None:
+        """Forget ``path``, or every file when ``path`` is ``None``."""
+        with self._lock:
+            if path is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(os.path.abspath(path), None)
+
+
+CSV_CACHE = CsvCache()
+
+
 def read_csv_file(path: Path) -> tuple[list[str], list[dict[str, str]]]:
-    """Return field names and rows from a CSV file safely."""
-    with open(path, newline="", encoding="utf-8", errors="replace") as f:
-        data = f.read()
-    lines = data.splitlines()
-    reader = csv.DictReader(lines)
-    if not reader.fieldnames:
-        return [], []
-    return reader.fieldnames, list(reader)
+    """Return field names and rows from a CSV file safely.
+
+    Rows come from :data:`CSV_CACHE`, so repeated calls only parse what
+    was appended in between.  The row dicts must not be modified.
+    """
+    return CSV_CACHE.read(path)
+
+
+class BackgroundWorker:
+    """Run parsing jobs on a thread pool and hand results to the Tk thread.
+
+    Jobs are identified by a key such as ``"stint-table"``.  Only the
+    newest job per key counts: while one is running a newer submission
+    waits for it and replaces any older waiting one, and results of jobs
+    that were superseded are dropped.  :meth:`drain` must be called from
+    the Tk thread; it runs the ``on_done`` callbacks of finished jobs.
+    """
+
+    def __init__(self, max_workers: int = 2) -> None:
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="gui-worker")
+        self._results: Queue = Queue()
+        self._lock = threading.Lock()
+        self._gen: dict[str, int] = {}
+        self._running: set[str] = set()
+        self._waiting: dict[str, tuple[int, Any, Any]] = {}
+
+    def submit(self, key: str, func, on_done) -> None:
+        with self._lock:
+            gen = self._gen.get(key, 0) + 1
+            self._gen[key] = gen
+            if key in self._running:
+                self._waiting[key] = (gen, func, on_done)
+                return
+            self._running.add(key)
+        self._start(key, gen, func, on_done)
+
+    def _start(self, key: str, gen: int, func, on_done) -> None:
+        def job() -> None:
+            try:
+                self._results.put((key, gen, func(), None, on_done))
+            except Exception as exc:
+                self._results.put((key, gen, None, exc, on_done))
+            with self._lock:
+                nxt = self._waiting.pop(key, None)
+                if nxt is None:
+                    self._running.discard(key)
+            if nxt is not None:
+                self._start(key, *nxt)
+
+        try:
+            self._pool.submit(job)
+        except RuntimeError:
+            # shut down while the GUI is closing
+            pass
+
+    def drain(self) -> int:
+        """Deliver finished results that are still current; return how many."""
+        count = 0
+        while True:
+            try:
+                key, gen, result, exc, on_done = self._results.get_nowait()
+            except Empty:
+                return count
+            if gen != self._gen.get(key):
+                continue
+            if exc is not None:
+                logging.getLogger("race_gui").warning("%s failed: %s", key, exc)
+                continue
+            try:
+                on_done(result)
+            except Exception:
+                logging.getLogger("race_gui").exception("rendering %s failed", key)
+                continue
+            count += 1
+
+    def shutdown(self) -> None:
+        self._pool.shutdown(wait=False, cancel_futures=True)
+
+
+class TreeBinder:
+    """Keep a Treeview in sync with rows keyed by a stable id.
+
+    :meth:`update` takes ``(iid, values, tags)`` tuples in display order.
+    Rows whose values or tags are unchanged are left alone, changed rows
+    are updated in place, new ones inserted and missing ones deleted, so a
+    refresh costs Tk calls only for what changed and the scroll position
+    and selection survive.  Use :func:`binder_for` to get the binder of a
+    tree.
+    """
+
+    def __init__(self, tree: Any) -> None:
+        self.tree = tree
+        self.columns: list[str] | None = None
+        self._rows: dict[str, tuple[tuple, tuple]] = {}
+        self._order: list[str] = []
+
+    def set_columns(self, columns: list[str], configure=None) -> bool:
+        """Set the tree's columns when they changed; return whether they did.
+
+        ``configure(column)`` is called for each column to set its heading
+        and width.  Changing the columns clears the rows.
+        """
+        if columns == self.columns:
+            return False
+        self.clear()
+        self.tree["columns"] = columns
+        for c in columns:
+            if configure is not None:
+                configure(c)
+        self.columns = list(columns)
+        return True
+
+    def clear(self) -> None:
+        if self._order:
+            self.tree.delete(*self._order)
+        self._rows = {}
+        self._order = []
+
+    def update(self, rows) -> None:
+        new: dict[str, tuple[tuple, tuple]] = {}
+        for iid, values, tags in rows:
+            iid = str(iid)
+            while iid in new:               # keep duplicate keys apart
+                iid += "+"
+            new[iid] = (tuple(values), tuple(tags))
+        old = self._rows
+        gone = [iid for iid in self._order if iid not in new]
+        if gone:
+            self.tree.delete(*gone)
+        # read the order back: the user may have re-sorted the rows
+        actual = [iid for iid in self.tree.get_children() if iid in new] if old else []
+        for iid, (values, tags) in new.items():
+            prev = old.get(iid)
+            if prev is None:
+                self.tree.insert("", "end", iid=iid, values=values, tags=tags)
+                actual.append(iid)
+            elif prev != (values, tags):
+                self.tree.item(iid, values=values, tags=tags)
+        wanted = list(new)
+        if actual != wanted:
+            first = next(i for i, (a, w) in enumerate(zip(actual, wanted)) if a != w)
+            for index in range(first, len(wanted)):
+                self.tree.move(wanted[index], "", index)
+        self._rows = new
+        self._order = wanted
+
+
+def binder_for(tree: Any) -> TreeBinder:
+    """Return the :class:`TreeBinder` attached to ``tree``, creating it once."""
+    binder = getattr(tree, "_eec_binder", None)
+    if binder is None:
+        binder = TreeBinder(tree)
+        tree._eec_binder = binder
+    return binder
+
+
+def resolve_time(text: str, first: str) -> str:
+    """Turn user input such as ``14:30`` into a log timestamp after ``first``.
+
+    Full ISO timestamps are returned unchanged; a bare time of day is put
+    on the date of ``first`` or, when that is earlier, the following day.
+    """
+    text = text.strip()
+    if "T" in text or "-" in text:
+        return text.replace(" ", "T")
+    try:
+        start = datetime.fromisoformat(first)
+        parts = [int(p) for p in text.split(":")]
+        while len(parts) < 3:
+            parts.append(0)
+        ts = start.replace(hour=parts[0], minute=parts[1], second=parts[2], microsecond=0)
+    except (ValueError, IndexError):
+        return text
+    if ts < start.replace(microsecond=0):
+        ts += timedelta(days=1)
+    return ts.isoformat()
+
+
+class StandingsLogIndex:
+    """Standings log rows in display order with time and per-car indexes.
+
+    :meth:`ingest` is fed the growing row list of the log and only
+    processes rows it has not seen.  Rows are kept in log order, one tick
+    after another, and within a tick by class and position.  The newest
+    tick is held back until a newer one starts or a refresh brings no new
+    rows, so a tick is never sorted half-written.
+
+    :attr:`rows` holds the source's own row dicts rather than copies, so
+    the log is kept in memory once, in :data:`CSV_CACHE`.  Lists are only
+    ever appended to, so the Tk thread can read the first :attr:`count`
+    rows while a worker ingests more; a new or truncated log builds a new
+    index instead.
+    """
+
+    def __init__(self, fields: list[str]) -> None:
+        self.fields = fields
+        self.rows: list[dict[str, str]] = []
+        self.by_car: dict[str, list[int]] = {}
+        self.labels: dict[str, str] = {}
+        self.class_best: dict[str, int] = {}
+        self.consumed = 0
+        self.first: Any = None
+        self.pending: list[dict[str, str]] = []
+
+    @property
+    def count(self) -> int:
+        return len(self.rows)
+
+    def matches(self, fields: list[str], source: list[dict[str, str]]) -> bool:
+        """Return whether ``source`` continues the rows already ingested."""
+        if fields != self.fields or len(source) < self.consumed:
+            return False
+        return self.first is None or (bool(source) and source[0] is self.first)
+
+    def values(self, i: int) -> list[str]:
+        """Return row ``i`` as a list of values in :attr:`fields` order."""
+        row = self.rows[i]
+        return [row.get(c, "") for c in self.fields]
+
+    def class_order(self) -> dict[str, int]:
+        best = self.class_best
+        return {c: i + 1 for i, c in enumerate(sorted(best, key=best.get))}
+
+    def ingest(self, source: list[dict[str, str]]) -> int:
+        """Add rows from ``source`` past those seen before; return how many."""
+        new = filter_rows(source[self.consumed:])
+        self.consumed = len(source)
+        if source and self.first is None:
+            self.first = source[0]
+        for r in new:
+            cls = r.get("CarClassID", "")
+            try:
+                pos = int(r.get("Position", 0))
+            except ValueError:
+                continue
+            if cls not in self.class_best or pos < self.class_best[cls]:
+                self.class_best[cls] = pos
+
+        rows = self.pending + new
+        if new and rows:
+            last = rows[-1].get("Time", "")
+            cut = len(rows)
+            while cut and rows[cut - 1].get("Time", "") == last:
+                cut -= 1
+            rows, self.pending = rows[:cut], rows[cut:]
+        else:
+            self.pending = []
+
+        order = self.class_order()
+        added = 0
+        start = 0
+        while start < len(rows):
+            t = rows[start].get("Time", "")
+            end = start
+            while end < len(rows) and rows[end].get("Time", "") == t:
+                end += 1
+            tick = sorted(
+                rows[start:end],
+                key=lambda r: (
+                    order.get(r.get("CarClassID", ""), len(order) + 1),
+                    int(r.get("Position", 0) or 0),
+                ),
+            )
+            for r in tick:
+                idx = len(self.rows)
+                car = r.get("CarIdx", "")
+                self.by_car.setdefault(car, []).append(idx)
+                self.labels[car] = f"{car} – {r.get('TeamName', '')}"
+                self.rows.append(r)
+                added += 1
+            start = end
+        return added
+
+    def view(self, car: str | None, count: int) -> list[int] | range:
+        """Return the row numbers shown for ``car`` (all cars when ``None``)."""
+        if car is None:
+            return range(count)
+        positions = self.by_car.get(car, [])
+        return positions[: bisect.bisect_left(positions, count)]
+
+    def find_time(self, view, ts: str) -> int:
+        """Return the position in ``view`` of the first row at or after ``ts``."""
+        rows = self.rows
+        lo, hi = 0, len(view)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if rows[view[mid]].get("Time", "") < ts:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+
+class VirtualTable:
+    """A Treeview that only holds the rows currently on screen.
+
+    The data lives in a source described by :meth:`set_source`: a row
+    count and a ``fetch(start, stop)`` callable returning
+    ``(iid, values, tags)`` tuples.  Scrolling re-fetches the visible
+    slice and :class:`TreeBinder` applies the difference, so a log with
+    hundreds of thousands of rows costs as many Tk items as fit on screen.
+    While the view is at the end it follows new rows.
+    """
+
+    ROW_HEIGHT = 20
+
+    def __init__(self, parent: Any, *, height: int = 25) -> None:
+        self.tree = ttk.Treeview(parent, show="headings", height=height)
+        self.vsb = ttk.Scrollbar(parent, orient="vertical", command=self.yview)
+        self.binder = binder_for(self.tree)
+        self.height = height
+        self.total = 0
+        self.top = 0
+        self.follow = True
+        self._fetch = lambda start, stop: []
+        for seq in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            self.tree.bind(seq, self._on_wheel)
+        self.tree.bind("<Configure>", self._on_resize)
+
+    def set_source(self, total: int, fetch) -> None:
+        self.total = total
+        self._fetch = fetch
+        if self.follow:
+            self.top = max(0, total - self.height)
+        self.refresh()
+
+    def scroll_to(self, index: int) -> None:
+        """Show row ``index`` at the top of the view."""
+        self.top = index
+        self.refresh()
+
+    def yview(self, *args: Any) -> None:
+        if not args:
+            return
+        if args[0] == "moveto":
+            self.top = int(float(args[1]) * self.total)
+        elif args[0] == "scroll":
+            step = self.height if args[2] == "pages" else 1
+            self.top += int(args[1]) * step
+        self.refresh()
+
+    def _on_wheel(self, event: Any) -> str:
+        if getattr(event, "num", None) == 4:
+            delta = -3
+        elif getattr(event, "num", None) == 5:
+            delta = 3
+        else:
+            delta = -3 if event.delta > 0 else 3
+        self.top += delta
+        self.refresh()
+        return "break"
+
+    def row_height(self) -> int:
+        """Return the theme's Treeview row height, or :attr:`ROW_HEIGHT`."""
+        try:
+            return int(ttk.Style(self.tree).lookup("Treeview", "rowheight")) or self.ROW_HEIGHT
+        except (tk.TclError, TypeError, ValueError):
+            return self.ROW_HEIGHT
+
+    def _on_resize(self, event: Any) -> None:
+        row = self.row_height()
+        # one row's worth of space is taken by the heading
+        height = max(1, (event.height - row) // row)
+        if height != self.height:
+            self.height = height
+            self.refresh()
+
+    def refresh(self) -> None:
+        last = max(0, self.total - self.height)
+        self.top = min(max(0, self.top), last)
+        self.follow = self.top >= last
+        stop = min(self.total, self.top + self.height)
+        self.binder.update(self._fetch(self.top, stop))
+        if self.total:
+            self.vsb.set(self.top / self.total, stop / self.total)
+        else:
+            self.vsb.set(0.0, 1.0)
+
+
+def run_job(owner: Any, key: str, func, on_done) -> None:
+    """Run ``func`` on ``owner.worker`` and pass the result to ``on_done``.
+
+    Without a worker (e.g. a stand-in GUI object) both run right away.
+    """
+    worker = getattr(owner, "worker", None)
+    if worker is None:
+        on_done(func())
+    else:
+        worker.submit(key, func, on_done)
+
+
+def append_span(spans: list[list[Any]], text: str, tags: tuple[str, ...]) -> None:
+    """Add *text* to *spans*, merging it into the last span if the tags match."""
+    if not text:
+        return
+    if spans and spans[-1][1] == tags:
+        spans[-1][0] += text
+    else:
+        spans.append([text, tags])
 
 
 def _parse_time(val: str) -> float:
@@ -288,8 +834,171 @@ def _find_python() -> str:
     return exe
 
 
+class StintModel:
+    """Per-car stint state built incrementally from the pit and standings logs.
+
+    :meth:`update` reads both logs through :data:`CSV_CACHE` and only
+    looks at rows appended since the previous call, keeping the latest
+    standing, the last finished stint and the running average stint
+    length of every car.  A replaced or truncated log is ingested again
+    from the start.  :meth:`rows` then builds the stint tracker rows in
+    time proportional to the number of cars.
+    """
+
+    def __init__(self) -> None:
+        self.reset_pits()
+        self.reset_standings()
+
+    def reset_pits(self) -> None:
+        self._pit_seen = 0
+        self._pit_first: Any = None
+        self.last_pit: dict[str, tuple[datetime, dict[str, str]]] = {}
+        self.pit_start: datetime | None = None
+        self.dur_sum: dict[Any, float] = {}
+        self.dur_count: dict[Any, int] = {}
+
+    def reset_standings(self) -> None:
+        self._stand_seen = 0
+        self._stand_first: Any = None
+        self.latest: dict[str, dict[str, str]] = {}
+        self.first_time = ""
+        self.first_dt: datetime | None = None
+
+    @staticmethod
+    def _continues(rows: list, first: Any, seen: int) -> bool:
+        return len(rows) >= seen and (first is None or (bool(rows) and rows[0] is first))
+
+    def _read(self, name: str) -> list[dict[str, str]]:
+        path = find_log_file(name)
+        if not path.exists():
+            return []
+        return CSV_CACHE.read(path, partial=False)[1]
+
+    def update(self) -> None:
+        pit_rows = self._read("pitstop_log.csv")
+        if not self._continues(pit_rows, self._pit_first, self._pit_seen):
+            self.reset_pits()
+        if pit_rows and self._pit_first is None:
+            self._pit_first = pit_rows[0]
+        self.ingest_pits(pit_rows[self._pit_seen:])
+        self._pit_seen = len(pit_rows)
+
+        stand_rows = self._read("standings_log.csv")
+        if not self._continues(stand_rows, self._stand_first, self._stand_seen):
+            self.reset_standings()
+        if stand_rows and self._stand_first is None:
+            self._stand_first = stand_rows[0]
+        self.ingest_standings(stand_rows[self._stand_seen:])
+        self._stand_seen = len(stand_rows)
+
+    def ingest_pits(self, rows: list[dict[str, str]]) -> None:
+        for r in rows:
+            car = r.get("CarIdx")
+            try:
+                d = float(r.get("Stint Duration (sec)", 0))
+            except Exception:
+                pass
+            else:
+                self.dur_sum[car] = self.dur_sum.get(car, 0.0) + d
+                self.dur_count[car] = self.dur_count.get(car, 0) + 1
+            if not car:
+                continue
+            try:
+                ts = datetime.fromisoformat(r.get("Stint End Timestamp"))
+            except Exception:
+                continue
+            if self.pit_start is None:
+                try:
+                    self.pit_start = datetime.fromisoformat(r.get("Stint Start Timestamp"))
+                except Exception:
+                    pass
+            prev = self.last_pit.get(car)
+            if prev is None or ts > prev[0]:
+                self.last_pit[car] = (ts, r)
+
+    def ingest_standings(self, rows: list[dict[str, str]]) -> None:
+        latest = self.latest
+        for r in rows:
+            t = r.get("Time", "")
+            # only a candidate for the earliest time needs parsing
+            if self.first_dt is None or (t and t < self.first_time):
+                try:
+                    dt = datetime.fromisoformat(t)
+                except Exception:
+                    dt = None
+                if dt is not None and (self.first_dt is None or dt < self.first_dt):
+                    self.first_dt, self.first_time = dt, t
+            car = r.get("CarIdx")
+            if not car:
+                continue
+            prev = latest.get(car)
+            if prev is None or t > prev.get("Time", ""):
+                latest[car] = r
+
+    def rows(self, race_end_override: datetime | None = None) -> list[list[Any]]:
+        """Return the stint tracker rows for the data ingested so far."""
+        race_start = self.pit_start or self.first_dt or datetime.now()
+        if race_end_override is not None:
+            race_end = race_end_override
+        else:
+            race_end = race_start + timedelta(hours=24)
+
+        def fmt(sec: float) -> str:
+            h = int(sec // 3600)
+            m = int((sec % 3600) // 60)
+            s = int(sec % 60)
+            return f"{h}:{m:02d}:{s:02d}" if h else f"{m}:{s:02d}"
+
+        rows = []
+        now = datetime.now()
+        for car, info in self.latest.items():
+            driver = info.get("UserName", info.get("Driver", ""))
+            team = info.get("TeamName", info.get("Team", ""))
+            cls = info.get("CarClassID", info.get("Class", ""))
+            try:
+                cur_lap = int(info.get("Lap", 0))
+            except Exception:
+                cur_lap = 0
+
+            last = self.last_pit.get(car)
+            last_lap = int(last[1].get("Stint End Lap", 0)) if last else cur_lap
+            last_end = last[0] if last else race_start
+
+            stint_laps = max(0, cur_lap - last_lap)
+            since_sec = (now - last_end).total_seconds()
+
+            count = self.dur_count.get(car)
+            expected_raw = self.dur_sum[car] / count if count else 3600.0
+            sanitized = (
+                expected_raw if expected_raw is not None and expected_raw > 0 else 1800
+            )
+            until_sec = max(0.0, sanitized - since_sec)
+            pits_left = estimate_remaining_pits(
+                race_end, now, expected_raw, fallback=1800
+            )
+
+            rows.append([
+                car,
+                driver,
+                team,
+                cls,
+                stint_laps,
+                fmt(since_sec),
+                fmt(until_sec),
+                pits_left,
+            ])
+        return rows
+
+
 class RaceLoggerGUI:
-    def __init__(self, root: tk.Tk, *, classic_theme: bool = False, time_left: float | None = None):
+    def __init__(
+        self,
+        root: tk.Tk,
+        *,
+        classic_theme: bool = False,
+        time_left: float | None = None,
+        log_lines: int = LOG_BOX_MAX_LINES,
+    ):
         self.root = root
         self.root.title(f"EEC Logger • v{__version__} • {__commit_hash__}")
         # Ensure the window is large enough when it first appears
@@ -311,13 +1020,16 @@ class RaceLoggerGUI:
         )
         self.proc = None
         self.log_queue: Queue[str] = Queue()
+        self.log_max_lines = log_lines
         self.output_thread = None
+        self.worker = BackgroundWorker()
         self.teams_file = Path(eec_teams.__file__).resolve()
         self.team_drivers = self.load_team_drivers()
         self.db_path = Path("eec_log.db")
 
         menubar = tk.Menu(root)
         file_menu = tk.Menu(menubar, tearoff=0)
+        file_menu.add_command(label="Child Output…", command=self.view_child_output)
         file_menu.add_command(label="Quit", command=self.on_close)
         menubar.add_cascade(label="File", menu=file_menu)
         self.auto_scroll = tk.BooleanVar(value=True)
@@ -355,6 +1067,8 @@ class RaceLoggerGUI:
             lbl = ttk.Label(self.log_status_frame, text=f"{f}: ?")
             lbl.grid(column=0, row=i, sticky="w")
             self.log_status_lbls[f] = lbl
+        self.runner_status_lbl = ttk.Label(self.log_status_frame, text="")
+        self.runner_status_lbl.grid(column=0, row=len(LOG_FILES), sticky="w")
         self.start_btn = ttk.Button(
             frm, text="Start Logging", command=self.start_logging
         )
@@ -475,6 +1189,7 @@ class RaceLoggerGUI:
 
         self.update_status_once()
         self.root.after(100, self.update_log_box)
+        self.root.after(50, self.process_worker_results)
         self.root.after(3000, self.update_feed)
         self.root.protocol("WM_DELETE_WINDOW", self.on_close)
         self.monitor_logging_once()
@@ -654,6 +1369,45 @@ class RaceLoggerGUI:
                 self.start_logging()
         self.root.after(10000, self.monitor_logging_once)
 
+    def view_child_output(self) -> None:
+        """Show the recent output of the runner's child processes."""
+        win = getattr(self, "child_output_win", None)
+        if win is not None and win.winfo_exists():
+            win.lift()
+            return
+
+        win = tk.Toplevel(self.root)
+        win.title("Child Output")
+        self.child_output_win = win
+        text = ScrolledText(
+            win,
+            width=100,
+            height=30,
+            state="disabled",
+            background=self.log_box_bg,
+            foreground=self.fg,
+        )
+        text.pack(fill="both", expand=True)
+
+        def refresh() -> None:
+            if not win.winfo_exists():
+                return
+            lines = []
+            for name, info in read_runner_status().items():
+                lines.append(f"── {name} ({info.get('state', '?')}) ──")
+                lines.extend(info.get("tail", []))
+                lines.append("")
+            content = "\n".join(lines) or "race_data_runner.py is not running"
+            if text.get("1.0", "end-1c") != content:
+                text.configure(state="normal")
+                text.delete("1.0", tk.END)
+                text.insert(tk.END, content)
+                text.configure(state="disabled")
+                text.see(tk.END)
+            win.after(2000, refresh)
+
+        refresh()
+
     # ── connection status loop ──────────────────────────────────
     def update_status_once(self):
         status = "N/A"
@@ -681,6 +1435,9 @@ class RaceLoggerGUI:
                 lbl.config(text=f"{path.name}: {int(age)}s ({state})")
             else:
                 lbl.config(text=f"{name}: missing")
+        runner_lbl = getattr(self, "runner_status_lbl", None)
+        if runner_lbl is not None:
+            runner_lbl.config(text=format_runner_status(read_runner_status()))
         self.root.after(2000, self.update_status_once)
 
     # ── log management helpers ──────────────────────────────────
@@ -734,23 +1491,34 @@ class RaceLoggerGUI:
         frame.rowconfigure(0, weight=1)
         frame.columnconfigure(0, weight=1)
 
-        def load() -> None:
-            tree.delete(*tree.get_children())
+        binder = binder_for(tree)
+
+        def parse() -> tuple[list[str], list[list[str]]]:
             path = find_log_file(csv_path)
             if not path.exists():
-                return
+                return [], []
             # Some log files may contain characters that are not valid UTF-8.
             # Using errors="replace" avoids a crash when decoding such files by
             # substituting invalid bytes with the Unicode replacement character.
             fields, rows = read_csv_file(path)
+            return fields, [[row.get(c, "") for c in fields] for row in rows]
+
+        def configure(c: str) -> None:
+            tree.heading(c, text=c)
+            tree.column(c, anchor="center")
+
+        def render(model: tuple[list[str], list[list[str]]]) -> None:
+            fields, values = model
             if not fields:
+                binder.clear()
                 return
-            tree["columns"] = fields
-            for c in fields:
-                tree.heading(c, text=c)
-                tree.column(c, anchor="center")
-            for row in rows:
-                tree.insert("", "end", values=[row.get(c, "") for c in fields])
+            binder.set_columns(fields, configure)
+            # keyed by line number: appended lines are inserted, and lines of
+            # a file rewritten in place (sorted_standings.csv) are updated
+            binder.update((i, vals, ()) for i, vals in enumerate(values))
+
+        def load() -> None:
+            run_job(self, f"csv-tab:{title}", parse, render)
 
         ttk.Button(frame, text="Refresh", command=load).grid(
             row=1, column=0, columnspan=2, pady=5
@@ -853,19 +1621,17 @@ class RaceLoggerGUI:
                 return val
             return f"{num:.3f}".rstrip("0").rstrip(".")
 
-        def load() -> None:
-            tree.delete(*tree.get_children())
+        binder = binder_for(tree)
+
+        def parse() -> tuple[list[str], list[tuple[str, list[str]]]]:
             path = find_log_file(csv_path)
             if not path.exists():
-                return
+                return [], []
             fields, rows = read_csv_file(path)
             if not fields:
-                return
+                return [], []
             cols = [c for c in display_cols if c in fields]
-            tree["columns"] = cols
-            for c in cols:
-                tree.heading(c, text=col_map[c])
-                tree.column(c, anchor="center", width=widths.get(c, 100), stretch=True)
+            out = []
             for row in rows:
                 vals = []
                 for c in cols:
@@ -875,7 +1641,24 @@ class RaceLoggerGUI:
                     elif c in {"Stint Start SessionTime", "Stint End SessionTime", "Stint Duration (sec)"}:
                         v = fmt_num(v)
                     vals.append(v)
-                tree.insert("", "end", values=vals)
+                key = f"{row.get('CarIdx', '')}@{row.get('Stint Start Timestamp', '')}"
+                out.append((key, vals))
+            return cols, out
+
+        def configure(c: str) -> None:
+            tree.heading(c, text=col_map[c])
+            tree.column(c, anchor="center", width=widths.get(c, 100), stretch=True)
+
+        def render(model: tuple[list[str], list[tuple[str, list[str]]]]) -> None:
+            cols, rows = model
+            if not cols:
+                binder.clear()
+                return
+            binder.set_columns(cols, configure)
+            binder.update((key, vals, ()) for key, vals in rows)
+
+        def load() -> None:
+            run_job(self, f"pitstop-tab:{title}", parse, render)
 
         def save_widths(_: Any = None) -> None:
             data = {c: tree.column(c)["width"] for c in tree["columns"]}
@@ -906,14 +1689,17 @@ class RaceLoggerGUI:
         auto_refresh: bool = False,
         refresh_ms: int = 5000,
     ) -> None:
-        """CSV viewer for the raw standings log with class sorting."""
+        """Virtualized viewer for the raw standings log.
+
+        Rows are shown tick by tick, sorted by class and position within a
+        tick, and can be filtered to one car or jumped to a time of day.
+        """
         frame = ttk.Frame(self.notebook, padding=10)
         self.notebook.add(frame, text=title)
-        tree = ttk.Treeview(frame, show="headings")
-        vsb = ttk.Scrollbar(frame, orient="vertical", command=tree.yview)
-        tree.configure(yscrollcommand=vsb.set)
-        tree.grid(row=0, column=0, sticky="nsew")
-        vsb.grid(row=0, column=1, sticky="ns")
+        table = VirtualTable(frame)
+        tree = table.tree
+        table.tree.grid(row=0, column=0, sticky="nsew")
+        table.vsb.grid(row=0, column=1, sticky="ns")
         frame.rowconfigure(0, weight=1)
         frame.columnconfigure(0, weight=1)
 
@@ -924,55 +1710,99 @@ class RaceLoggerGUI:
             4: "#24c080",
             5: "#d878d8",
         }
-
-        def load() -> None:
-            tree.delete(*tree.get_children())
+        for rank, colour in CLASS_COLOURS.items():
+            tree.tag_configure(f"class-{rank}", background=colour)
+
+        index: StandingsLogIndex | None = None  # owned by the worker
+        # what the Tk thread shows: the index, its published row count and
+        # the class order at that point
+        shown: tuple[StandingsLogIndex | None, int, dict[str, int]] = (None, 0, {})
+        car_var = tk.StringVar(value="All")
+        time_var = tk.StringVar()
+
+        def parse() -> tuple[tuple[StandingsLogIndex | None, int, dict[str, int]], list[str]]:
+            nonlocal index
             path = find_log_file(csv_path)
             if not path.exists():
-                return
-            fields, rows = read_csv_file(path)
+                return (None, 0, {}), []
+            fields, rows = CSV_CACHE.read(path, partial=False)
             if not fields:
+                return (None, 0, {}), []
+            if index is None or not index.matches(fields, rows):
+                index = StandingsLogIndex(fields)
+            index.ingest(rows)
+            labels = [index.labels[c] for c in sorted(index.labels, key=lambda c: (len(c), c))]
+            return (index, index.count, index.class_order()), labels
+
+        def current_car() -> str | None:
+            label = car_var.get()
+            return None if label == "All" else label.split(" – ", 1)[0]
+
+        def show() -> None:
+            idx, count, order = shown
+            if idx is None:
+                table.set_source(0, lambda start, stop: [])
                 return
-            tree["columns"] = fields
-            for c in fields:
-                tree.heading(c, text=c)
-                tree.column(c, anchor="center")
+            view = idx.view(current_car(), count)
+
+            def fetch(start: int, stop: int):
+                return [
+                    (
+                        i,
+                        idx.values(i),
+                        (f"class-{order.get(idx.rows[i].get('CarClassID', ''), 0)}",),
+                    )
+                    for i in view[start:stop]
+                ]
 
-            rows = filter_rows(rows)
+            table.set_source(len(view), fetch)
 
-            class_leaders: dict[str, int] = {}
-            for r in rows:
-                cls = r.get("CarClassID", "")
-                try:
-                    pos = int(r.get("Position", 0))
-                except Exception:
-                    pos = 0
-                if cls not in class_leaders or pos < class_leaders[cls]:
-                    class_leaders[cls] = pos
-            order = {
-                c: i + 1 for i, c in enumerate(sorted(class_leaders, key=class_leaders.get))
-            }
-
-            rows.sort(
-                key=lambda r: (
-                    order.get(r.get("CarClassID", ""), len(order) + 1),
-                    int(r.get("Position", 0)),
-                )
-            )
+        def configure(c: str) -> None:
+            tree.heading(c, text=c)
+            tree.column(c, anchor="center", width=100)
+
+        def render(model) -> None:
+            nonlocal shown
+            shown, labels = model
+            idx = shown[0]
+            if idx is not None:
+                table.binder.set_columns(idx.fields, configure)
+                labels = ["All"] + labels
+                if list(car_combo["values"]) != labels:
+                    car_combo["values"] = labels
+            show()
 
-            for r in rows:
-                vals = [r.get(c, "") for c in fields]
-                cls_order = order.get(r.get("CarClassID", ""), 0)
-                tag = f"class-{cls_order}"
-                if tag not in tree.tag_names():
-                    colour = CLASS_COLOURS.get(cls_order, "")
-                    if colour:
-                        tree.tag_configure(tag, background=colour)
-                tree.insert("", "end", values=vals, tags=(tag,))
+        def load() -> None:
+            run_job(self, f"standings-tab:{title}", parse, render)
 
-        ttk.Button(frame, text="Refresh", command=load).grid(
-            row=1, column=0, columnspan=2, pady=5
+        def jump() -> None:
+            idx, count, _ = shown
+            if idx is None:
+                return
+            view = idx.view(current_car(), count)
+            if not len(view):
+                return
+            ts = resolve_time(time_var.get(), idx.times[view[0]])
+            table.scroll_to(idx.find_time(view, ts))
+
+        def car_changed(_: Any = None) -> None:
+            table.follow = True
+            show()
+
+        controls = ttk.Frame(frame)
+        controls.grid(row=1, column=0, columnspan=2, pady=5, sticky="ew")
+        ttk.Label(controls, text="Car:").pack(side="left")
+        car_combo = ttk.Combobox(
+            controls, textvariable=car_var, state="readonly", values=["All"], width=30
         )
+        car_combo.pack(side="left", padx=5)
+        car_combo.bind("<<ComboboxSelected>>", car_changed)
+        ttk.Label(controls, text="Time:").pack(side="left", padx=(10, 0))
+        time_entry = ttk.Entry(controls, textvariable=time_var, width=20)
+        time_entry.pack(side="left", padx=5)
+        time_entry.bind("<Return>", lambda _: jump())
+        ttk.Button(controls, text="Go", command=jump).pack(side="left")
+        ttk.Button(controls, text="Refresh", command=load).pack(side="right")
 
         def refresh_loop() -> None:
             load()
@@ -1419,126 +2249,23 @@ class RaceLoggerGUI:
         if not trees:
             return
 
-        for t in trees:
-            t.delete(*t.get_children())
-        pit_path = find_log_file("pitstop_log.csv")
-        stand_path = find_log_file("standings_log.csv")
-
-        pit_rows = []
-        if pit_path.exists():
-            _, pit_rows = read_csv_file(pit_path)
-
-        stand_rows = []
-        if stand_path.exists():
-            _, stand_rows = read_csv_file(stand_path)
-
-        latest_stand: dict[str, dict[str, str]] = {}
-        for r in stand_rows:
-            car = r.get("CarIdx")
-            if not car:
-                continue
-            if car not in latest_stand or r.get("Time", "") > latest_stand[car].get("Time", ""):
-                latest_stand[car] = r
-
-        last_pit: dict[str, dict[str, str]] = {}
-        race_start = None
-        for r in pit_rows:
-            car = r.get("CarIdx")
-            if not car:
-                continue
-            try:
-                ts = datetime.fromisoformat(r.get("Stint End Timestamp"))
-            except Exception:
-                continue
-            if race_start is None:
-                try:
-                    race_start = datetime.fromisoformat(r.get("Stint Start Timestamp"))
-                except Exception:
-                    pass
-            if car not in last_pit or ts > datetime.fromisoformat(last_pit[car]["Stint End Timestamp"]):
-                last_pit[car] = r
-
-        if race_start is None:
-            start_times = []
-            for r in stand_rows:
-                try:
-                    start_times.append(datetime.fromisoformat(r.get("Time")))
-                except Exception:
+        def render(rows: list[list[Any]]) -> None:
+            for t in trees:
+                # the Stint Tracker window may have closed while the job ran
+                if not getattr(t, "winfo_exists", lambda: True)():
                     continue
-            if start_times:
-                race_start = min(start_times)
-
-        if race_start is None:
-            race_start = datetime.now()
-        if getattr(self, "race_end_override", None) is not None:
-            race_end = self.race_end_override  # type: ignore[assignment]
-        else:
-            race_end = race_start + timedelta(hours=24)
-
-        avg_dur: dict[str, float] = {}
-        counts: dict[str, int] = {}
-        for r in pit_rows:
-            car = r.get("CarIdx")
-            try:
-                d = float(r.get("Stint Duration (sec)", 0))
-            except Exception:
-                continue
-            avg_dur[car] = avg_dur.get(car, 0.0) + d
-            counts[car] = counts.get(car, 0) + 1
-        for car in avg_dur:
-            avg_dur[car] /= counts.get(car, 1)
-
-        rows = []
-
-        now = datetime.now()
-        for car, info in latest_stand.items():
-            driver = info.get("UserName", info.get("Driver", ""))
-            team = info.get("TeamName", info.get("Team", ""))
-            cls = info.get("CarClassID", info.get("Class", ""))
-            try:
-                cur_lap = int(info.get("Lap", 0))
-            except Exception:
-                cur_lap = 0
-
-            lp = last_pit.get(car)
-            last_lap = int(lp.get("Stint End Lap", 0)) if lp else cur_lap
-            try:
-                last_end = datetime.fromisoformat(lp.get("Stint End Timestamp")) if lp else race_start
-            except Exception:
-                last_end = race_start
+                binder_for(t).update((vals[0], vals, ()) for vals in rows)
 
-            stint_laps = max(0, cur_lap - last_lap)
-            since_sec = (now - last_end).total_seconds()
+        model = getattr(self, "stint_model", None)
+        if model is None:
+            model = self.stint_model = StintModel()
+        override = getattr(self, "race_end_override", None)
 
-            expected_raw = avg_dur.get(car, 3600.0)
-            sanitized = (
-                expected_raw if expected_raw is not None and expected_raw > 0 else 1800
-            )
-            until_sec = max(0.0, sanitized - since_sec)
-            pits_left = estimate_remaining_pits(
-                race_end, now, expected_raw, fallback=1800
-            )
+        def compute() -> list[list[Any]]:
+            model.update()
+            return model.rows(override)
 
-            def fmt(sec: float) -> str:
-                h = int(sec // 3600)
-                m = int((sec % 3600) // 60)
-                s = int(sec % 60)
-                return f"{h}:{m:02d}:{s:02d}" if h else f"{m}:{s:02d}"
-
-            rows.append([
-                car,
-                driver,
-                team,
-                cls,
-                stint_laps,
-                fmt(since_sec),
-                fmt(until_sec),
-                pits_left,
-            ])
-
-        for t in trees:
-            for vals in rows:
-                t.insert("", "end", values=vals)
+        run_job(self, "stint-table", compute, render)
 
         self.root.after(3000, self.update_stint_table)
 
@@ -1785,17 +2512,20 @@ class RaceLoggerGUI:
                     ]
                     self._current_tags.append(f"fg-{colour}")
 
-    def insert_with_ansi(self, text: str) -> None:
+    def ansi_spans(self, text: str, spans: list[list[Any]]) -> None:
+        """Split *text* on ANSI codes and add the tagged pieces to *spans*."""
         pos = 0
         for m in self._ansi_re.finditer(text):
-            if m.start() > pos:
-                self.log_box.insert(
-                    "end", text[pos : m.start()], tuple(self._current_tags)
-                )
+            append_span(spans, text[pos : m.start()], tuple(self._current_tags))
             self._apply_ansi_codes(m.group(1).split(";"))
             pos = m.end()
-        if pos < len(text):
-            self.log_box.insert("end", text[pos:], tuple(self._current_tags))
+        append_span(spans, text[pos:], tuple(self._current_tags))
+
+    def insert_with_ansi(self, text: str) -> None:
+        spans: list[list[Any]] = []
+        self.ansi_spans(text, spans)
+        for chunk, tags in spans:
+            self.log_box.insert("end", chunk, tags)
 
     # ── live race feed handling ─────────────────────────────────
     def add_event(self, event_type: str, message: str) -> None:
@@ -1848,19 +2578,46 @@ class RaceLoggerGUI:
         self.feed_text.see("end")
         self.root.after(3000, self.update_feed)
 
-    def update_log_box(self):
+    def process_worker_results(self) -> None:
         try:
-            while True:
+            self.worker.drain()
+        finally:
+            self.root.after(50, self.process_worker_results)
+
+    def update_log_box(self):
+        """Move queued output into the log box in one batch per frame.
+
+        Lines are drained until the queue is empty or
+        :data:`LOG_FRAME_BUDGET` is used up.  Runs of text with the same
+        tags are inserted with a single Tk call, the box is trimmed to
+        ``log_max_lines`` and scrolled once.  A backlog is picked up again
+        on the next idle cycle instead of after the usual 100 ms.
+        """
+        deadline = time.perf_counter() + LOG_FRAME_BUDGET
+        spans: list[list[Any]] = []
+        backlog = False
+        while True:
+            try:
                 line = self.log_queue.get_nowait()
-                self.log_box.configure(state="normal")
-                self.insert_with_ansi(line)
-                self.parse_event(line)
-                if self.auto_scroll.get():
-                    self.log_box.see("end")
-                self.log_box.configure(state="disabled")
-        except Empty:
-            pass
-        self.root.after(100, self.update_log_box)
+            except Empty:
+                break
+            self.ansi_spans(line, spans)
+            self.parse_event(line)
+            if time.perf_counter() >= deadline:
+                backlog = True
+                break
+        if spans:
+            box = self.log_box
+            box.configure(state="normal")
+            box.insert("end", *(item for span in spans for item in span))
+            limit = getattr(self, "log_max_lines", LOG_BOX_MAX_LINES)
+            excess = int(box.index("end-1c").split(".")[0]) - limit
+            if limit > 0 and excess > 0:
+                box.delete("1.0", f"{excess + 1}.0")
+            if self.auto_scroll.get():
+                box.see("end")
+            box.configure(state="disabled")
+        self.root.after(1 if backlog else 100, self.update_log_box)
 
     def on_close(self):
         if self.proc:
@@ -1870,6 +2627,7 @@ class RaceLoggerGUI:
                 return
         if self.feed_window is not None and self.feed_window.winfo_exists():
             self.feed_window.destroy()
+        self.worker.shutdown()
         self.root.destroy()
 
 
@@ -1911,6 +2669,13 @@ def parse_cli(argv: list[str] | None = None) -> argparse.Namespace:
         type=_parse_time,
         help="remaining race time (H:M:S or seconds)",
     )
+    parser.add_argument(
+        "--log-lines",
+        metavar="N",
+        type=int,
+        default=LOG_BOX_MAX_LINES,
+        help=f"lines kept in the log box, 0 for no limit (default {LOG_BOX_MAX_LINES})",
+    )
     parser.add_argument(
         "--version",
         action="version",
@@ -2082,7 +2847,10 @@ def main(argv: list[str] | None = None) -> int:
     else:
         try:
             gui = RaceLoggerGUI(
-                root, classic_theme=args.classic_theme, time_left=args.time_left
+                root,
+                classic_theme=args.classic_theme,
+                time_left=args.time_left,
+                log_lines=args.log_lines,
             )
         except TypeError:  # tests may monkeypatch RaceLoggerGUI
             gui = RaceLoggerGUI(root)  # type: ignore[arg-type]
@@ -1,99 +1,271 @@
+from __future__ import annotations
+
 try:
     import pandas as pd
 except Exception:
     pd = None
+import csv
+import os
 import time
+from pathlib import Path
+from typing import Iterator
 
 INPUT = "standings_log.csv"
 OUTPUT = "sorted_standings.csv"
 
+# group bursts of writes to the standings log into one sorter run
+DEBOUNCE_MS = 100
+# polling interval when watchfiles is not installed
+POLL_INTERVAL = 1.0
+
 CAR_CLASS_MAP = {  # extend as needed
     "2708": "GT3",
     "4074": "Hypercar",
 }
 
+OUTPUT_COLUMNS = [
+    "Team",
+    "Driver",
+    "Class",
+    "Pos",
+    "Class Pos",
+    "Laps",
+    "Pits",
+    "Avg Lap",
+    "Best Lap",
+    "Last Lap",
+    "In Pit",
+]
+
 
 def class_name(cid: str) -> str:
     return CAR_CLASS_MAP.get(str(cid), f"Class {cid}")
 
 
+def _prepare(df):
+    """Convert the numeric standings columns of ``df`` in place."""
+    # ⬇ new numeric conversions (unchanged)
+    for col in ["Position", "ClassPosition", "Lap", "BestLapTime", "LastLapTime"]:
+        df[col] = pd.to_numeric(df[col], errors="coerce")
+
+    # limit lap time precision
+    df["BestLapTime"] = df["BestLapTime"].round(3)
+    df["LastLapTime"] = df["LastLapTime"].round(3)
+    df["PitCount"] = (
+        pd.to_numeric(df["PitCount"], errors="coerce").fillna(0).astype(int)
+    )
+    return df
+
+
+def _avg_laps(df, cars) -> list:
+    """Return the mean ``LastLapTime`` for each of ``cars`` in one pass.
+
+    Only rows with a positive lap and lap time count; cars without such rows
+    get ``""``.
+    """
+    valid = df[(df.Lap > 0) & (df.LastLapTime > 0)]
+    means = valid.groupby("CarIdx")["LastLapTime"].mean().round(3)
+    return [means.get(car, "") for car in cars]
+
+
+def _write_sorted(latest, output: str) -> None:
+    """Write the latest row per car (with an ``Avg Lap`` column) to ``output``."""
+    latest["Class"] = latest["CarClassID"].apply(class_name)
+
+    # —— NEW: keep readable team column ——
+    latest.rename(
+        columns={
+            "TeamName": "Team",
+            "UserName": "Driver",
+            "Position": "Pos",
+            "ClassPosition": "Class Pos",
+            "Lap": "Laps",
+            "PitCount": "Pits",
+            "BestLapTime": "Best Lap",
+            "LastLapTime": "Last Lap",
+            "OnPitRoad": "In Pit",
+        },
+        inplace=True,
+    )
+
+    # determine class order based on the best overall position per class
+    class_leaders = latest.groupby("Class")["Pos"].min().sort_values()
+    order_map = {c: i for i, c in enumerate(class_leaders.index)}
+    latest["ClassOrder"] = latest["Class"].map(order_map)
+
+    latest.sort_values(by=["ClassOrder", "Pos"]).to_csv(
+        output, columns=OUTPUT_COLUMNS, index=False
+    )
+
+
 def sort_and_write():
     if pd is None:
         print("[ERR] pandas not installed – standings sorter disabled")
         return
     try:
-        df = pd.read_csv(INPUT)
-
-        # ⬇ new numeric conversions (unchanged)
-        for col in ["Position", "ClassPosition", "Lap", "BestLapTime", "LastLapTime"]:
-            df[col] = pd.to_numeric(df[col], errors="coerce")
-
-        # limit lap time precision
-        df["BestLapTime"] = df["BestLapTime"].round(3)
-        df["LastLapTime"] = df["LastLapTime"].round(3)
-        df["PitCount"] = (
-            pd.to_numeric(df["PitCount"], errors="coerce").fillna(0).astype(int)
-        )
+        df = _prepare(pd.read_csv(INPUT))
 
         # keep latest row / car
         idx = df.groupby("CarIdx")["Time"].idxmax()
         latest = df.loc[idx].copy()
-        latest["Class"] = latest["CarClassID"].apply(class_name)
-
-        # —— NEW: keep readable team column ——
-        latest.rename(
-            columns={
-                "TeamName": "Team",
-                "UserName": "Driver",
-                "Position": "Pos",
-                "ClassPosition": "Class Pos",
-                "Lap": "Laps",
-                "PitCount": "Pits",
-                "BestLapTime": "Best Lap",
-                "LastLapTime": "Last Lap",
-                "OnPitRoad": "In Pit",
-            },
-            inplace=True,
-        )
-
-        # optional per-car average (unchanged)
-        def avg(car):
-            v = df[(df.CarIdx == car) & (df.Lap > 0) & (df.LastLapTime > 0)][
-                "LastLapTime"
-            ]
-            return round(v.mean(), 3) if not v.empty else ""
-
-        latest["Avg Lap"] = latest["CarIdx"].apply(avg)
-
-        cols = [
-            "Team",
-            "Driver",
-            "Class",
-            "Pos",
-            "Class Pos",
-            "Laps",
-            "Pits",
-            "Avg Lap",
-            "Best Lap",
-            "Last Lap",
-            "In Pit",
-        ]
-
-        # determine class order based on the best overall position per class
-        class_leaders = latest.groupby("Class")["Pos"].min().sort_values()
-        order_map = {c: i for i, c in enumerate(class_leaders.index)}
-        latest["ClassOrder"] = latest["Class"].map(order_map)
-
-        latest.sort_values(by=["ClassOrder", "Pos"]).to_csv(
-            OUTPUT, columns=cols, index=False
-        )
+
+        latest["Avg Lap"] = _avg_laps(df, latest["CarIdx"])
+
+        _write_sorted(latest, OUTPUT)
         print("[OK] standings written →", OUTPUT)
     except Exception as e:
         print("[ERR]", e)
 
 
+class StandingsTail:
+    """Follow the standings log and keep the latest state per car in memory.
+
+    :meth:`update` only parses rows appended since the previous call, so each
+    cycle costs O(new rows) instead of re-reading the whole log.  When the
+    log is replaced (``rollover_log``) or truncated the state is rebuilt from
+    the start of the new file.
+    """
+
+    def __init__(self, path: str = INPUT) -> None:
+        self.path = path
+        self.reset()
+
+    def reset(self) -> None:
+        """Forget all state and start reading from the beginning of the file."""
+        self.offset = 0
+        self.file_id: tuple[int, int] | None = None
+        self.fields: list[str] | None = None
+        self.latest: dict[str, list[str]] = {}
+        self.lap_sum: dict[str, float] = {}
+        self.lap_count: dict[str, int] = {}
+
+    def update(self) -> int:
+        """Parse newly appended rows and return how many were added."""
+        try:
+            st = os.stat(self.path)
+        except FileNotFoundError:
+            return 0
+        file_id = (st.st_dev, st.st_ino)
+        if file_id != self.file_id or st.st_size < self.offset:
+            self.reset()
+            self.file_id = file_id
+        if st.st_size == self.offset:
+            return 0
+
+        with open(self.path, "rb") as f:
+            f.seek(self.offset)
+            data = f.read(st.st_size - self.offset)
+        # only consume complete lines; a partial row is read next time
+        end = data.rfind(b"\n")
+        if end < 0:
+            return 0
+        self.offset += end + 1
+        rdr = csv.reader(data[: end + 1].decode("utf-8", errors="replace").splitlines())
+        if self.fields is None:
+            self.fields = next(rdr, None)
+            if not self.fields:
+                return 0
+
+        fields = self.fields
+        n_fields = len(fields)
+        i_car = fields.index("CarIdx")
+        i_time = fields.index("Time")
+        i_lap = fields.index("Lap")
+        i_last = fields.index("LastLapTime")
+        latest, lap_sum, lap_count = self.latest, self.lap_sum, self.lap_count
+        count = 0
+        for row in rdr:
+            if len(row) != n_fields:
+                continue
+            count += 1
+            car = row[i_car]
+            prev = latest.get(car)
+            if prev is None or row[i_time] >= prev[i_time]:
+                latest[car] = row
+            try:
+                lap = float(row[i_lap])
+                last = float(row[i_last])
+            except ValueError:
+                continue
+            if lap > 0 and last > 0:
+                lap_sum[car] = lap_sum.get(car, 0.0) + round(last, 3)
+                lap_count[car] = lap_count.get(car, 0) + 1
+        return count
+
+    def avg_lap(self, car: str):
+        """Return the mean ``LastLapTime`` of ``car`` or ``""`` when unknown."""
+        count = self.lap_count.get(car)
+        return round(self.lap_sum[car] / count, 3) if count else ""
+
+    def sort_and_write(self, output: str | None = None) -> None:
+        """Write the sorted standings built from the in-memory state."""
+        if pd is None:
+            print("[ERR] pandas not installed – standings sorter disabled")
+            return
+        output = output or OUTPUT
+        if not self.latest:
+            return
+        try:
+            latest = _prepare(pd.DataFrame(list(self.latest.values()), columns=self.fields))
+            latest["Avg Lap"] = [self.avg_lap(car) for car in self.latest]
+            _write_sorted(latest, output)
+            print("[OK] standings written →", output)
+        except Exception as e:
+            print("[ERR]", e)
+
+
+def watch_changes(path: str, debounce_ms: int = DEBOUNCE_MS) -> Iterator[None]:
+    """Yield whenever ``path`` may have changed.
+
+    Uses :func:`watchfiles.watch` on the parent directory so the file being
+    replaced by ``rollover_log`` is noticed too, and blocks without using CPU
+    between changes.  Falls back to polling the file's size and mtime when
+    watchfiles is not installed.
+    """
+    target = Path(path).resolve()
+    try:
+        from watchfiles import watch
+    except ModuleNotFoundError:
+        watch = None
+
+    if watch is not None:
+        for _ in watch(
+            target.parent,
+            watch_filter=lambda _change, p: Path(p).name == target.name,
+            debounce=debounce_ms,
+            step=min(50, debounce_ms),
+            recursive=False,
+        ):
+            yield
+        return
+
+    last = None
+    while True:
+        try:
+            st = target.stat()
+            cur = (st.st_size, st.st_mtime_ns)
+        except FileNotFoundError:
+            cur = None
+        if cur != last:
+            last = cur
+            yield
+        time.sleep(POLL_INTERVAL)
+
+
+def run(path: str | None = None, output: str | None = None,
+        debounce_ms: int = DEBOUNCE_MS) -> None:
+    """Re-sort the standings each time the standings logger appends a tick."""
+    tail = StandingsTail(path or INPUT)
+    if tail.update():
+        tail.sort_and_write(output)
+    for _ in watch_changes(tail.path, debounce_ms):
+        if tail.update():
+            tail.sort_and_write(output)
+
+
 if __name__ == "__main__":
     print("Standings sorter running. Ctrl-C to stop.")
-    while True:
-        sort_and_write()
-        time.sleep(5)
+    try:
+        run()
+    except KeyboardInterrupt:
+        pass
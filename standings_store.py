@@ -0,0 +1,237 @@
+"""Compact binary store for the standings stream.
+
+Each standings row is stored as a fixed-width little-endian record (see
+:data:`RECORD_DTYPE`) after a small file header.  Team and driver names are
+kept once in a ``<name>.names.csv`` side file and referenced by id, so a
+record is 37 bytes instead of a ~75 byte CSV line and needs no parsing.
+
+:func:`load` memory-maps the records as a NumPy structured array without
+copying them and :func:`to_dataframe` turns that into a pandas DataFrame
+with the same columns as ``standings_log.csv``.
+"""
+
+from __future__ import annotations
+
+import csv
+import os
+import shutil
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Iterable
+
+import numpy as np
+
+MAGIC = b"EECSTD\x00\x01"
+VERSION = 1
+HEADER_SIZE = 64
+
+RECORD_DTYPE = np.dtype(
+    [
+        ("time", "<f8"),            # wall-clock seconds since 1970-01-01
+        ("car_idx", "<i2"),
+        ("class_id", "<i4"),
+        ("position", "<i2"),
+        ("class_position", "<i2"),
+        ("lap", "<i4"),
+        ("best_lap", "<f4"),
+        ("last_lap", "<f4"),
+        ("on_pit", "u1"),
+        ("pit_count", "<i2"),
+        ("driver_id", "<i4"),       # row in the names side file
+    ]
+)
+
+NAMES_HEADER = ["DriverId", "TeamName", "UserName"]
+
+
+def names_path(path: str | Path) -> Path:
+    """Return the side file holding the team/driver names for ``path``."""
+    p = Path(path)
+    return p.with_name(p.stem + ".names.csv")
+
+
+def _header() -> bytes:
+    head = MAGIC + np.array([VERSION, RECORD_DTYPE.itemsize], dtype="<u4").tobytes()
+    return head.ljust(HEADER_SIZE, b"\x00")
+
+
+_EPOCH = datetime(1970, 1, 1)
+
+
+def _epoch(ts: datetime | float) -> float:
+    """Return ``ts`` as seconds since 1970-01-01 in the same wall-clock time
+    the CSV logs use, so :func:`to_dataframe` gives back identical times."""
+    if not isinstance(ts, datetime):
+        return float(ts)
+    if ts.tzinfo is not None:
+        ts = ts.replace(tzinfo=None)
+    return (ts - _EPOCH).total_seconds()
+
+
+def _int(val: Any, default: int = -1) -> int:
+    try:
+        return int(val)
+    except (TypeError, ValueError):
+        return default
+
+
+def _float(val: Any) -> float:
+    try:
+        return float(val)
+    except (TypeError, ValueError):
+        return float("nan")
+
+
+class StandingsWriter:
+    """Append standings records to a binary store.
+
+    The file stays open between ticks; :meth:`append` writes one tick's rows
+    with a single ``write`` call and flushes so readers see whole records.
+    With ``truncate`` an existing store and its names file are emptied, like
+    the standings CSV when the logger starts.
+    """
+
+    def __init__(self, path: str | Path, truncate: bool = False) -> None:
+        self.path = Path(path)
+        self._names: dict[tuple[str, str], int] = {}
+        self._open(truncate)
+
+    def _open(self, truncate: bool = False) -> None:
+        self._names.clear()
+        new = truncate or not self.path.exists() or self.path.stat().st_size == 0
+        if not new:
+            _check_header(self.path)
+            for did, team, user in _read_names(self.path):
+                self._names[(team, user)] = did
+        self._fh = open(self.path, "wb" if truncate else "ab")
+        if new:
+            self._fh.write(_header())
+            self._fh.flush()
+        npath = names_path(self.path)
+        new_names = truncate or not npath.exists()
+        self._names_fh = open(npath, "w" if truncate else "a", newline="", encoding="utf-8")
+        self._names_wr = csv.writer(self._names_fh)
+        if new_names:
+            self._names_wr.writerow(NAMES_HEADER)
+
+    def driver_id(self, team: str, user: str) -> int:
+        """Return the id for ``team``/``user``, adding it to the names file."""
+        key = (team or "", user or "")
+        did = self._names.get(key)
+        if did is None:
+            did = self._names[key] = len(self._names)
+            self._names_wr.writerow([did, *key])
+            self._names_fh.flush()
+        return did
+
+    def append(self, ts: datetime | float, rows: Iterable[Iterable[Any]]) -> int:
+        """Write standings ``rows`` (``ai_standings_logger.HEADER`` order minus
+        ``Time``) captured at ``ts`` and return the number of records."""
+        when = _epoch(ts)
+        recs = [
+            (
+                when,
+                _int(idx),
+                _int(cls_id),
+                _int(pos),
+                _int(cpos),
+                _int(lap),
+                _float(best),
+                _float(last),
+                1 if on_pit and on_pit != "False" else 0,
+                _int(pits, 0),
+                self.driver_id(team, user),
+            )
+            for idx, team, user, cls_id, pos, cpos, lap, best, last, on_pit, pits in rows
+        ]
+        if recs:
+            self._fh.write(np.array(recs, dtype=RECORD_DTYPE).tobytes())
+            self._fh.flush()
+        return len(recs)
+
+    def rollover(self, dest_dir: str | Path = "RaceLogs") -> None:
+        """Archive the store next to the CSV logs and start a fresh one."""
+        self.close()
+        dest = Path(dest_dir)
+        dest.mkdir(exist_ok=True)
+        ts = datetime.now().strftime("%Y%m%d_%H%M%S")
+        archived = dest / f"{self.path.stem}_{ts}{self.path.suffix}"
+        for src, dst in (
+            (self.path, archived),
+            (names_path(self.path), names_path(archived)),
+        ):
+            try:
+                shutil.move(str(src), dst)
+            except FileNotFoundError:
+                pass
+        self._open()
+
+    def close(self) -> None:
+        for fh in (getattr(self, "_fh", None), getattr(self, "_names_fh", None)):
+            if fh is not None and not fh.closed:
+                fh.close()
+
+
+def _check_header(path: Path) -> None:
+    with open(path, "rb") as f:
+        head = f.read(HEADER_SIZE)
+    if len(head) < HEADER_SIZE or not head.startswith(MAGIC):
+        raise ValueError(f"{path} is not a standings store")
+    version, itemsize = np.frombuffer(head, dtype="<u4", count=2, offset=len(MAGIC))
+    if version != VERSION or itemsize != RECORD_DTYPE.itemsize:
+        raise ValueError(f"{path}: unsupported store version {version}")
+
+
+def _read_names(path: str | Path) -> list[tuple[int, str, str]]:
+    npath = names_path(path)
+    if not npath.exists():
+        return []
+    with open(npath, newline="", encoding="utf-8") as f:
+        return [
+            (int(r["DriverId"]), r["TeamName"], r["UserName"])
+            for r in csv.DictReader(f)
+        ]
+
+
+def load(path: str | Path) -> np.ndarray:
+    """Return the records in ``path`` as a read-only memory-mapped array.
+
+    A partially written trailing record is ignored.
+    """
+    path = Path(path)
+    _check_header(path)
+    count = (os.path.getsize(path) - HEADER_SIZE) // RECORD_DTYPE.itemsize
+    if count <= 0:
+        return np.empty(0, dtype=RECORD_DTYPE)
+    return np.memmap(path, dtype=RECORD_DTYPE, mode="r", offset=HEADER_SIZE, shape=(count,))
+
+
+def to_dataframe(path: str | Path):
+    """Return the store as a DataFrame with ``standings_log.csv`` columns."""
+    import pandas as pd
+
+    recs = load(path)
+    names = _read_names(path)
+    teams = np.array([""] * (len(names) or 1), dtype=object)
+    users = teams.copy()
+    for did, team, user in names:
+        teams[did] = team
+        users[did] = user
+    ids = recs["driver_id"]
+    return pd.DataFrame(
+        {
+            "Time": pd.to_datetime(recs["time"], unit="s"),
+            "CarIdx": recs["car_idx"],
+            "TeamName": teams[ids],
+            "UserName": users[ids],
+            "CarClassID": recs["class_id"],
+            "Position": recs["position"],
+            "ClassPosition": recs["class_position"],
+            "Lap": recs["lap"],
+            "BestLapTime": recs["best_lap"],
+            "LastLapTime": recs["last_lap"],
+            "OnPitRoad": recs["on_pit"].astype(bool),
+            "PitCount": recs["pit_count"],
+        },
+        copy=False,
+    )
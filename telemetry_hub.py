@@ -0,0 +1,375 @@
+"""Shared iRacing telemetry acquisition.
+
+A single :class:`TelemetryHub` owns the ``irsdk`` connection, freezes the
+variable buffer once per tick and hands the resulting :class:`Snapshot` to
+every registered consumer.  The standings, pit-stop and lap-delta loggers
+all run in-process as consumers so the shared memory is only read once per
+tick and every consumer sees the same data.
+
+``--record`` saves the snapshots to a file and ``--replay`` feeds such a
+recording to the consumers instead of a live session (see
+:mod:`telemetry_replay`).
+"""
+
+from __future__ import annotations
+from datetime import datetime
+__version__     = "2025.06.07.0"
+__build_time__  = "2025-06-07T15:42:00Z"
+__commit_hash__ = "abc1234"
+
+import sys
+
+if getattr(sys, "frozen", False):
+    try:
+        setattr(sys, "_MEIPASS_VERSION", __version__)
+        setattr(sys, "_MEIPASS_BUILD", __build_time__)
+        setattr(sys, "_MEIPASS_COMMIT", __commit_hash__)
+        if __spec__ is not None:
+            __spec__.origin = f"{__spec__.origin}|{__version__}"
+    except Exception:
+        pass
+
+import argparse
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Optional
+
+from codebase_cleaner import check_latest_version
+
+import irsdk
+import numpy as np
+
+# Telemetry variables copied into every snapshot
+VARS = (
+    "SessionTime",
+    "SessionNum",
+    "CarIdxLap",
+    "CarIdxLapDistPct",
+    "CarIdxPosition",
+    "CarIdxClassPosition",
+    "CarIdxBestLapTime",
+    "CarIdxLastLapTime",
+    "CarIdxOnPitRoad",
+)
+
+
+@dataclass
+class Snapshot:
+    """Telemetry values captured from a single frozen var buffer.
+
+    Supports ``snapshot[key]`` look-ups like :class:`irsdk.IRSDK` so the
+    consumers can treat a snapshot and a live connection the same way.
+    :func:`capture` stores the per-car ``CarIdx*`` channels as NumPy arrays
+    indexed by ``CarIdx``; :meth:`array` returns any channel as an array.
+    """
+
+    wall_time: datetime
+    values: dict[str, Any] = field(default_factory=dict)
+    drivers: list[dict] = field(default_factory=list)
+
+    def __getitem__(self, key: str) -> Any:
+        if key == "DriverInfo":
+            return {"Drivers": self.drivers}
+        return self.values.get(key)
+
+    def array(self, key: str, dtype: Any = None) -> np.ndarray:
+        """Return channel ``key`` as a 1-D array, empty when it is missing."""
+        val = self.values.get(key)
+        if val is None:
+            return np.empty(0, dtype=dtype)
+        return np.asarray(val, dtype=dtype)
+
+
+def _read(ir: Any, key: str) -> Any:
+    try:
+        return ir[key]
+    except KeyError:
+        return None
+
+
+def capture(ir: Any) -> Snapshot:
+    """Freeze the var buffer of ``ir`` once and copy all :data:`VARS`.
+
+    The snapshot is stamped with the current time, or with the recorded
+    time when ``ir`` replays a recording.
+    """
+    freeze = getattr(ir, "freeze_var_buffer_latest", None)
+    if freeze is not None:
+        freeze()
+    try:
+        values = {key: _read(ir, key) for key in VARS}
+        for key in VARS:
+            if key.startswith("CarIdx") and values[key] is not None:
+                values[key] = np.asarray(values[key])
+        info = _read(ir, "DriverInfo") or {}
+        drivers = list(info.get("Drivers") or [])
+    finally:
+        unfreeze = getattr(ir, "unfreeze_var_buffer_latest", None)
+        if unfreeze is not None:
+            unfreeze()
+    return Snapshot(getattr(ir, "replay_time", None) or datetime.now(), values, drivers)
+
+
+@dataclass
+class _Subscription:
+    name: str
+    consumer: Any
+    interval: float
+    next_due: float = 0.0
+
+
+class TelemetryHub:
+    """Poll iRacing once per tick and fan the snapshot out to consumers.
+
+    Consumers are objects with a ``feed(snapshot)`` method and an optional
+    ``close()`` method.  Each consumer is fed at its own ``interval`` but a
+    snapshot is only captured when at least one consumer is due.
+
+    ``clock`` and ``sleep`` default to :func:`time.monotonic` and
+    :func:`time.sleep`; a replay passes its own to run on recorded time.
+    """
+
+    def __init__(
+        self,
+        ir: Optional[Any] = None,
+        *,
+        clock: Optional[Callable[[], float]] = None,
+        sleep: Optional[Callable[[float], None]] = None,
+    ) -> None:
+        self.ir = ir if ir is not None else irsdk.IRSDK()
+        self._subs: list[_Subscription] = []
+        self._clock = clock
+        self._sleep = sleep
+
+    def _now(self) -> float:
+        return (self._clock or time.monotonic)()
+
+    def add_consumer(self, name: str, consumer: Any, interval: float) -> None:
+        """Register ``consumer`` to receive a snapshot every ``interval`` seconds."""
+        self._subs.append(_Subscription(name, consumer, float(interval)))
+
+    def tick(self) -> Optional[Snapshot]:
+        """Capture one snapshot and feed it to every due consumer."""
+        now = self._now()
+        due = [s for s in self._subs if now >= s.next_due]
+        if not due:
+            return None
+        snap = capture(self.ir)
+        for sub in due:
+            try:
+                sub.consumer.feed(snap)
+            except Exception as e:
+                print(f"[ERR] {sub.name}: {e}", flush=True)
+            sub.next_due = now + sub.interval
+        return snap
+
+    def run(self) -> None:
+        """Main acquisition loop."""
+        self.ir.startup()
+        print("Waiting for iRacing session…")
+        while not (self.ir.is_initialized and self.ir.is_connected or getattr(self.ir, "finished", False)):
+            print("Not connected… waiting.")
+            time.sleep(2)
+        print(f"Connected to iRacing! Feeding {len(self._subs)} consumers.")
+        sleep = self._sleep or time.sleep
+        try:
+            while not getattr(self.ir, "finished", False):
+                if self.ir.is_initialized and self.ir.is_connected:
+                    self.tick()
+                    next_due = min((s.next_due for s in self._subs), default=self._now() + 1)
+                    sleep(max(0.0, next_due - self._now()))
+                else:
+                    time.sleep(2)
+            print("Replay finished.")
+        except KeyboardInterrupt:
+            print("Stopped by user.")
+        finally:
+            self.close()
+
+    def close(self) -> None:
+        """Close all consumers and the ``irsdk`` connection."""
+        for sub in self._subs:
+            close = getattr(sub.consumer, "close", None)
+            if close is None:
+                continue
+            try:
+                close()
+            except Exception as e:
+                print(f"[ERR] closing {sub.name}: {e}", flush=True)
+        try:
+            self.ir.shutdown()
+        except Exception:
+            pass
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    import ai_standings_logger
+    import driver_swap_logger
+    import lap_delta_logger
+    import pitstop_logger_enhanced
+
+    parser = argparse.ArgumentParser(description="Shared iRacing telemetry acquisition")
+    parser.add_argument("--db", help="SQLite database path")
+    parser.add_argument(
+        "--standings-output",
+        default=ai_standings_logger.DEFAULT_CSV_PATH,
+        help="Standings CSV output file (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--standings-interval",
+        type=ai_standings_logger.interval_arg,
+        default=ai_standings_logger.DEFAULT_INTERVAL,
+        help="Standings logging interval in seconds, down to 1/60 (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--standings-changes-only",
+        action="store_true",
+        help="only log a car when its position, lap, pit state or lap times change",
+    )
+    parser.add_argument(
+        "--standings-binary",
+        metavar="PATH",
+        help="also write a compact binary standings store (see standings_store)",
+    )
+    parser.add_argument(
+        "--standings-flush-interval",
+        type=float,
+        default=0.0,
+        help="seconds between standings CSV writes, 0 = every tick (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--pit-output",
+        default=pitstop_logger_enhanced.CSV_FILE,
+        help="Pit stop CSV output file (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--driver-total",
+        default=pitstop_logger_enhanced.DRIVER_TOTAL_FILE,
+        help="Driver totals CSV (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--pit-overlay",
+        default=pitstop_logger_enhanced.OVERLAY_FILE,
+        help="Pit stop HTML overlay (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--pit-interval",
+        type=float,
+        default=pitstop_logger_enhanced.DEFAULT_INTERVAL,
+        help="Pit detection interval in seconds (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--lap-delta-output",
+        default=lap_delta_logger.CSV_PATH,
+        help="Lap delta CSV output file (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--intervals-output",
+        default=lap_delta_logger.INTERVALS_PATH,
+        help="Gap/interval table for overlays (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--lap-delta-interval",
+        type=float,
+        default=lap_delta_logger.DEFAULT_INTERVAL,
+        help="Lap delta interval in seconds (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--swap-output",
+        default=driver_swap_logger.CSV_PATH,
+        help="Driver swap CSV output file (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--swap-interval",
+        type=float,
+        default=driver_swap_logger.DEFAULT_INTERVAL,
+        help="Driver swap detection interval in seconds (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--record",
+        metavar="PATH",
+        help="also save every snapshot to a compressed recording",
+    )
+    parser.add_argument(
+        "--replay",
+        metavar="PATH",
+        help="feed a recording to the loggers instead of a live session",
+    )
+    parser.add_argument(
+        "--replay-speed",
+        type=float,
+        default=1.0,
+        help="replay rate relative to real time, 0 = as fast as possible (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--version",
+        action="version",
+        version=f"EEC Logger v{__version__} (build {__build_time__}, git {__commit_hash__})",
+    )
+    args, _ = parser.parse_known_args(argv)
+    return args
+
+
+def build_hub(args: argparse.Namespace, ir: Optional[Any] = None) -> TelemetryHub:
+    """Return a hub with the standings, pit-stop, lap-delta and swap consumers."""
+    import ai_standings_logger
+    import driver_swap_logger
+    import lap_delta_logger
+    import pitstop_logger_enhanced
+    import telemetry_replay
+
+    if ir is None and getattr(args, "replay", None):
+        ir = telemetry_replay.ReplayIRSDK(args.replay, args.replay_speed)
+    if isinstance(ir, telemetry_replay.ReplayIRSDK):
+        hub = TelemetryHub(ir, clock=ir.clock, sleep=ir.sleep)
+    else:
+        hub = TelemetryHub(ir)
+    hub.add_consumer(
+        "Standings",
+        ai_standings_logger.StandingsLogger(
+            args.standings_output,
+            args.db,
+            args.standings_binary,
+            args.standings_flush_interval,
+            changes_only=args.standings_changes_only,
+            timespec=ai_standings_logger.time_spec(args.standings_interval),
+        ),
+        args.standings_interval,
+    )
+    hub.add_consumer(
+        "Pit Stops",
+        pitstop_logger_enhanced.PitStopLogger(
+            args.pit_output, args.driver_total, args.db, args.pit_overlay
+        ),
+        args.pit_interval,
+    )
+    hub.add_consumer(
+        "Lap Delta",
+        lap_delta_logger.LapDeltaLogger(
+            args.lap_delta_output, intervals_path=args.intervals_output
+        ),
+        args.lap_delta_interval,
+    )
+    hub.add_consumer(
+        "Driver Swaps",
+        driver_swap_logger.DriverSwapLogger(args.swap_output, args.db),
+        args.swap_interval,
+    )
+    if getattr(args, "record", None):
+        hub.add_consumer(
+            "Recorder",
+            telemetry_replay.TelemetryRecorder(args.record),
+            min(s.interval for s in hub._subs),
+        )
+    return hub
+
+
+def main(argv: list[str] | None = None) -> None:
+    args = parse_args(argv)
+    build_hub(args).run()
+
+
+if __name__ == "__main__":
+    import threading
+    threading.Thread(target=check_latest_version, args=(__version__,), daemon=True).start()
+    main()
@@ -0,0 +1,171 @@
+"""Record iRacing telemetry and play it back without the sim.
+
+:class:`TelemetryRecorder` is a :class:`telemetry_hub.TelemetryHub` consumer
+that appends every snapshot to a gzip-compressed JSON-lines file.  The
+first line is a header, each further line holds one tick::
+
+    {"t": <wall-clock seconds>, "v": {<var>: <value>, ...}, "d": [<drivers>]}
+
+``"d"`` is only present when ``DriverInfo`` changed since the previous
+tick, which keeps a 24 h recording small.
+
+:class:`ReplayIRSDK` is a drop-in for :class:`irsdk.IRSDK` that serves the
+recorded frames.  Its :meth:`~ReplayIRSDK.clock` and
+:meth:`~ReplayIRSDK.sleep` methods replace ``time.monotonic`` and
+``time.sleep`` in the hub so a recording can be played back at real time,
+at any multiple of it, or as fast as possible (``speed=0``).
+"""
+
+from __future__ import annotations
+
+import gzip
+import json
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Iterator
+
+FORMAT = "eec-telemetry"
+VERSION = 1
+
+_EPOCH = datetime(1970, 1, 1)
+
+
+def _epoch(ts: datetime) -> float:
+    if ts.tzinfo is not None:
+        ts = ts.replace(tzinfo=None)
+    return (ts - _EPOCH).total_seconds()
+
+
+def _json_default(obj: Any) -> Any:
+    # NumPy arrays and scalars
+    tolist = getattr(obj, "tolist", None)
+    if tolist is not None:
+        return tolist()
+    raise TypeError(f"cannot record {type(obj).__name__}")
+
+
+class TelemetryRecorder:
+    """Append snapshots to a compressed recording."""
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        self._fh = gzip.open(self.path, "wt", encoding="utf-8")
+        self._fh.write(json.dumps({"format": FORMAT, "version": VERSION}) + "\n")
+        self._drivers: list[dict] | None = None
+        self.frames = 0
+
+    def feed(self, snap) -> None:
+        frame: dict[str, Any] = {"t": _epoch(snap.wall_time), "v": snap.values}
+        if snap.drivers != self._drivers:
+            self._drivers = list(snap.drivers)
+            frame["d"] = self._drivers
+        self._fh.write(json.dumps(frame, separators=(",", ":"), default=_json_default) + "\n")
+        self.frames += 1
+
+    def close(self) -> None:
+        if not self._fh.closed:
+            self._fh.close()
+
+
+def read_frames(path: str | Path) -> Iterator[tuple[float, dict, list]]:
+    """Yield ``(time, values, drivers)`` for every frame in a recording."""
+    drivers: list[dict] = []
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        header = json.loads(f.readline() or "{}")
+        if header.get("format") != FORMAT:
+            raise ValueError(f"{path} is not a telemetry recording")
+        if header.get("version") != VERSION:
+            raise ValueError(f"{path}: unsupported recording version {header.get('version')}")
+        for line in f:
+            try:
+                frame = json.loads(line)
+            except ValueError:
+                break                       # truncated last line of a live recording
+            if "d" in frame:
+                drivers = frame["d"]
+            yield frame["t"], frame["v"], drivers
+
+
+class ReplayIRSDK:
+    """Serve a recording through the parts of :class:`irsdk.IRSDK` the loggers use.
+
+    ``speed`` is the playback rate relative to the recorded time; ``0``
+    plays back as fast as possible.  :meth:`freeze_var_buffer_latest`
+    selects the newest frame recorded at or before the replay clock, so
+    consumers polling slower than the recording skip frames just like they
+    would live.  Once the recording is exhausted :attr:`finished` becomes
+    true and the connection reports itself as closed.
+    """
+
+    def __init__(self, path: str | Path, speed: float = 1.0) -> None:
+        self.path = Path(path)
+        self.speed = float(speed)
+        self.is_initialized = False
+        self.finished = False
+        self._frames: Iterator[tuple[float, dict, list]] | None = None
+        self._current: tuple[float, dict, list] | None = None
+        self._next: tuple[float, dict, list] | None = None
+        self._now = 0.0
+        self._started = 0.0
+
+    @property
+    def is_connected(self) -> bool:
+        return self.is_initialized and not self.finished
+
+    def startup(self) -> bool:
+        self._frames = read_frames(self.path)
+        self._next = next(self._frames, None)
+        if self._next is None:
+            self.finished = True
+        else:
+            self._now = self._next[0]
+            self._started = time.monotonic()
+        self.is_initialized = True
+        return True
+
+    def shutdown(self) -> None:
+        close = getattr(self._frames, "close", None)
+        if close is not None:
+            close()
+        self.is_initialized = False
+
+    # ── clock used by the hub ───────────────────────────────────────
+    def clock(self) -> float:
+        """Return the replay time in recorded seconds."""
+        if self.speed > 0:
+            return self._now + (time.monotonic() - self._started) * self.speed
+        return self._now
+
+    def sleep(self, seconds: float) -> None:
+        """Let ``seconds`` of recorded time pass."""
+        if self.speed > 0:
+            time.sleep(seconds / self.speed)
+        else:
+            self._now += seconds
+
+    # ── irsdk.IRSDK interface ───────────────────────────────────────
+    def freeze_var_buffer_latest(self) -> None:
+        now = self.clock()
+        while self._next is not None and (self._next[0] <= now or self._current is None):
+            self._current = self._next
+            self._next = next(self._frames, None)
+        if self._next is None and (self._current is None or now >= self._current[0]):
+            self.finished = True
+
+    def unfreeze_var_buffer_latest(self) -> None:
+        pass
+
+    @property
+    def replay_time(self) -> datetime | None:
+        """Recorded wall-clock time of the current frame."""
+        if self._current is None:
+            return None
+        return _EPOCH + timedelta(seconds=self._current[0])
+
+    def __getitem__(self, key: str) -> Any:
+        if self._current is None:
+            raise KeyError(key)
+        if key == "DriverInfo":
+            return {"Drivers": self._current[2]}
+        return self._current[1][key]
@@ -0,0 +1,59 @@
+"""Fixtures shared by the logger tests.
+
+The loggers import ``irsdk``, which is not needed to feed them snapshots;
+the ``hub`` fixture puts a stub in its place before importing
+:mod:`telemetry_hub`.
+"""
+
+import sys
+import types
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+START = datetime(2025, 6, 7, 12, 0)
+
+DRIVERS = [
+    {
+        "CarIdx": 0,
+        "TeamName": "Team <A>",
+        "UserName": "DriverA",
+        "CarClassID": 2708,
+        "CarClassShortName": "GT3",
+    },
+    {
+        "CarIdx": 1,
+        "TeamName": "TeamB",
+        "UserName": "DriverB",
+        "CarClassID": 4074,
+        "CarClassShortName": "GT4",
+    },
+]
+
+
+@pytest.fixture
+def drivers():
+    """Return a copy of :data:`DRIVERS` that a test may modify."""
+    return [dict(d) for d in DRIVERS]
+
+
+@pytest.fixture
+def hub(monkeypatch):
+    """Return :mod:`telemetry_hub` imported with a stub ``irsdk``."""
+    monkeypatch.setitem(sys.modules, "irsdk", types.SimpleNamespace(IRSDK=object))
+    import telemetry_hub
+
+    return telemetry_hub
+
+
+@pytest.fixture
+def snap(hub):
+    """Return a factory for snapshots taken ``t`` seconds after :data:`START`."""
+
+    def make(t, values, drivers=DRIVERS):
+        return hub.Snapshot(START + timedelta(seconds=t), values, drivers)
+
+    return make
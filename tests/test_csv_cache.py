@@ -0,0 +1,69 @@
+import os
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from race_gui import CsvCache
+
+
+def test_only_appended_rows_are_parsed(tmp_path, monkeypatch):
+    path = tmp_path / "standings_log.csv"
+    path.write_text("A,B\n1,2\n3,")
+    cache = CsvCache()
+    assert cache.read(path) == (["A", "B"], [{"A": "1", "B": "2"}, {"A": "3", "B": ""}])
+
+    with path.open("a") as f:
+        f.write("4\n5,6\n")
+    fields, rows = cache.read(path)
+    assert rows == [{"A": "1", "B": "2"}, {"A": "3", "B": "4"}, {"A": "5", "B": "6"}]
+
+    first = rows[0]
+    rows.append("caller's own list")
+    parsed = []
+    real = cache._entries[os.path.abspath(path)].consume
+    monkeypatch.setattr(
+        cache._entries[os.path.abspath(path)], "consume", lambda data: (parsed.append(data), real(data))
+    )
+    with path.open("a") as f:
+        f.write("7,8\n")
+    _, rows = cache.read(path)
+    assert parsed == [b"7,8\n"]
+    assert rows[0] is first and len(rows) == 4
+    # nothing changed: not even opened
+    assert cache.read(path)[1] == rows and parsed == [b"7,8\n"]
+
+
+def test_truncated_replaced_and_rewritten_files_are_reparsed(tmp_path):
+    path = tmp_path / "standings_log.csv"
+    path.write_text("A\nold1\nold2\n")
+    cache = CsvCache()
+    cache.read(path)
+
+    path.write_text("A\nnew\n")                     # truncated
+    assert cache.read(path)[1] == [{"A": "new"}]
+
+    with path.open("r+") as f:                      # rewritten in place, longer
+        f.write("A\nNEW\nmore\n")
+    assert cache.read(path)[1] == [{"A": "NEW"}, {"A": "more"}]
+
+    tmp = tmp_path / "log.tmp"
+    tmp.write_text("B\nx\ny\nz\n")
+    os.replace(tmp, path)                           # replaced
+    assert cache.read(path) == (["B"], [{"B": "x"}, {"B": "y"}, {"B": "z"}])
+
+    path.write_text("")
+    assert cache.read(path) == ([], [])
+
+
+def test_file_rewritten_in_place_with_same_size_is_reparsed(tmp_path):
+    path = tmp_path / "sorted_standings.csv"
+    last = "3," + "C" * 100 + "\n"
+    path.write_text("Pos,Team\n1,A\n2,B\n" + last)
+    cache = CsvCache()
+    cache.read(path)
+
+    # the top two swap places; size and the last row stay the same
+    with path.open("r+") as f:
+        f.write("Pos,Team\n1,B\n2,A\n" + last)
+    os.utime(path, ns=(path.stat().st_atime_ns, path.stat().st_mtime_ns + 1_000_000))
+    assert [r["Team"][0] for r in cache.read(path)[1]] == ["B", "A", "C"]
@@ -0,0 +1,48 @@
+import csv
+import sqlite3
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+import driver_swap_logger
+
+
+def test_swaps_are_logged_on_the_tick_they_happen(tmp_path, monkeypatch, snap):
+    def tick(t, names, laps):
+        drivers = [
+            {"CarIdx": car, "TeamName": f"Team{car}", "UserName": name}
+            for car, name in names.items()
+        ]
+        drivers.append({"CarIdx": 9, "UserName": "Pace Car", "CarIsPaceCar": 1})
+        return snap(t, {"CarIdxLap": laps}, drivers)
+
+    monkeypatch.chdir(tmp_path)
+    db = tmp_path / "eec.db"
+    logger = driver_swap_logger.DriverSwapLogger("driver_swaps.csv", str(db))
+    logger.feed(tick(0, {0: "A", 2: "X"}, [5, 0, 7]))
+    logger.feed(tick(1, {0: "A", 2: "X"}, [5, 0, 7]))
+    logger.feed(tick(2, {0: "B", 2: "", 5: "Late"}, [6, 0, 7]))
+    logger.feed(tick(3, {0: "B", 2: "Y", 5: "Later"}, [6, 0, 8]))
+
+    with open("driver_swaps.csv", newline="") as f:
+        rows = list(csv.reader(f))
+    assert rows == [
+        driver_swap_logger.HEADER,
+        ["2025-06-07T12:00:02", "0", "Team0", "A", "B", "6"],
+        ["2025-06-07T12:00:03", "2", "Team2", "X", "Y", "8"],
+        # car 5 has no lap data
+        ["2025-06-07T12:00:03", "5", "Team5", "Late", "Later", ""],
+    ]
+    logger.close()
+
+    conn = sqlite3.connect(db)
+    assert conn.execute("SELECT car_idx, driver_out, driver_in, lap FROM driver_swaps").fetchall() == [
+        (0, "A", "B", 6),
+        (2, "X", "Y", 8),
+        (5, "Late", "Later", None),
+    ]
+    conn.close()
+
+    # a restarted logger keeps the existing file
+    driver_swap_logger.DriverSwapLogger("driver_swaps.csv").close()
+    assert len(Path("driver_swaps.csv").read_text().splitlines()) == 4
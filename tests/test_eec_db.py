@@ -1,8 +1,9 @@
+import sqlite3
 import sys
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
-from eec_db import init_db, insert
+from eec_db import BufferedWriter, init_db, insert, upsert_driver_totals
 
 
 def test_init_and_insert(tmp_path):
@@ -31,3 +32,81 @@ def test_init_and_insert(tmp_path):
     stored = conn.execute("SELECT * FROM standings").fetchone()
     conn.close()
     assert stored == row
+
+
+def test_buffered_writer_batches_and_flushes_on_close(tmp_path):
+    db_path = tmp_path / "test.db"
+    conn = init_db(db_path)
+    assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
+    writer = BufferedWriter(conn, flush_interval=60)
+    row = ("2021-01-01T00:00:00", 0, "TeamA", "DriverA", "2708", 1, 1, 5, 60.0, 61.0, 0, 0)
+    for i in range(3):
+        writer.add("standings", row)
+    assert writer.maybe_flush() == 0
+
+    reader = sqlite3.connect(db_path)
+    assert reader.execute("SELECT COUNT(*) FROM standings").fetchone()[0] == 0
+
+    writer.close()
+    assert reader.execute("SELECT COUNT(*) FROM standings").fetchone()[0] == 3
+    reader.close()
+
+
+def test_buffered_writer_flushes_per_tick_by_default(tmp_path):
+    conn = init_db(tmp_path / "test.db")
+    writer = BufferedWriter(conn)
+    writer.add("driver_swaps", ("2021-01-01T00:00:00", 1, "TeamA", "A", "B", 3))
+    assert writer.maybe_flush() == 1
+    assert conn.execute("SELECT COUNT(*) FROM driver_swaps").fetchone()[0] == 1
+    writer.close()
+
+
+def test_buffered_writer_ignores_empty_batches_and_retries_failed_rows(tmp_path, caplog):
+    conn = init_db(tmp_path / "test.db")
+    writer = BufferedWriter(conn, max_retries=1)
+    writer.add_many("standings", [])
+    swap = ("2021-01-01T00:00:00", 1, "TeamA", "A", "B", 3)
+    writer.add("driver_swaps", swap)
+    writer.add("no_such_table", (1,))
+    # a failed write is logged, not raised, and retried on the next flush
+    assert writer.flush() == 0
+    assert writer._count == 2
+    assert conn.execute("SELECT COUNT(*) FROM driver_swaps").fetchone()[0] == 0
+
+    # then the batch is dropped so the queue cannot grow without bound
+    assert writer.flush() == 0
+    assert writer._count == 0
+    assert "Dropping 2 rows" in caplog.text
+
+    writer.add("driver_swaps", swap)
+    assert writer.flush() == 1
+    assert conn.execute("SELECT COUNT(*) FROM driver_swaps").fetchone()[0] == 1
+    writer.close()
+
+
+def test_upsert_driver_totals_updates_in_place(tmp_path):
+    conn = init_db(tmp_path / "test.db")
+    upsert_driver_totals(conn, [("TeamA", "DriverA", 100.0, 2, 50.0), ("TeamB", "DriverB", 10.0, 1, 9.0)])
+    upsert_driver_totals(conn, [("TeamA", "DriverA", 160.0, 3, 49.5)])
+    rows = conn.execute("SELECT * FROM driver_totals ORDER BY team").fetchall()
+    conn.close()
+    assert rows == [("TeamA", "DriverA", 160.0, 3, 49.5), ("TeamB", "DriverB", 10.0, 1, 9.0)]
+
+
+def test_init_db_dedupes_driver_totals(tmp_path):
+    db_path = tmp_path / "old.db"
+    conn = sqlite3.connect(db_path)
+    conn.execute(
+        "CREATE TABLE driver_totals (team TEXT, driver TEXT, total_time REAL, total_laps INTEGER, best_lap REAL)"
+    )
+    conn.executemany(
+        "INSERT INTO driver_totals VALUES (?,?,?,?,?)",
+        [("TeamA", "DriverA", 1.0, 1, 1.0), ("TeamA", "DriverA", 2.0, 2, 1.0)],
+    )
+    conn.commit()
+    conn.close()
+
+    conn = init_db(db_path)
+    assert conn.execute("SELECT total_time FROM driver_totals").fetchall() == [(2.0,)]
+    conn.close()
@@ -397,3 +397,38 @@ def test_update_stint_table_works_without_pits(tmp_path, monkeypatch):
     assert inserted[0][0] == "1"
     assert inserted[0][5] == "10:00"
 
+
+def test_update_stint_table_skips_closed_window(tmp_path, monkeypatch):
+    monkeypatch.setattr("race_gui.find_log_file", lambda name: tmp_path / name)
+    (tmp_path / "standings_log.csv").write_text(
+        "Time,CarIdx,TeamName,UserName,CarClassID,Lap\n"
+        "2024-01-01T00:00:00,1,TeamA,DriverA,GT3,10\n"
+    )
+
+    class Tree:
+        def __init__(self, exists):
+            self.exists = exists
+            self.calls = []
+
+        def winfo_exists(self):
+            return self.exists
+
+        def get_children(self):
+            self.calls.append("get_children")
+            return ()
+
+        def insert(self, parent, index, iid, values, tags):
+            self.calls.append(("insert", iid))
+
+    class DummyRoot:
+        def after(self, *a, **k):
+            pass
+
+    closed, open_tree = Tree(False), Tree(True)
+    gui = types.SimpleNamespace(root=DummyRoot(), stint_tree=closed, stint_tab_tree=open_tree)
+    gui.update_stint_table = lambda: None
+    RaceLoggerGUI.update_stint_table(gui)
+
+    # the Stint Tracker window was closed: its tree is not touched at all
+    assert closed.calls == [] and not hasattr(closed, "_eec_binder")
+    assert open_tree.calls == [("insert", "1")]
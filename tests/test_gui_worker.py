@@ -0,0 +1,83 @@
+import sys
+import threading
+import time
+import types
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from race_gui import BackgroundWorker, run_job
+
+
+def wait_for(worker, results, n):
+    for _ in range(200):
+        worker.drain()
+        if len(results) >= n:
+            return
+        time.sleep(0.01)
+
+
+def test_superseded_results_are_dropped():
+    worker = BackgroundWorker()
+    gate = threading.Event()
+    calls, results = [], []
+
+    def job(n):
+        def run():
+            calls.append(n)
+            if n == 1:
+                gate.wait(5)
+            return n
+        return run
+
+    worker.submit("table", job(1), results.append)
+    time.sleep(0.05)
+    # submitted while job 1 runs: 2 is replaced by 3 before it starts
+    worker.submit("table", job(2), results.append)
+    worker.submit("table", job(3), results.append)
+    worker.submit("other", job(10), results.append)
+    gate.set()
+    wait_for(worker, results, 2)
+    time.sleep(0.05)
+    worker.drain()
+    worker.shutdown()
+
+    assert calls.count(2) == 0
+    assert sorted(results) == [3, 10]
+
+
+def test_results_are_delivered_by_drain_only():
+    worker = BackgroundWorker()
+    results = []
+    done = threading.Event()
+    worker.submit("k", lambda: (done.set(), "rows")[1], results.append)
+    done.wait(5)
+    time.sleep(0.05)
+    assert results == []
+    assert worker.drain() == 1 and results == ["rows"]
+
+    worker.submit("k", lambda: 1 / 0, results.append)
+    time.sleep(0.05)
+    assert worker.drain() == 0 and results == ["rows"]
+    worker.shutdown()
+
+
+def test_run_job_without_worker_runs_inline():
+    results = []
+    run_job(types.SimpleNamespace(), "k", lambda: 5, results.append)
+    assert results == [5]
+
+
+def test_failing_callback_does_not_stop_the_pump():
+    worker = BackgroundWorker()
+    results = []
+    done = threading.Event()
+
+    def boom(result):
+        raise RuntimeError("window closed")
+
+    worker.submit("a", lambda: 1, boom)
+    worker.submit("b", lambda: (done.set(), 2)[1], results.append)
+    done.wait(5)
+    time.sleep(0.05)
+    assert worker.drain() == 1 and results == [2]
+    worker.shutdown()
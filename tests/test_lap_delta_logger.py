@@ -5,6 +5,8 @@ import types
 import time
 from pathlib import Path
 
+import pytest
+
 
 def test_lap_delta_logger(tmp_path, monkeypatch):
     """Ensure lap_delta_logger creates a CSV with lap deltas."""
@@ -87,3 +89,77 @@ def test_lap_delta_logger(tmp_path, monkeypatch):
     assert rows[3][2:] == ["2", "0.0"]
     assert rows[4][2:] == ["2", "6"]
 
+
+def test_crossing_time_is_interpolated(tmp_path, snap):
+    import lap_delta_logger
+
+    csv_path = tmp_path / "lap_delta_log.csv"
+    logger = lap_delta_logger.LapDeltaLogger(str(csv_path), ring_size=4)
+
+    def feed(t, laps, pct):
+        logger.feed(
+            snap(
+                t,
+                {
+                    "SessionTime": float(t),
+                    "SessionNum": 0,
+                    "CarIdxLap": laps,
+                    "CarIdxLapDistPct": pct,
+                    "CarIdxPosition": [1, 2],
+                },
+            )
+        )
+
+    feed(0, [1, 1], [0.9, 0.8])
+    feed(1, [2, 1], [0.1, 0.9])
+    feed(2, [2, 2], [0.2, 0.05])
+    rows = list(csv.reader(open(csv_path)))
+    assert rows[3][1:] == ["0", "2", "0.0"]
+    # leader crossed at 0.5 s, car 1 two thirds into the next tick
+    assert rows[4][1:] == ["1", "2", "1.167"]
+    assert logger.leader_time(2) == pytest.approx(0.5)
+
+    for lap in range(3, 8):
+        feed(lap, [lap, 2], [0.5, 0.5])
+    assert logger.leader_time(7) == 6.5
+    assert logger.leader_time(2) is None
+
+
+def test_interval_table_gaps(tmp_path, snap):
+    import lap_delta_logger
+
+    intervals = tmp_path / "intervals.csv"
+    logger = lap_delta_logger.LapDeltaLogger(
+        str(tmp_path / "lap_delta_log.csv"), intervals_path=str(intervals)
+    )
+    drivers = [
+        {"CarIdx": 0, "TeamName": "TeamA", "CarClassID": 1},
+        {"CarIdx": 1, "TeamName": "TeamB", "CarClassID": 2},
+        {"CarIdx": 2, "TeamName": "TeamC", "CarClassID": 1},
+    ]
+    for t, laps in ((10.0, [1, 0, 0]), (11.5, [1, 1, 0]), (13.0, [1, 1, 1])):
+        logger.feed(
+            snap(
+                t,
+                {
+                    "SessionTime": t,
+                    "SessionNum": 0,
+                    "CarIdxLap": laps,
+                    "CarIdxPosition": [1, 2, 3],
+                    "CarIdxClassPosition": [1, 1, 2],
+                },
+                drivers,
+            )
+        )
+
+    table = logger.table
+    assert table.gap(2, 0) == pytest.approx(3.0)
+    assert table.gap(0, 1) == pytest.approx(-1.5)
+    assert table.ahead(2) == 1 and table.class_ahead(2) == 0
+
+    rows = list(csv.reader(open(intervals)))
+    assert rows[0] == lap_delta_logger.INTERVALS_HEADER
+    assert rows[1] == ["1", "0", "TeamA", "1", "1", "1", "0.0", "", "0.0", ""]
+    assert rows[2] == ["2", "1", "TeamB", "2", "1", "1", "1.5", "1.5", "0.0", ""]
+    assert rows[3] == ["3", "2", "TeamC", "1", "2", "1", "3.0", "1.5", "3.0", "3.0"]
+    assert not (tmp_path / "intervals.csv.tmp").exists()
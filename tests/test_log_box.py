@@ -0,0 +1,89 @@
+import re
+import sys
+import types
+from pathlib import Path
+from queue import Queue
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+import race_gui
+from race_gui import RaceLoggerGUI
+
+
+class FakeText:
+    def __init__(self):
+        self.lines = [""]
+        self.calls = []
+
+    def configure(self, **kw):
+        self.calls.append(("configure", kw.get("state")))
+
+    def insert(self, index, *args):
+        self.calls.append(("insert", args))
+        text = "".join(args[::2])
+        parts = text.split("\n")
+        self.lines[-1] += parts[0]
+        self.lines.extend(parts[1:])
+
+    def index(self, index):
+        return f"{len(self.lines)}.0"
+
+    def delete(self, start, end):
+        self.calls.append(("delete", start, end))
+        del self.lines[: int(end.split(".")[0]) - 1]
+
+    def see(self, index):
+        self.calls.append(("see", index))
+
+
+def make_gui(lines, max_lines=5):
+    gui = types.SimpleNamespace(
+        log_queue=Queue(),
+        log_box=FakeText(),
+        log_max_lines=max_lines,
+        auto_scroll=types.SimpleNamespace(get=lambda: True),
+        _ansi_re=re.compile(r"\x1b\[([0-9;]+)m"),
+        _current_tags=[],
+        events=[],
+        after=[],
+    )
+    gui._apply_ansi_codes = lambda codes: RaceLoggerGUI._apply_ansi_codes(gui, codes)
+    gui.ansi_spans = lambda text, spans: RaceLoggerGUI.ansi_spans(gui, text, spans)
+    gui.parse_event = gui.events.append
+    gui.update_log_box = None
+    gui.root = types.SimpleNamespace(after=lambda ms, func: gui.after.append(ms))
+    for line in lines:
+        gui.log_queue.put(line)
+    return gui
+
+
+def test_batch_is_inserted_once_and_trimmed():
+    lines = [f"line {i}\n" for i in range(8)]
+    lines[5] = "\x1b[31mTraceback\x1b[0m\n"
+    gui = make_gui(lines)
+    RaceLoggerGUI.update_log_box(gui)
+
+    box = gui.log_box
+    inserts = [c for c in box.calls if c[0] == "insert"]
+    assert len(inserts) == 1
+    assert inserts[0][1] == (
+        "line 0\nline 1\nline 2\nline 3\nline 4\n", (),
+        "Traceback", ("fg-red",),
+        "\nline 6\nline 7\n", (),
+    )
+    assert box.lines == ["line 4", "Traceback", "line 6", "line 7", ""]
+    assert [c[0] for c in box.calls] == ["configure", "insert", "delete", "see", "configure"]
+    assert gui.events == lines and gui.after == [100]
+
+    box.calls.clear()
+    RaceLoggerGUI.update_log_box(gui)
+    assert box.calls == [] and gui.after == [100, 100]
+
+
+def test_backlog_yields_after_the_frame_budget(monkeypatch):
+    gui = make_gui([f"{i}\n" for i in range(10)], max_lines=0)
+    clock = iter(range(100))
+    monkeypatch.setattr(race_gui.time, "perf_counter", lambda: next(clock) * 0.01)
+    RaceLoggerGUI.update_log_box(gui)
+    assert len(gui.events) == 2 and gui.after == [1]
+    assert gui.log_queue.qsize() == 8
+    assert not any(c[0] == "delete" for c in gui.log_box.calls)
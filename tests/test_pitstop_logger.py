@@ -0,0 +1,147 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+
+@pytest.fixture
+def pitlog(hub):
+    import pitstop_logger_enhanced
+
+    return pitstop_logger_enhanced
+
+
+@pytest.fixture
+def tick(snap):
+    def make(t, onpit, laps, session=0):
+        return snap(
+            t,
+            {
+                "SessionNum": session,
+                "SessionTime": float(t),
+                "CarIdxOnPitRoad": onpit,
+                "CarIdxLap": laps,
+                "CarIdxBestLapTime": [60.0, 65.0],
+            },
+        )
+
+    return make
+
+
+def test_overlay_is_rendered_from_memory(tmp_path, pitlog, tick):
+    overlay = tmp_path / "overlay.html"
+    logger = pitlog.PitStopLogger(
+        str(tmp_path / "pit.csv"), str(tmp_path / "totals.csv"), overlay_file=str(overlay)
+    )
+
+    logger.feed(tick(0, [False, False], [1, 1]))
+    logger.feed(tick(100, [True, False], [3, 2]))
+    # the pit log is not read back when rendering the overlay
+    (tmp_path / "pit.csv").unlink()
+    logger.feed(tick(130, [False, True], [3, 3]))
+    logger.close()
+
+    html = overlay.read_text(encoding="utf-8")
+    assert "Team &lt;A&gt;" in html
+    assert html.index("TeamB") < html.index("Team &lt;A&gt;")
+    assert "0:02:10" in html and "1:40" in html
+    assert not (tmp_path / "overlay.html.tmp").exists()
+
+
+def test_write_overlay_keeps_latest_stint_per_car(tmp_path, pitlog, tick):
+    csv_path = tmp_path / "pit.csv"
+    logger = pitlog.PitStopLogger(
+        str(csv_path), str(tmp_path / "totals.csv"), overlay_file=str(tmp_path / "o.html")
+    )
+    logger.feed(tick(0, [False, False], [1, 1]))
+    logger.feed(tick(50, [True, False], [2, 1]))
+    logger.feed(tick(60, [False, False], [2, 1]))
+    logger.feed(tick(200, [True, False], [5, 1]))
+    logger.close()
+
+    out = tmp_path / "from_csv.html"
+    pitlog.write_overlay(str(csv_path), str(out))
+    html = out.read_text(encoding="utf-8")
+    assert html.count("<tr><td") == 1
+    assert "0:03:20" in html
+
+    # a restarted logger picks up the previous stints for its overlay
+    again = pitlog.PitStopLogger(str(csv_path), str(tmp_path / "totals.csv"))
+    assert again.overlay.latest[0][9] == "5"
+
+
+def test_driver_totals_only_write_changed_rows(tmp_path, monkeypatch, pitlog, tick):
+    import eec_db
+
+    upserts = []
+    real = eec_db.upsert_driver_totals
+    monkeypatch.setattr(eec_db, "upsert_driver_totals", lambda c, rows: (upserts.append(rows), real(c, rows)))
+    totals = tmp_path / "totals.csv"
+    db = tmp_path / "eec.db"
+    logger = pitlog.PitStopLogger(
+        str(tmp_path / "pit.csv"), str(totals), str(db), overlay_file=str(tmp_path / "o.html")
+    )
+    logger.feed(tick(0, [False, False], [1, 1]))
+    logger.feed(tick(100, [True, False], [3, 2]))
+    logger.feed(tick(130, [False, True], [3, 3]))
+    logger.csv.totals_csv.wait()
+    assert "DriverA" in totals.read_text() and "DriverB" in totals.read_text()
+    logger.write_totals(logger.driver_total)
+    # stint end of A, running total of B after 60 s, stint end of B; nothing new afterwards
+    assert [[r[1] for r in rows] for rows in upserts] == [["DriverA"], ["DriverB"], ["DriverB"]]
+    logger.stint.clear()
+    logger.close()
+
+    lines = totals.read_text().splitlines()
+    assert lines[0].startswith("TeamName,DriverName")
+    assert [ln.split(",")[1] for ln in lines[1:]] == ["DriverA", "DriverB"]
+    conn = eec_db.connect(db)
+    assert conn.execute("SELECT driver, total_time FROM driver_totals ORDER BY driver").fetchall() == [
+        ("DriverA", 100.0),
+        ("DriverB", 130.0),
+    ]
+    conn.close()
+
+
+class RecordingSink:
+    def __init__(self):
+        self.events = []
+
+    def stint_end(self, row):
+        self.events.append(("stint_end", row[0], row[-1]))
+
+    def totals(self, totals):
+        self.events.append(("totals", {k[1]: v["time"] for k, v in totals.items()}))
+
+    def rollover(self):
+        self.events.append(("rollover",))
+
+    def close(self):
+        self.events.append(("close",))
+
+
+def test_stint_tracker_uses_snapshot_time(tmp_path, monkeypatch, pitlog, tick):
+    monkeypatch.chdir(tmp_path)
+    sink = RecordingSink()
+    tracker = pitlog.StintTracker([sink])
+
+    tracker.feed(tick(0, [False, False], [1, 1]))
+    tracker.feed(tick(30, [True, False], [2, 1]))
+    tracker.feed(tick(45, [False, False], [2, 1]))
+    # 60 s of telemetry later the running stints are reported
+    tracker.feed(tick(60, [False, False], [3, 2]))
+    tracker.feed(tick(70, [False, False], [3, 2], session=1))
+    tracker.feed(tick(100, [False, False], [3, 2], session=1))
+    tracker.close()
+
+    assert sink.events == [
+        ("stint_end", 0, 1),
+        ("totals", {"DriverA": 30.0}),
+        ("totals", {"DriverA": 45.0, "DriverB": 60.0}),
+        ("rollover",),
+        ("totals", {"DriverA": 30.0, "DriverB": 30.0}),
+        ("close",),
+    ]
+    assert not list(tmp_path.iterdir())
@@ -1,5 +1,6 @@
 import csv
 import sys
+import types
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
@@ -47,3 +48,76 @@ def test_sort_and_write(tmp_path, monkeypatch):
     assert out_rows[0]["Avg Lap"] == "61.5"
     assert out_rows[1]["Team"] == "TeamB"
     assert out_rows[1]["Class"] == "Hypercar"
+
+
+def test_tail_reads_only_appended_rows_and_handles_rollover(tmp_path):
+    inp = tmp_path / "standings_log.csv"
+    out = tmp_path / "sorted_standings.csv"
+    header = "Time,CarIdx,TeamName,UserName,CarClassID,Position,ClassPosition,Lap,BestLapTime,LastLapTime,OnPitRoad,PitCount\n"
+    inp.write_text(
+        header
+        + "2021-01-01T00:00:00,0,TeamA,DriverA,2708,1,1,10,60,61,False,1\n"
+        + "2021-01-01T00:00:05,1,TeamB,DriverB,4074,2,1,10,55,56,False,0\n"
+    )
+
+    tail = standings_sorter.StandingsTail(str(inp))
+    assert tail.update() == 2
+    assert tail.update() == 0
+
+    with open(inp, "a") as f:
+        f.write("2021-01-01T00:00:10,0,TeamA,DriverA,2708,1,1,11,60,62,False,1\n")
+        f.write("2021-01-01T00:00:15,1,TeamB,Dri")  # partial row
+    assert tail.update() == 1
+    with open(inp, "a") as f:
+        f.write("verB,4074,2,1,11,55,57,True,1\n")
+    assert tail.update() == 1
+
+    tail.sort_and_write(str(out))
+    with open(out, newline="") as f:
+        out_rows = list(csv.DictReader(f))
+    assert [r["Team"] for r in out_rows] == ["TeamA", "TeamB"]
+    assert out_rows[0]["Avg Lap"] == "61.5"
+    assert out_rows[1]["Avg Lap"] == "56.5"
+    assert out_rows[1]["In Pit"] == "True"
+
+    # rollover_log moves the file away and starts a fresh one
+    inp.rename(tmp_path / "archived.csv")
+    inp.write_text(header + "2021-01-01T01:00:00,2,TeamC,DriverC,2708,1,1,1,70,71,False,0\n")
+    assert tail.update() == 1
+    assert list(tail.latest) == ["2"]
+
+    # truncation in place (e.g. "Reset Logs") also starts over
+    inp.write_text(header)
+    assert tail.update() == 0
+    assert tail.latest == {}
+
+
+def test_run_sorts_on_file_change(tmp_path, monkeypatch):
+    inp = tmp_path / "standings_log.csv"
+    out = tmp_path / "sorted_standings.csv"
+    header = "Time,CarIdx,TeamName,UserName,CarClassID,Position,ClassPosition,Lap,BestLapTime,LastLapTime,OnPitRoad,PitCount\n"
+    inp.write_text(header)
+    calls = {}
+
+    def fake_watch(*paths, watch_filter=None, debounce=None, step=None, recursive=True):
+        calls["paths"] = paths
+        calls["recursive"] = recursive
+        calls["debounce"] = debounce
+        assert watch_filter(1, str(inp))
+        assert not watch_filter(1, str(out))
+        with open(inp, "a") as f:
+            f.write("2021-01-01T00:00:00,0,TeamA,DriverA,2708,1,1,10,60,61,False,1\n")
+        yield {(1, str(inp))}
+        writes = out.stat().st_mtime_ns
+        yield {(1, str(inp))}  # nothing new → no rewrite
+        calls["rewritten"] = out.stat().st_mtime_ns != writes
+
+    monkeypatch.setitem(sys.modules, "watchfiles", types.SimpleNamespace(watch=fake_watch))
+    standings_sorter.run(str(inp), str(out))
+
+    assert calls["paths"] == (tmp_path.resolve(),)
+    assert calls["debounce"] == standings_sorter.DEBOUNCE_MS
+    assert calls["recursive"] is False
+    assert calls["rewritten"] is False
+    with open(out, newline="") as f:
+        assert [r["Team"] for r in csv.DictReader(f)] == ["TeamA"]
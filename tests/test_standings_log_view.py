@@ -0,0 +1,140 @@
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+import race_gui
+from race_gui import StandingsLogIndex, VirtualTable, resolve_time
+
+FIELDS = ["Time", "CarIdx", "TeamName", "UserName", "CarClassID", "Position", "Lap"]
+
+
+def row(t, car, cls, pos, lap=3):
+    return dict(zip(FIELDS, [t, str(car), f"Team{car}", f"D{car}", cls, str(pos), str(lap)]))
+
+
+def test_index_sorts_ticks_and_holds_back_the_newest():
+    source = [
+        row("2025-06-07T23:59:58", 0, "GT4", 3),
+        row("2025-06-07T23:59:58", 1, "GT3", 2),
+        row("2025-06-07T23:59:58", 2, "GT3", 1),
+        row("2025-06-07T23:59:58", 9, "GT3", 4, lap=0),      # not racing yet
+        row("2025-06-08T00:00:01", 0, "GT4", 3),
+    ]
+    index = StandingsLogIndex(FIELDS)
+    assert index.ingest(source) == 3
+    assert [r["CarIdx"] for r in index.rows] == ["2", "1", "0"]
+    # the cached rows themselves are indexed, not copies
+    assert index.rows[0] is source[2]
+    assert index.values(0) == ["2025-06-07T23:59:58", "2", "Team2", "D2", "GT3", "1", "3"]
+    assert index.pending and index.class_order() == {"GT3": 1, "GT4": 2}
+
+    source += [row("2025-06-08T00:00:01", 2, "GT3", 1)]
+    assert index.matches(FIELDS, source)
+    assert index.ingest(source) == 0                        # same tick, still open
+    assert index.ingest(source) == 2                        # no new rows: flushed
+    assert [r["CarIdx"] for r in index.rows[3:]] == ["2", "0"]
+
+    assert list(index.view("0", index.count)) == [2, 4]
+    assert list(index.view("0", 3)) == [2]
+    assert index.find_time(range(index.count), "2025-06-08T00:00:00") == 3
+    assert index.labels["0"] == "0 – Team0"
+
+    assert not index.matches(FIELDS, source[:2])
+    assert not index.matches(FIELDS, [dict(r) for r in source])
+
+
+def test_resolve_time_rolls_over_midnight():
+    first = "2025-06-07T12:00:00"
+    assert resolve_time("14:30", first) == "2025-06-07T14:30:00"
+    assert resolve_time("01:15:20", first) == "2025-06-08T01:15:20"
+    assert resolve_time("2025-06-07 13:00", first) == "2025-06-07T13:00"
+    assert resolve_time("soon", first) == "soon"
+
+
+class FakeWidget:
+    def __init__(self, *a, **k):
+        self.set_calls = []
+        self.items = {}
+        self.order = []
+
+    def bind(self, *a):
+        pass
+
+    def set(self, first, last):
+        self.set_calls.append((first, last))
+
+    def get_children(self):
+        return tuple(self.order)
+
+    def insert(self, parent, index, iid, values, tags):
+        self.items[iid] = values
+        self.order.append(iid)
+
+    def item(self, iid, values, tags):
+        self.items[iid] = values
+
+    def delete(self, *iids):
+        for iid in iids:
+            del self.items[iid]
+            self.order.remove(iid)
+
+    def move(self, iid, parent, index):
+        self.order.remove(iid)
+        self.order.insert(index, iid)
+
+
+def test_virtual_table_materializes_only_visible_rows(monkeypatch):
+    monkeypatch.setattr(race_gui.ttk, "Treeview", FakeWidget)
+    monkeypatch.setattr(race_gui.ttk, "Scrollbar", FakeWidget)
+    data = [[str(i)] for i in range(100_000)]
+    fetched = []
+
+    def fetch(start, stop):
+        fetched.append((start, stop))
+        return [(i, data[i], ()) for i in range(start, stop)]
+
+    table = VirtualTable(None, height=10)
+    table.set_source(len(data), fetch)
+    # follows the end of the log
+    assert table.tree.order == [str(i) for i in range(99_990, 100_000)]
+
+    table.yview("moveto", "0.5")
+    assert table.tree.order[0] == "50000" and len(table.tree.items) == 10
+    assert not table.follow
+    table.yview("scroll", "1", "pages")
+    assert table.tree.order[0] == "50010"
+    table.yview("scroll", "-3", "units")
+    assert table.tree.order[0] == "50007"
+    assert table.vsb.set_calls[-1] == (0.50007, 0.50017)
+
+    # new rows do not move a view that is not at the end
+    data.extend([["x"]] * 5)
+    table.set_source(len(data), fetch)
+    assert table.tree.order[0] == "50007"
+    table.scroll_to(10**9)
+    assert table.follow and table.tree.order[-1] == "100004"
+    assert all(stop - start <= 10 for start, stop in fetched)
+
+
+def test_visible_rows_follow_the_theme_row_height(monkeypatch):
+    monkeypatch.setattr(race_gui.ttk, "Treeview", FakeWidget)
+    monkeypatch.setattr(race_gui.ttk, "Scrollbar", FakeWidget)
+    height = ["28"]
+
+    class FakeStyle:
+        def __init__(self, master=None):
+            pass
+
+        def lookup(self, style, option):
+            assert (style, option) == ("Treeview", "rowheight")
+            return height[0]
+
+    monkeypatch.setattr(race_gui.ttk, "Style", FakeStyle)
+    table = VirtualTable(None, height=10)
+    table.set_source(100, lambda start, stop: [(i, [str(i)], ()) for i in range(start, stop)])
+    table._on_resize(type("Event", (), {"height": 28 * 11})())
+    assert table.height == 10 and table.tree.order[-1] == "99"
+
+    height[0] = ""
+    table._on_resize(type("Event", (), {"height": 20 * 11})())
+    assert table.height == 10
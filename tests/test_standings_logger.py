@@ -0,0 +1,134 @@
+import argparse
+import csv
+import sqlite3
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+@pytest.fixture
+def logger_mod(hub):
+    import ai_standings_logger
+
+    return ai_standings_logger
+
+
+@pytest.fixture
+def tick(snap):
+    # car 1 is missing from the telemetry arrays
+    def make(t, on_pit, session=0):
+        return snap(
+            t,
+            {
+                "SessionNum": session,
+                "CarIdxLap": [5],
+                "CarIdxPosition": [1],
+                "CarIdxClassPosition": [1],
+                "CarIdxBestLapTime": [60.0],
+                "CarIdxLastLapTime": [61.0],
+                "CarIdxOnPitRoad": [on_pit],
+            },
+        )
+
+    return make
+
+
+def read(path):
+    with open(path, newline="") as f:
+        return list(csv.reader(f))
+
+
+def test_keeps_file_open_and_survives_rollover(tmp_path, monkeypatch, logger_mod, tick):
+    monkeypatch.chdir(tmp_path)
+    db = tmp_path / "eec.db"
+    logger = logger_mod.StandingsLogger("standings_log.csv", str(db))
+    logger.feed(tick(0, False))
+    logger.feed(tick(5, True))
+
+    rows = read("standings_log.csv")
+    assert rows[0] == logger_mod.HEADER
+    # car 3 is missing from the telemetry arrays
+    assert rows[2] == ["2025-06-07T12:00:00", "1", "TeamB", "DriverB", "4074", "", "", "", "", "", "", "0"]
+    assert rows[3][-2:] == ["True", "1"]
+
+    logger.feed(tick(10, False, session=1))
+    logger.close()
+    assert len(read("standings_log.csv")) == 3
+    archived = list((tmp_path / "RaceLogs").glob("standings_log_*.csv"))
+    assert len(archived) == 1 and len(read(archived[0])) == 5
+
+    conn = sqlite3.connect(db)
+    assert conn.execute("SELECT on_pit, pit_count FROM standings WHERE car_idx = 0").fetchall() == [
+        (0, 0), (1, 1), (0, 0),
+    ]
+    conn.close()
+
+
+def test_flush_interval_batches_writes(tmp_path, monkeypatch, logger_mod, tick):
+    clock = [0.0]
+    monkeypatch.setattr(time, "monotonic", lambda: clock[0])
+    path = tmp_path / "standings_log.csv"
+    logger = logger_mod.StandingsLogger(str(path), flush_interval=10)
+
+    logger.feed(tick(0, False))
+    clock[0] = 5
+    logger.feed(tick(5, False))
+    assert len(read(path)) == 1
+    clock[0] = 10
+    logger.feed(tick(10, False))
+    assert len(read(path)) == 7
+    clock[0] = 11
+    logger.feed(tick(11, False))
+    logger.close()
+    assert len(read(path)) == 9
+
+
+def test_changes_only_skips_unchanged_cars(tmp_path, logger_mod, tick):
+    path = tmp_path / "standings_log.csv"
+    logger = logger_mod.StandingsLogger(str(path), changes_only=True, timespec="milliseconds")
+    logger.feed(tick(0, False))
+    logger.feed(tick(0.25, False))
+    logger.feed(tick(0.5, True))
+    logger.close()
+
+    rows = read(path)[1:]
+    assert [(r[0], r[1]) for r in rows] == [
+        ("2025-06-07T12:00:00.000", "0"),
+        ("2025-06-07T12:00:00.000", "1"),
+        ("2025-06-07T12:00:00.500", "0"),
+    ]
+    assert rows[-1][-2:] == ["True", "1"]
+
+
+def test_interval_arg_accepts_down_to_60hz(logger_mod):
+    assert logger_mod.interval_arg("0.5") == 0.5
+    assert logger_mod.interval_arg(str(1 / 60)) == pytest.approx(1 / 60)
+    assert logger_mod.time_spec(0.5) == "milliseconds"
+    assert logger_mod.time_spec(5) == "seconds"
+    with pytest.raises(argparse.ArgumentTypeError):
+        logger_mod.interval_arg("0.001")
+
+
+def test_progress_is_printed_every_few_seconds(tmp_path, capsys, logger_mod, tick):
+    logger = logger_mod.StandingsLogger(str(tmp_path / "standings_log.csv"), changes_only=True)
+    for i in range(8):
+        logger.feed(tick(i, i == 6))
+    logger.close()
+    assert capsys.readouterr().out.splitlines() == [
+        "[2025-06-07T12:00:00] Logged 2 changed rows, 2 cars.",
+        "[2025-06-07T12:00:05] Logged 0 changed rows, 2 cars.",
+    ]
+
+
+def test_database_failure_does_not_stop_other_outputs(tmp_path, capsys, logger_mod, tick):
+    path = tmp_path / "standings_log.csv"
+    logger = logger_mod.StandingsLogger(str(path), str(tmp_path / "eec.db"))
+    logger.db.conn.close()          # every write now fails
+    logger.feed(tick(0, False))
+    logger.feed(tick(5, True))
+    assert len(read(path)) == 5
+    assert "Logged 2 cars." in capsys.readouterr().out
+    logger.close()
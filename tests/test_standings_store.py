@@ -0,0 +1,103 @@
+import sys
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+np = pytest.importorskip("numpy")
+import standings_store
+
+
+def test_write_and_memmap_roundtrip(tmp_path):
+    path = tmp_path / "standings_log.bin"
+    writer = standings_store.StandingsWriter(path)
+    ts = datetime(2025, 6, 7, 12, 0, 5)
+    writer.append(ts, [
+        (0, "TeamA", "DriverA", 2708, 1, 1, 10, 60.123, 61.5, False, 1),
+        (1, "TeamB", "DriverB", 4074, 2, 1, 9, 55.0, "", True, 0),
+    ])
+    writer.append(ts.replace(second=10), [
+        (0, "TeamA", "DriverA", 2708, 1, 1, 11, 60.123, 62.0, False, 1),
+    ])
+    writer.close()
+
+    recs = standings_store.load(path)
+    assert isinstance(recs, np.memmap)
+    assert len(recs) == 3
+    assert list(recs["lap"]) == [10, 9, 11]
+    assert np.isnan(recs["last_lap"][1])
+    assert recs["on_pit"][1] == 1
+
+    df = standings_store.to_dataframe(path)
+    assert list(df["TeamName"]) == ["TeamA", "TeamB", "TeamA"]
+    assert df["Time"].iloc[0] == ts
+    assert df["BestLapTime"].iloc[0] == pytest.approx(60.123, abs=1e-4)
+
+    # resume appending: names keep their ids and a torn record is ignored
+    writer = standings_store.StandingsWriter(path)
+    writer.append(ts, [(2, "TeamC", "DriverC", 2708, 3, 2, 1, 70.0, 71.0, False, 0)])
+    writer.close()
+    with open(path, "ab") as f:
+        f.write(b"\x00" * 5)
+    df = standings_store.to_dataframe(path)
+    assert list(df["UserName"]) == ["DriverA", "DriverB", "DriverA", "DriverC"]
+
+
+def test_rollover_archives_store_with_names(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    writer = standings_store.StandingsWriter("standings_log.bin")
+    writer.append(datetime(2025, 6, 7), [(0, "TeamA", "DriverA", 1, 1, 1, 1, 1.0, 1.0, False, 0)])
+    writer.rollover()
+    writer.append(datetime(2025, 6, 8), [(5, "TeamZ", "DriverZ", 1, 1, 1, 1, 1.0, 1.0, False, 0)])
+    writer.close()
+
+    archived = list((tmp_path / "RaceLogs").glob("standings_log_*.bin"))
+    assert len(archived) == 1
+    assert list(standings_store.to_dataframe(archived[0])["TeamName"]) == ["TeamA"]
+    assert list(standings_store.to_dataframe("standings_log.bin")["TeamName"]) == ["TeamZ"]
+
+
+def test_load_rejects_foreign_file(tmp_path):
+    path = tmp_path / "other.bin"
+    path.write_bytes(b"not a store" * 10)
+    with pytest.raises(ValueError):
+        standings_store.load(path)
+
+
+def test_standings_logger_writes_binary_store(tmp_path, snap, drivers):
+    import ai_standings_logger
+
+    csv_path = tmp_path / "standings_log.csv"
+    bin_path = tmp_path / "standings_log.bin"
+    logger = ai_standings_logger.StandingsLogger(str(csv_path), binary_path=str(bin_path))
+    tick = snap(
+        0,
+        {
+            "SessionNum": 0,
+            "CarIdxLap": [3],
+            "CarIdxPosition": [1],
+            "CarIdxClassPosition": [1],
+            "CarIdxBestLapTime": [60.0],
+            "CarIdxLastLapTime": [61.0],
+            "CarIdxOnPitRoad": [True],
+        },
+        drivers[:1],
+    )
+    logger.feed(tick)
+    logger.close()
+
+    df = standings_store.to_dataframe(bin_path)
+    assert len(df) == 1
+    assert df["PitCount"].iloc[0] == 1
+    assert bool(df["OnPitRoad"].iloc[0]) is True
+
+    # a restart starts both stores fresh, so they agree on the session
+    logger = ai_standings_logger.StandingsLogger(str(csv_path), binary_path=str(bin_path))
+    logger.feed(tick)
+    logger.close()
+    assert len(standings_store.to_dataframe(bin_path)) == 1
+    with open(csv_path) as f:
+        assert len(f.readlines()) == 2
+    with open(standings_store.names_path(bin_path)) as f:
+        assert len(f.readlines()) == 2
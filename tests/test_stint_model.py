@@ -0,0 +1,63 @@
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+import race_gui
+from race_gui import CsvCache, StintModel
+
+PIT = "CarIdx,Stint Start Timestamp,Stint End Timestamp,Stint End Lap,Stint Duration (sec)\n"
+STAND = "Time,CarIdx,TeamName,UserName,CarClassID,Lap\n"
+
+
+def setup(tmp_path, monkeypatch):
+    monkeypatch.setattr(race_gui, "CSV_CACHE", CsvCache())
+    monkeypatch.setattr(race_gui, "find_log_file", lambda name: tmp_path / name)
+    (tmp_path / "pitstop_log.csv").write_text(PIT)
+    (tmp_path / "standings_log.csv").write_text(
+        STAND + "2025-06-07T12:00:05,1,T1,A,4074,1\n2025-06-07T12:00:05,2,T2,B,4074,1\n"
+    )
+
+
+def append(path, text):
+    with path.open("a") as f:
+        f.write(text)
+
+
+def test_only_new_rows_are_ingested(tmp_path, monkeypatch):
+    setup(tmp_path, monkeypatch)
+    model = StintModel()
+    model.update()
+    assert model.first_dt == datetime(2025, 6, 7, 12, 0, 5)
+    assert [r[0] for r in model.rows()] == ["1", "2"]
+
+    seen = []
+    real = model.ingest_standings
+    monkeypatch.setattr(model, "ingest_standings", lambda rows: (seen.append(len(rows)), real(rows)))
+    append(tmp_path / "standings_log.csv", "2025-06-07T12:10:00,1,T1,A,4074,6\n")
+    append(
+        tmp_path / "pitstop_log.csv",
+        "1,2025-06-07T12:00:00,2025-06-07T12:05:00,4,300\n"
+        "2,2025-06-07T12:00:00,bad,3,100\n",
+    )
+    model.update()
+    model.update()
+    assert seen == [1, 0]
+    assert model.pit_start == datetime(2025, 6, 7, 12)
+    assert model.dur_sum == {"1": 300.0, "2": 100.0}
+
+    end = datetime.now() + timedelta(hours=1)
+    rows = {r[0]: r for r in model.rows(end)}
+    assert rows["1"][4] == 2            # lap 6, pitted on lap 4
+    assert rows["1"][6] == "0:00"       # 300 s average stint long over
+    assert rows["2"][4] == 0
+
+
+def test_replaced_log_is_ingested_again(tmp_path, monkeypatch):
+    setup(tmp_path, monkeypatch)
+    model = StintModel()
+    model.update()
+    (tmp_path / "standings_log.csv").write_text(STAND + "2025-06-08T09:00:00,7,T7,C,4074,2\n")
+    model.update()
+    assert list(model.latest) == ["7"]
+    assert model.first_dt == datetime(2025, 6, 8, 9)
@@ -0,0 +1,207 @@
+import gzip
+import json
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+import race_data_runner
+from race_gui import format_runner_status
+
+
+class FakeProc:
+    pid = 1234
+
+    def __init__(self):
+        self.returncode = None
+
+    def poll(self):
+        return self.returncode
+
+    def send_signal(self, sig):
+        self.returncode = -sig
+
+    def wait(self, timeout=None):
+        return self.returncode
+
+
+def make(tmp_path, **kw):
+    clock = [0.0]
+    launched = []
+
+    def launcher(name, cmd, log):
+        proc = FakeProc()
+        log.write(f"{name} started\n")
+        launched.append((name, proc))
+        return proc
+
+    sup = race_data_runner.Supervisor(
+        [("Sorter", ["sorter"])],
+        launcher=launcher,
+        status_path=tmp_path / "runner_status.json",
+        log_dir=tmp_path / "logs",
+        clock=lambda: clock[0],
+        **kw,
+    )
+    return sup, clock, launched
+
+
+def test_crash_loop_backs_off_and_gives_up(tmp_path):
+    sup, clock, launched = make(tmp_path, max_failures=4)
+    sup.start()
+    starts = []
+    for t in range(0, 40):
+        clock[0] = float(t)
+        launched[-1][1].returncode = 1          # dies straight away
+        before = len(launched)
+        sup.poll()
+        if len(launched) > before:
+            starts.append(t)
+
+    # 1 s, 2 s and 4 s between restarts, then no more after 4 failures
+    assert starts == [1, 4, 9]
+    child = sup.children["Sorter"]
+    assert child.state == "failed" and child.restarts == 3
+
+    status = json.loads((tmp_path / "runner_status.json").read_text())["children"]
+    assert status["Sorter"]["state"] == "failed"
+    assert status["Sorter"]["last_exit"] == 1
+    assert format_runner_status(status) == "Sorter: failed, 3 restarts"
+
+
+def test_stable_child_restarts_immediately(tmp_path):
+    sup, clock, launched = make(tmp_path, stable_after=30)
+    sup.start()
+    clock[0] = 5.0
+    launched[-1][1].returncode = 1
+    sup.poll()
+    assert sup.children["Sorter"].state == "backoff"
+    assert sup.status()["Sorter"]["next_restart_in"] == 1.0
+
+    clock[0] = 6.0
+    sup.poll()
+    # ran long enough to be considered healthy again
+    clock[0] = 40.0
+    sup.poll()
+    assert sup.children["Sorter"].failures == 0
+    launched[-1][1].returncode = 0
+    sup.poll()
+    assert len(launched) == 3 and sup.children["Sorter"].state == "running"
+
+    sup.stop()
+    assert launched[-1][1].returncode is not None
+    status = json.loads((tmp_path / "runner_status.json").read_text())["children"]
+    assert status["Sorter"] == {
+        "state": "stopped", "pid": None, "restarts": 2, "failures": 0,
+        "last_exit": 0, "next_restart_in": None, "tail": ["Sorter started"] * 3,
+    }
+    # restarts append to the same log
+    assert (tmp_path / "logs" / "sorter.txt").read_text().count("started") == 3
+
+
+def test_stop_kills_children_that_ignore_sigint(tmp_path):
+    class StubbornProc(FakeProc):
+        def send_signal(self, sig):
+            pass
+
+        def wait(self, timeout=None):
+            if self.returncode is None:
+                raise subprocess.TimeoutExpired("child", timeout)
+            return self.returncode
+
+        def kill(self):
+            self.returncode = -9
+
+    proc = StubbornProc()
+    sup = race_data_runner.Supervisor(
+        [("Sorter", ["sorter"])],
+        launcher=lambda name, cmd, log: proc,
+        status_path=None,
+        log_dir=tmp_path / "logs",
+        stop_timeout=0.01,
+    )
+    sup.start()
+    sup.stop()
+    assert proc.returncode == -9
+    assert sup.children["Sorter"].state == "stopped"
+
+
+def test_child_log_rotates_and_compresses(tmp_path, monkeypatch):
+    stamps = iter(f"2025060{i}-120000" for i in range(1, 10))
+
+    class Clock:
+        @staticmethod
+        def now():
+            return Clock
+
+        @staticmethod
+        def strftime(fmt):
+            return next(stamps)
+
+    monkeypatch.setattr(race_data_runner, "datetime", Clock)
+    log = race_data_runner.ChildLog(
+        tmp_path / "sorter.txt", max_bytes=10, backups=2, tail_lines=3
+    )
+    for i in range(10):
+        log.write(f"line {i:02d} ........\n")
+    log.close()
+
+    segments = sorted(tmp_path.glob("sorter.*.txt.gz"))
+    assert [p.name for p in segments] == [
+        "sorter.20250608-120000.txt.gz",
+        "sorter.20250609-120000.txt.gz",
+    ]
+    assert gzip.open(segments[-1], "rt").read() == "line 08 ........\n"
+    assert (tmp_path / "sorter.txt").read_text() == "line 09 ........\n"
+    assert log.recent() == ["line 07 ........", "line 08 ........", "line 09 ........"]
+    assert log.recent(1) == ["line 09 ........"]
+
+
+def test_rotations_in_the_same_second_keep_every_segment(tmp_path, monkeypatch):
+    class Clock:
+        @staticmethod
+        def now():
+            return Clock
+
+        @staticmethod
+        def strftime(fmt):
+            return "20250607-120000"
+
+    monkeypatch.setattr(race_data_runner, "datetime", Clock)
+    log = race_data_runner.ChildLog(tmp_path / "sorter.txt", max_bytes=10, backups=2)
+    for i in range(4):
+        log.write(f"line {i:02d} ........\n")
+    log.close()
+
+    segments = sorted(tmp_path.glob("sorter.*.txt.gz"))
+    assert [p.name for p in segments] == [
+        "sorter.20250607-120000_001.txt.gz",
+        "sorter.20250607-120000_002.txt.gz",
+    ]
+    assert gzip.open(segments[-1], "rt").read() == "line 02 ........\n"
+
+
+def test_rotation_age_counts_from_the_file_not_the_open(tmp_path, monkeypatch):
+    path = tmp_path / "sorter.txt"
+    path.write_text("from an earlier run\n")
+    later = time.time() + 7 * 3600
+    monkeypatch.setattr(race_data_runner.time, "time", lambda: later)
+    log = race_data_runner.ChildLog(path, max_age=6 * 3600)
+    log.write("first\n")
+    log.write("second\n")
+    log.close()
+    assert len(list(tmp_path.glob("sorter.*.txt.gz"))) == 1
+    assert path.read_text() == "second\n"
+
+
+def test_launch_captures_output(tmp_path):
+    log = race_data_runner.ChildLog(tmp_path / "child.txt")
+    code = "import os; print('hello'); print(os.environ.get('PYTHONUNBUFFERED'))"
+    proc = race_data_runner.launch("Child", [sys.executable, "-c", code], log)
+    proc.wait()
+    for _ in range(100):
+        if log.lines == 2:
+            break
+        time.sleep(0.01)
+    assert log.recent() == ["hello", "1"]
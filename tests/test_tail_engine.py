@@ -0,0 +1,79 @@
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+import race_data_runner
+
+
+def test_rows_are_dispatched_in_batches(tmp_path):
+    log = tmp_path / "pit.csv"
+    other = tmp_path / "other.csv"
+    log.write_text("A,B\n1,2\n3,")
+    got, seen = [], []
+    engine = race_data_runner.TailEngine()
+    engine.add(log, got.append)
+    engine.add(other, seen.append, header=False)
+
+    assert engine.poll() == 1
+    assert got == [[["1", "2"]]]
+
+    # the partial row is completed; a quoted field may span lines
+    with log.open("a") as f:
+        f.write('4\n5,"x\ny"\n')
+    other.write_text("a,b\n")
+    assert engine.poll() == 3
+    assert got[-1] == [["3", "4"], ["5", "x\ny"]]
+    assert seen == [[["a", "b"]]]
+    assert engine.poll() == 0
+
+
+def test_rollover_and_truncation_restart_from_top(tmp_path):
+    log = tmp_path / "standings.csv"
+    log.write_text("H\nold1\nold2\n")
+    got = []
+    engine = race_data_runner.TailEngine()
+    engine.add(log, got.extend)
+    engine.poll()
+
+    # replaced by a new file, as rollover_log does
+    log.rename(tmp_path / "archived.csv")
+    log.write_text("H\nnew1\n")
+    engine.poll()
+    log.write_text("H\n")
+    engine.poll()
+    with log.open("a") as f:
+        f.write("again\n")
+    engine.poll()
+    assert got == [["old1"], ["old2"], ["new1"], ["again"]]
+
+    log.unlink()
+    assert engine.poll() == 0
+
+
+def test_driver_swaps_are_printed(capsys):
+    race_data_runner.print_driver_swaps([["t3", "7", "TeamA", "A", "B", "3"], ["bad"]])
+    out = capsys.readouterr().out
+    assert out.count("DRIVER SWAP") == 1
+    assert "TeamA  Car   7: A → B (Lap 3)" in out
+
+
+def test_run_watches_file_directories(tmp_path, monkeypatch):
+    log = tmp_path / "pit.csv"
+    log.write_text("H\n")
+    calls = []
+
+    def fake_watch(*dirs, watch_filter, **kw):
+        calls.append(dirs)
+        assert watch_filter("modified", str(log.resolve()))
+        assert not watch_filter("modified", str(tmp_path / "logs.txt"))
+        with log.open("a") as f:
+            f.write("row\n")
+        yield {("modified", str(log))}
+
+    monkeypatch.setattr(race_data_runner, "watch", fake_watch, raising=False)
+    got = []
+    engine = race_data_runner.TailEngine()
+    engine.add(log, got.extend)
+    engine.run()
+    assert calls == [(str(tmp_path.resolve()),)]
+    assert got == [["row"]]
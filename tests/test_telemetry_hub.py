@@ -0,0 +1,128 @@
+import sys
+import time
+import types
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+
+class DummyIR:
+    def __init__(self):
+        self.is_initialized = True
+        self.is_connected = True
+        self.freezes = 0
+        self.reads = 0
+
+    def startup(self):
+        pass
+
+    def shutdown(self):
+        pass
+
+    def freeze_var_buffer_latest(self):
+        self.freezes += 1
+
+    def __getitem__(self, key):
+        self.reads += 1
+        if key == "DriverInfo":
+            return {"Drivers": [{"CarIdx": 0, "TeamName": "TeamA", "UserName": "DriverA"}]}
+        if key == "SessionTime":
+            return float(self.freezes)
+        if key == "SessionNum":
+            return 0
+        return [self.freezes]
+
+
+class Recorder:
+    def __init__(self):
+        self.snaps = []
+        self.closed = False
+
+    def feed(self, snap):
+        self.snaps.append(snap)
+
+    def close(self):
+        self.closed = True
+
+
+def test_hub_fans_out_one_snapshot_per_tick(monkeypatch):
+    monkeypatch.setitem(sys.modules, "irsdk", types.SimpleNamespace(IRSDK=DummyIR))
+    import telemetry_hub
+
+    ir = DummyIR()
+    hub = telemetry_hub.TelemetryHub(ir)
+    a, b = Recorder(), Recorder()
+    hub.add_consumer("A", a, 0)
+    hub.add_consumer("B", b, 0)
+
+    calls = [0]
+
+    def fake_sleep(_):
+        calls[0] += 1
+        if calls[0] >= 3:
+            raise KeyboardInterrupt
+
+    monkeypatch.setattr(time, "sleep", fake_sleep)
+    hub.run()
+
+    assert ir.freezes == 3
+    assert len(a.snaps) == 3
+    assert all(x is y for x, y in zip(a.snaps, b.snaps))
+    assert a.snaps[-1]["SessionTime"] == 3.0
+    assert a.snaps[-1]["DriverInfo"]["Drivers"][0]["TeamName"] == "TeamA"
+    assert a.closed and b.closed
+
+
+def test_hub_respects_consumer_interval(monkeypatch):
+    monkeypatch.setitem(sys.modules, "irsdk", types.SimpleNamespace(IRSDK=DummyIR))
+    import telemetry_hub
+
+    clock = [0.0]
+    monkeypatch.setattr(time, "monotonic", lambda: clock[0])
+
+    ir = DummyIR()
+    hub = telemetry_hub.TelemetryHub(ir)
+    fast, slow = Recorder(), Recorder()
+    hub.add_consumer("fast", fast, 0.5)
+    hub.add_consumer("slow", slow, 5)
+
+    for _ in range(10):
+        hub.tick()
+        clock[0] += 0.5
+
+    assert len(fast.snaps) == 10
+    assert len(slow.snaps) == 1
+    assert ir.freezes == 10
+
+
+def test_consumer_error_does_not_stop_others(monkeypatch, capsys):
+    monkeypatch.setitem(sys.modules, "irsdk", types.SimpleNamespace(IRSDK=DummyIR))
+    import telemetry_hub
+
+    class Broken:
+        def feed(self, snap):
+            raise RuntimeError("boom")
+
+    hub = telemetry_hub.TelemetryHub(DummyIR())
+    ok = Recorder()
+    hub.add_consumer("Broken", Broken(), 0)
+    hub.add_consumer("OK", ok, 0)
+    hub.tick()
+
+    assert len(ok.snaps) == 1
+    assert "[ERR] Broken: boom" in capsys.readouterr().out
+
+
+def test_capture_stores_car_channels_as_arrays(monkeypatch):
+    monkeypatch.setitem(sys.modules, "irsdk", types.SimpleNamespace(IRSDK=DummyIR))
+    import numpy as np
+    import telemetry_hub
+
+    snap = telemetry_hub.capture(DummyIR())
+    assert isinstance(snap["CarIdxOnPitRoad"], np.ndarray)
+    assert isinstance(snap["SessionTime"], float)
+    assert snap.array("CarIdxLap").tolist() == [1]
+
+    empty = telemetry_hub.Snapshot(snap.wall_time, {"CarIdxLap": None})
+    assert empty.array("CarIdxLap", bool).dtype == bool
+    assert len(empty.array("CarIdxPosition")) == 0
@@ -0,0 +1,75 @@
+import gzip
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+import telemetry_replay
+
+
+@pytest.fixture
+def record(snap, drivers):
+    """Record ``ticks`` snapshots; the driver of car 0 changes halfway."""
+    swapped = [dict(drivers[0], UserName="DriverB"), *drivers[1:]]
+
+    def run(path, ticks, step=0.5):
+        rec = telemetry_replay.TelemetryRecorder(path)
+        for i in range(ticks):
+            rec.feed(
+                snap(
+                    i * step,
+                    {"SessionTime": i * step, "SessionNum": 0, "CarIdxLap": [i // 10]},
+                    drivers if i < ticks // 2 else swapped,
+                )
+            )
+        rec.close()
+
+    return run
+
+
+def test_recording_stores_driver_info_on_change(tmp_path, record):
+    path = tmp_path / "race.jsonl.gz"
+    record(path, 10)
+
+    with gzip.open(path, "rt") as f:
+        lines = [json.loads(line) for line in f]
+    assert lines[0]["format"] == "eec-telemetry"
+    assert sum("d" in line for line in lines[1:]) == 2
+
+    frames = list(telemetry_replay.read_frames(path))
+    assert len(frames) == 10
+    assert frames[3][2][0]["UserName"] == "DriverA"
+    assert frames[9][2][0]["UserName"] == "DriverB"
+
+
+class Recorder:
+    def __init__(self):
+        self.snaps = []
+
+    def feed(self, snap):
+        self.snaps.append(snap)
+
+
+def test_fast_replay_drives_hub_on_recorded_time(tmp_path, monkeypatch, hub, snap, record):
+    hub_mod = hub
+    path = tmp_path / "race.jsonl.gz"
+    record(path, 120)                             # 60 s of telemetry
+
+    def no_sleep(_):
+        raise AssertionError("fast replay must not sleep")
+
+    monkeypatch.setattr(hub_mod.time, "sleep", no_sleep)
+    ir = telemetry_replay.ReplayIRSDK(path, speed=0)
+    hub = hub_mod.TelemetryHub(ir, clock=ir.clock, sleep=ir.sleep)
+    fast, slow = Recorder(), Recorder()
+    hub.add_consumer("fast", fast, 0.5)
+    hub.add_consumer("slow", slow, 10)
+    hub.run()
+
+    assert ir.finished
+    assert len(fast.snaps) == 120
+    assert [s["SessionTime"] for s in slow.snaps] == [0.0, 10.0, 20.0, 30.0, 40.0, 50.0]
+    assert slow.snaps[1].wall_time == snap(10, {}).wall_time
+    assert fast.snaps[-1]["DriverInfo"]["Drivers"][0]["UserName"] == "DriverB"
@@ -0,0 +1,75 @@
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from race_gui import binder_for
+
+
+class FakeTree:
+    def __init__(self):
+        self.items = {}
+        self.order = []
+        self.calls = []
+        self.opts = {}
+
+    def __setitem__(self, key, value):
+        self.calls.append(("config", key))
+        self.opts[key] = value
+
+    def get_children(self):
+        return tuple(self.order)
+
+    def insert(self, parent, index, iid, values, tags):
+        self.calls.append(("insert", iid))
+        self.items[iid] = (values, tags)
+        self.order.append(iid)
+
+    def item(self, iid, values, tags):
+        self.calls.append(("item", iid))
+        self.items[iid] = (values, tags)
+
+    def delete(self, *iids):
+        self.calls.append(("delete",) + iids)
+        for iid in iids:
+            del self.items[iid]
+            self.order.remove(iid)
+
+    def move(self, iid, parent, index):
+        self.calls.append(("move", iid))
+        self.order.remove(iid)
+        self.order.insert(index, iid)
+
+
+def test_only_changes_reach_the_tree():
+    tree = FakeTree()
+    binder = binder_for(tree)
+    assert binder_for(tree) is binder
+    assert binder.set_columns(["Car", "Lap"])
+    assert not binder.set_columns(["Car", "Lap"])
+
+    binder.update([(1, ["1", "5"], ()), (2, ["2", "5"], ())])
+    tree.calls.clear()
+    binder.update([(1, ["1", "5"], ()), (2, ["2", "6"], ("pit",)), (3, ["3", "1"], ())])
+    assert tree.calls == [("item", "2"), ("insert", "3")]
+    assert tree.items["2"] == (("2", "6"), ("pit",))
+
+    tree.calls.clear()
+    binder.update([(3, ["3", "1"], ()), (1, ["1", "5"], ())])
+    assert tree.calls == [("delete", "2"), ("move", "3"), ("move", "1")]
+    assert tree.order == ["3", "1"]
+
+
+def test_follows_user_sorting_and_duplicate_keys():
+    tree = FakeTree()
+    binder = binder_for(tree)
+    binder.update([("a", [1], ()), ("b", [2], ()), ("a", [3], ())])
+    assert tree.order == ["a", "b", "a+"]
+
+    # the user sorted the view; a refresh puts the data order back
+    tree.move("a+", "", 0)
+    tree.calls.clear()
+    binder.update([("a", [1], ()), ("b", [2], ()), ("a", [3], ())])
+    assert tree.order == ["a", "b", "a+"]
+
+    binder.set_columns(["X"])
+    assert tree.order == [] and tree.opts["columns"] == ["X"]